@@ -2,7 +2,7 @@
 # Python / SQLAlchemy
 # ======================
 from sqlalchemy import asc, desc, func, and_, or_, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, joinedload
 import logging
 import hashlib
 
@@ -236,9 +236,12 @@ class Spec_Queries:
 
         return [r[0] for r in paired_specs]
 
-    def get_statement(
+    def get_statement(self, spec_name, **filters):
+        return self.get_statement_multi([spec_name], **filters)
+
+    def get_statement_multi(
             self,
-            spec_name,
+            spec_names,
             filter_by_csv=None,
             filter_by_pia_serial_number=None,
             filter_by_pia_part_number=None,
@@ -248,15 +251,37 @@ class Spec_Queries:
             include_only_full_tests=False,
             order_key=None,
     ):
+        """
+        Build one statement selecting specs for several names at once.
+
+        Rows can be partitioned afterwards by ``Spec.name``, so related
+        measurements (e.g. the Y and X axes of a relational plot) are
+        fetched in a single round-trip with identical filters.
+        """
+        spec_names = list(dict.fromkeys(spec_names))
         stmt = (
             select(Spec)
             .join(SubTest, SubTest.id == Spec.sub_test_id)
             .join(TestLog, TestLog.id == SubTest.test_log_id)
             .outerjoin(PCBABoard, PCBABoard.id == TestLog.pia_board_id)
             .outerjoin(PMT, PMT.id == TestLog.pmt_id)
-            .where(Spec.name == spec_name)
+            # Fill sub_test -> test_log -> (pia_board, pmt_device) from the
+            # joins above, so reading them per row issues no extra SELECTs
+            .options(
+                contains_eager(Spec.sub_test)
+                .contains_eager(SubTest.test_log)
+                .contains_eager(TestLog.pia_board),
+                contains_eager(Spec.sub_test)
+                .contains_eager(SubTest.test_log)
+                .contains_eager(TestLog.pmt_device),
+            )
         )
 
+        if len(spec_names) == 1:
+            stmt = stmt.where(Spec.name == spec_names[0])
+        else:
+            stmt = stmt.where(Spec.name.in_(spec_names))
+
         if filter_by_csv:
             vals = [v.upper() for v in filter_by_csv]
             stmt = stmt.where(
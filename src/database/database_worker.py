@@ -1,5 +1,8 @@
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
 from sqlalchemy import select, func
 
 from src.database.base import get_session_factory
@@ -7,12 +10,52 @@ from src.database.database_test_log_tables import Spec
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip while streaming; progress is reported per chunk.
+QUERY_CHUNK_SIZE = 1000
+
+
+def empty_measurement_columns(size: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Allocate the parallel (struct-of-arrays) columns describing measurements.
+
+    Index ``i`` of every column refers to the same row as ``measurements[i]``
+    in the list emitted alongside it, so consumers can filter/sort with NumPy
+    and only touch the ORM objects they actually display. ``value`` is
+    float32 since it only feeds plotting; full precision stays on the ORM rows.
+    ``device_serial`` is the PIA serial, else the PMT serial, of the test log.
+    """
+    return {
+        'value': np.full(size, np.nan, dtype=np.float32),
+        'created_at': np.full(size, np.datetime64('NaT'), dtype='datetime64[s]'),
+        'name': np.empty(size, dtype=object),
+        'pia_serial': np.empty(size, dtype=object),
+        'device_serial': np.empty(size, dtype=object),
+        'test_log_id': np.full(size, -1, dtype=np.int64),
+    }
+
+
+def take_measurement_columns(columns: Dict[str, np.ndarray], indices) -> Dict[str, np.ndarray]:
+    """Return the rows at ``indices`` (index array or boolean mask) of every column."""
+    return {key: column[indices] for key, column in columns.items()}
+
+
+def as_recarray(columns: Dict[str, np.ndarray]) -> np.recarray:
+    """
+    Row view of the columns for code that iterates records.
+
+    ``record.value``, ``record.pia_serial`` etc. read like the ORM rows.
+    ``np.rec.fromarrays`` packs the columns into one record array (a copy),
+    so take the rows you need first; vectorised code should keep using the
+    columns directly.
+    """
+    return np.rec.fromarrays(list(columns.values()), names=list(columns.keys()))
+
 
 class DatabaseQueryWorker(QObject):
     # Signals
     init_progress = pyqtSignal(int)     # total number of rows
-    increment_progress = pyqtSignal()   # increment by 1
-    finished = pyqtSignal(list)         # results list
+    increment_progress = pyqtSignal(int)  # rows processed since last emit
+    finished = pyqtSignal(list, dict)   # results list, column arrays
     error = pyqtSignal(str)
 
     def __init__(self, stmt):
@@ -21,6 +64,7 @@ class DatabaseQueryWorker(QObject):
         self._stmt = stmt
         self._cancel = False
         self.results = []
+        self.columns = empty_measurement_columns()
 
     def cancel(self):
         self._cancel = True
@@ -45,33 +89,44 @@ class DatabaseQueryWorker(QObject):
                 self.init_progress.emit(total)
 
                 if total == 0:
-                    self.finished.emit(self.results)
                     return
 
                 # -----------------------------
                 # Main query loop
                 # -----------------------------
-                result_iter = (
-                    session.execute(self._stmt)
+                columns = empty_measurement_columns(total)
+                chunks = (
+                    session.execute(self._stmt.execution_options(yield_per=QUERY_CHUNK_SIZE))
                     .scalars()
-                    .yield_per(100)
+                    .partitions()
                 )
 
-                for measurement in result_iter:
+                for chunk in chunks:
                     if self._cancel:
                         break
 
-                    # Force-load relationships (avoid lazy loading on gui thread)
-                    sub_test = measurement.sub_test
-                    test_log = sub_test.test_log if sub_test else None
+                    needed = len(self.results) + len(chunk)
+                    if needed > len(columns['value']):
+                        # Rows committed after the count query; grow the columns geometrically.
+                        extra = empty_measurement_columns(max(needed, 2 * len(columns['value'])) - len(columns['value']))
+                        columns = {key: np.concatenate([column, extra[key]]) for key, column in columns.items()}
+
+                    for measurement in chunk:
+                        # Force-load relationships (avoid lazy loading on gui thread)
+                        sub_test = measurement.sub_test
+                        test_log = sub_test.test_log if sub_test else None
+
+                        measurement.sub_test = sub_test
+                        measurement.test_log = test_log
+                        measurement.pia = test_log.pia_board if test_log else None
+                        measurement.pmt = test_log.pmt_device if test_log else None
+
+                        self._fill_columns(columns, len(self.results), measurement, test_log)
+                        self.results.append(measurement)
 
-                    measurement.sub_test = sub_test
-                    measurement.test_log = test_log
-                    measurement.pia = test_log.pia_board if test_log else None
-                    measurement.pmt = test_log.pmt_device if test_log else None
+                    self.increment_progress.emit(len(chunk))
 
-                    self.results.append(measurement)
-                    self.increment_progress.emit()
+                self.columns = take_measurement_columns(columns, slice(0, len(self.results)))
 
         except Exception as e:
             logger.exception("Database query failed")
@@ -79,4 +134,76 @@ class DatabaseQueryWorker(QObject):
 
         finally:
             logger.info("Database query complete.")
-            self.finished.emit(self.results)
+            self.finished.emit(self.results, self.columns)
+
+    @staticmethod
+    def _fill_columns(columns: Dict[str, np.ndarray], row: int, measurement, test_log: Optional[object]):
+        """Copy the scalar fields of one measurement into the column arrays."""
+        if measurement.measurement is not None:
+            columns['value'][row] = measurement.measurement
+        if measurement.created_at is not None:
+            columns['created_at'][row] = measurement.created_at
+        columns['name'][row] = measurement.name
+        if test_log is not None:
+            columns['test_log_id'][row] = test_log.id
+            if test_log.pia_board is not None:
+                columns['pia_serial'][row] = test_log.pia_board.serial_number
+                columns['device_serial'][row] = test_log.pia_board.serial_number
+            elif test_log.pmt_device is not None:
+                columns['device_serial'][row] = test_log.pmt_device.pmt_serial_number
+
+
+class DatabaseTaskSignals(QObject):
+    """Signals for DatabaseTask (QRunnable cannot define signals itself)."""
+    finished = pyqtSignal(object)   # return value of the task function
+    error = pyqtSignal(str)
+
+
+class DatabaseTask(QRunnable):
+    """
+    Run one short read query on a QThreadPool thread.
+
+    ``fn`` receives a fresh session that is closed when it returns; its
+    result is delivered to the GUI thread through ``signals.finished``.
+    The result must not hold ORM objects that lazy-load after the session
+    is closed, so return plain values (names, tuples, ...).
+    """
+
+    def __init__(self, session_factory: Callable[[], Any], fn: Callable[[Any], Any]):
+        super().__init__()
+        self.signals = DatabaseTaskSignals()
+        self._session_factory = session_factory
+        self._fn = fn
+
+    def run(self):
+        try:
+            with self._session_factory() as session:
+                result = self._fn(session)
+        except Exception as e:
+            logger.exception("Database task failed")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+class BackgroundTask(QRunnable):
+    """
+    Run ``fn()`` on a QThreadPool thread and deliver its result to the GUI thread.
+
+    Used for CPU-bound data preparation (pairing, grouping) that must not
+    create widgets; build any widgets in the ``signals.finished`` slot.
+    """
+
+    def __init__(self, fn: Callable[[], Any]):
+        super().__init__()
+        self.signals = DatabaseTaskSignals()
+        self._fn = fn
+
+    def run(self):
+        try:
+            result = self._fn()
+        except Exception as e:
+            logger.exception("Background task failed")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
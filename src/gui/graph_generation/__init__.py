@@ -50,6 +50,7 @@ from .graph_utils import (
     configure_plot_theme,
     detect_outliers,
     get_grouped_data,
+    group_first_last,
     create_dashed_box_item,
     hex_to_rgb,
     is_dark_mode
@@ -73,6 +74,7 @@ __all__ = [
     'configure_plot_theme',
     'detect_outliers',
     'get_grouped_data',
+    'group_first_last',
     'create_dashed_box_item',
     'hex_to_rgb',
     'is_dark_mode',
@@ -121,6 +121,55 @@ class Database_Full_Measurement_Result_Object:
         return self.spec.sub_test_id
 
 
+
+@dataclass(slots=True)
+class PairedPoint:
+    """
+    One device's pair of values in a comparison plot.
+
+    ``our_value`` is drawn against ``mfr_value`` (the manufacturer value,
+    or the other fixture / first test / other batch average, depending on
+    "Compare By"). Slotted, as comparisons can pair tens of thousands of
+    devices.
+
+    Attributes:
+        device_id: Device serial number (or a placeholder label)
+        our_value: Our measured value
+        mfr_value: The value compared against
+        our_measurement: Measurement behind ``our_value``
+        other_measurement: Measurement behind ``mfr_value``, if any
+        manufacturer_name: Manufacturer (Manufacturer comparison)
+        fixture_a: Fixture of ``our_value`` (Test Fixture comparison)
+        fixture_b: Fixture of ``mfr_value`` (Test Fixture comparison)
+        first_date: Date of the first test (First vs Last comparison)
+        last_date: Date of the last test (First vs Last comparison)
+        batch_a: Batch of ``our_value`` (batch comparisons)
+        batch_b: Batch averaged into ``mfr_value`` (batch comparisons)
+        batch_b_avg: Average of batch B (batch comparisons)
+        group: Group label when grouping is enabled
+        x_axis_value: X-axis ordering/label value
+        meta_html: Tooltip rows (fixture, date) of ``our_measurement``,
+            formatted once when the pairs are annotated
+    """
+
+    device_id: Any
+    our_value: float
+    mfr_value: float
+    our_measurement: Any = None
+    other_measurement: Any = None
+    manufacturer_name: Optional[str] = None
+    fixture_a: Optional[str] = None
+    fixture_b: Optional[str] = None
+    first_date: Optional[datetime] = None
+    last_date: Optional[datetime] = None
+    batch_a: Any = None
+    batch_b: Any = None
+    batch_b_avg: Optional[float] = None
+    group: str = 'Unknown'
+    x_axis_value: Any = None
+    meta_html: str = ''
+
+
 # Type alias for clarity
 from typing import Any
 MeasurementData = Database_Full_Measurement_Result_Object
@@ -30,7 +30,7 @@ from .graph_utils import (
     get_color_palette, configure_plot_theme, detect_outliers,
     get_grouped_data, create_dashed_box_item,
     hex_to_rgb, is_dark_mode, calculate_point_size, calculate_line_width,
-    calculate_bar_width
+    calculate_bar_width, nearest_point_indexed, scatter_point_index
 )
 
 
@@ -627,35 +627,27 @@ class MeasurementGraphGenerator:
         plot_item = plot_widget.getPlotItem()
         groups = self.prepared_data['groups']
 
-        # Combine all values from all groups
-        all_values = []
-        for group_data in groups.values():
-            if group_data.get('y_data'):
-                is_outlier = group_data.get('is_outlier', [False] * len(group_data['y_data']))
-                filtered = [y for y, out in zip(group_data['y_data'], is_outlier) if not out] if self.config.remove_outliers else group_data['y_data']
-                all_values.extend(filtered)
+        # Bins depend only on the prepared data, so they are computed once and
+        # kept with it; generators sharing prepared data reuse them
+        metadata = self.prepared_data['metadata']
+        if 'histogram' not in metadata:
+            metadata['histogram'] = self._compute_histogram(groups)
+        histogram = metadata['histogram']
 
-        if not all_values:
+        if histogram is None:
             print("!!! _plot_histogram: No values to plot")
             return
 
-        print(f"!!! _plot_histogram: Plotting {len(all_values)} combined values, range: [{min(all_values):.4f}, {max(all_values):.4f}]")
-
-        # Calculate bins - ensure reasonable number
-        num_bins = min(50, max(10, len(all_values) // 5))
-        if num_bins < 5:
-            num_bins = min(len(all_values), 10)
+        hist = histogram['heights']
+        x = histogram['x']
+        width = histogram['width']
+        num_bins = len(hist)
 
         # Use primary color
         color = self.color_palette[0] if self.color_palette else '#2196F3'
         color_rgb = hex_to_rgb(color)
 
-        # Calculate histogram for combined data
-        hist, bin_edges = np.histogram(all_values, bins=num_bins)
-        x = (bin_edges[:-1] + bin_edges[1:]) / 2
-        width = bin_edges[1] - bin_edges[0]
-
-        print(f"!!! _plot_histogram: {num_bins} bins, width={width:.4f}, max_count={max(hist)}")
+        print(f"!!! _plot_histogram: {num_bins} bins, width={width:.4f}, max_count={hist.max()}")
 
         # Scale bar width - use 90% of bin width
         display_width = width * 0.9
@@ -672,13 +664,7 @@ class MeasurementGraphGenerator:
         plot_item.addItem(bar_item)
 
         # Store histogram data for tooltips
-        self.histogram_data = {
-            'x': x,  # bin centers
-            'heights': hist,  # counts
-            'bin_edges': bin_edges,
-            'width': width,
-            'total_count': len(all_values)
-        }
+        self.histogram_data = histogram
 
         # Set axis labels for histogram
         plot_item.setLabel('bottom', self.config.y_label if self.config.y_label else 'Value')
@@ -686,6 +672,43 @@ class MeasurementGraphGenerator:
 
         print(f"!!! _plot_histogram: Added bar graph with {num_bins} bins, {len(hist)} bars")
 
+    def _compute_histogram(self, groups: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Bin the combined values of all groups; None when there are none."""
+        # Combine all values from all groups (one concatenate, outliers/NaN masked out)
+        group_values = []
+        for group_data in groups.values():
+            if group_data.get('y_data'):
+                y_values = np.asarray(group_data['y_data'], dtype=np.float64)
+                if self.config.remove_outliers and group_data.get('is_outlier'):
+                    y_values = y_values[~np.asarray(group_data['is_outlier'], dtype=bool)]
+                group_values.append(y_values)
+
+        all_values = np.concatenate(group_values) if group_values else np.empty(0)
+        all_values = all_values[np.isfinite(all_values)]
+
+        if all_values.size == 0:
+            return None
+
+        print(f"!!! _plot_histogram: Plotting {len(all_values)} combined values, range: [{all_values.min():.4f}, {all_values.max():.4f}]")
+
+        # Calculate bins - ensure reasonable number
+        num_bins = min(50, max(10, len(all_values) // 5))
+        if num_bins < 5:
+            num_bins = min(len(all_values), 10)
+
+        # Calculate histogram for combined data
+        hist, bin_edges = np.histogram(all_values, bins=num_bins)
+        x = (bin_edges[:-1] + bin_edges[1:]) / 2
+        width = bin_edges[1] - bin_edges[0]
+
+        return {
+            'x': x,  # bin centers
+            'heights': hist,  # counts
+            'bin_edges': bin_edges,
+            'width': width,
+            'total_count': len(all_values)
+        }
+
     def _plot_overlaid_plots(self, plot_item: pg.PlotItem, plot_measurements: List[Any], color: str, group_name: str):
         """V4 FEATURE 5: Overlay plot-type measurements."""
         total_points = self.prepared_data['metadata']['total_points']
@@ -696,7 +719,7 @@ class MeasurementGraphGenerator:
                 continue
 
             y_data = measurement.plot_data
-            x_data = list(range(len(y_data)))
+            x_data = np.arange(len(y_data))
 
             pen_style = pg.QtCore.Qt.PenStyle.SolidLine
             if idx > 0:
@@ -1279,26 +1302,23 @@ class MeasurementGraphGenerator:
         # Convert scene position to view coordinates for histogram bar detection
         view_pos = plot_item.vb.mapSceneToView(scene_pos)
 
+        # View-to-scene transform only scales and translates; its per-axis
+        # scale turns the pixel threshold into a window on each item's index
+        vb = plot_item.vb
+        to_scene = vb.childTransform() * vb.sceneTransform()
+        x_scale, y_scale = to_scene.m11(), to_scene.m22()
+
         for item in plot_item.items:
             if isinstance(item, pg.ScatterPlotItem):
-                points = item.getData()
-                if points is None or len(points) == 0:
+                if len(item.data) == 0:
                     continue
 
-                x_data, y_data = points
-
-                for idx in range(len(x_data)):
-                    point_view_pos = QPointF(x_data[idx], y_data[idx])
-                    scene_point = plot_item.vb.mapViewToScene(point_view_pos)
-
-                    dx = scene_point.x() - scene_pos.x()
-                    dy = scene_point.y() - scene_pos.y()
-                    distance = np.sqrt(dx**2 + dy**2)
-
-                    if distance < min_distance and distance < threshold:
-                        min_distance = distance
-                        nearest_item = item
-                        nearest_idx = idx
+                idx, distance = nearest_point_indexed(scatter_point_index(item), view_pos.x(), view_pos.y(),
+                                                      x_scale, y_scale, threshold)
+                if distance < min_distance and distance < threshold:
+                    min_distance = distance
+                    nearest_item = item
+                    nearest_idx = idx
 
             # Check for histogram bars
             elif isinstance(item, pg.BarGraphItem) and self.histogram_data:
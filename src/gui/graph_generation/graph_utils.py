@@ -12,6 +12,11 @@ import pyqtgraph as pg
 
 from .graph_config import ColorScheme
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # Color palettes for different schemes
 TABLEAU_10 = [
@@ -160,6 +165,234 @@ def get_grouped_data(
     return groups
 
 
+def _group_first_last_loop(codes, times, n_groups):
+    """Single-pass per-group first/last scan (compiled with numba when available)."""
+    first = np.full(n_groups, -1, dtype=np.int64)
+    last = np.full(n_groups, -1, dtype=np.int64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for i in range(codes.shape[0]):
+        g = codes[i]
+        if counts[g] == 0:
+            first[g] = i
+            last[g] = i
+        else:
+            if times[i] < times[first[g]]:
+                first[g] = i
+            if times[i] >= times[last[g]]:
+                last[g] = i
+        counts[g] += 1
+    return first, last, counts
+
+
+def _group_first_last_numpy(codes, times, n_groups):
+    """Vectorized equivalent of ``_group_first_last_loop`` (stable sort by code, time)."""
+    perm = np.lexsort((times, codes))
+    sorted_codes = codes[perm]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    ends = np.r_[starts[1:] - 1, len(perm) - 1]
+
+    first = np.full(n_groups, -1, dtype=np.int64)
+    last = np.full(n_groups, -1, dtype=np.int64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    present = sorted_codes[starts]
+    first[present] = perm[starts]
+    last[present] = perm[ends]
+    counts[present] = ends - starts + 1
+    return first, last, counts
+
+
+_group_first_last_kernel = (
+    njit(cache=True)(_group_first_last_loop) if njit is not None else _group_first_last_numpy
+)
+
+
+def group_first_last(
+    codes: np.ndarray,
+    times: np.ndarray,
+    n_groups: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the earliest and latest row of each group.
+
+    Args:
+        codes: Group code per row in ``range(n_groups)`` (e.g. the inverse
+            from ``np.unique(keys, return_inverse=True)``)
+        times: Sortable int64 timestamp per row
+        n_groups: Number of groups
+
+    Returns:
+        (first, last, counts) arrays indexed by group code. Ties keep the
+        earliest row for ``first`` and the latest row for ``last``; empty
+        groups have index -1 and count 0.
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    times = np.ascontiguousarray(times, dtype=np.int64)
+    if len(codes) == 0:
+        return (np.full(n_groups, -1, dtype=np.int64), np.full(n_groups, -1, dtype=np.int64),
+                np.zeros(n_groups, dtype=np.int64))
+    return _group_first_last_kernel(codes, times, n_groups)
+
+
+def _nearest_point_loop(xs, ys, px, py):
+    """Index and squared distance of the point nearest (px, py) (compiled with numba when available)."""
+    best = -1
+    best_d2 = np.inf
+    for i in range(xs.shape[0]):
+        d2 = (xs[i] - px) ** 2 + (ys[i] - py) ** 2
+        if d2 < best_d2:
+            best = i
+            best_d2 = d2
+    return best, best_d2
+
+
+def _nearest_point_numpy(xs, ys, px, py):
+    """Vectorized equivalent of ``_nearest_point_loop`` (first index on ties)."""
+    d2 = (xs - px) ** 2 + (ys - py) ** 2
+    best = int(np.argmin(d2))
+    return best, float(d2[best])
+
+
+_nearest_point_kernel = (
+    njit(cache=True)(_nearest_point_loop) if njit is not None else _nearest_point_numpy
+)
+
+
+def nearest_point(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    px: float,
+    py: float
+) -> Tuple[int, float]:
+    """
+    Find the point nearest to (px, py).
+
+    Args:
+        xs: X coordinate per point
+        ys: Y coordinate per point
+        px, py: Query position, in the same coordinates
+
+    Returns:
+        (index, distance) of the nearest point; (-1, inf) if there are no points.
+    """
+    xs = np.ascontiguousarray(xs, dtype=np.float64)
+    ys = np.ascontiguousarray(ys, dtype=np.float64)
+    if len(xs) == 0:
+        return -1, float('inf')
+    best, best_d2 = _nearest_point_kernel(xs, ys, float(px), float(py))
+    return int(best), float(np.sqrt(best_d2))
+
+
+# (order, xs_sorted, ys_sorted, (x_min, x_max, y_min, y_max)), see build_point_index
+PointIndex = Tuple[np.ndarray, np.ndarray, np.ndarray, Tuple[float, float, float, float]]
+
+
+def build_point_index(xs: np.ndarray, ys: np.ndarray) -> PointIndex:
+    """
+    Build a spatial index for windowed nearest-point queries.
+
+    Points are sorted by X once, so a query only scans the points inside its
+    X window (two binary searches) instead of every point. The bounding box
+    of the finite points lets queries away from the data return at once.
+
+    Args:
+        xs: X coordinate per point
+        ys: Y coordinate per point
+
+    Returns:
+        (order, xs_sorted, ys_sorted, bounds), where ``order`` maps sorted
+        positions back to the original point indices and ``bounds`` is
+        (x_min, x_max, y_min, y_max); an empty box if no point is finite.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    order = np.argsort(xs, kind='stable')
+
+    finite = np.isfinite(xs) & np.isfinite(ys)
+    if finite.any():
+        fx, fy = xs[finite], ys[finite]
+        bounds = (float(fx.min()), float(fx.max()), float(fy.min()), float(fy.max()))
+    else:
+        bounds = (np.inf, -np.inf, np.inf, -np.inf)
+    return order, xs[order], ys[order], bounds
+
+
+def nearest_point_indexed(
+    index: PointIndex,
+    px: float,
+    py: float,
+    x_scale: float,
+    y_scale: float,
+    max_distance: float
+) -> Tuple[int, float]:
+    """
+    Find the indexed point nearest to (px, py) within ``max_distance``.
+
+    Coordinates are in data units; distances are measured after scaling each
+    axis (e.g. by the view's pixels-per-unit), so ``max_distance`` can be a
+    pixel threshold.
+
+    Args:
+        index: Result of ``build_point_index``
+        px, py: Query position, in data coordinates
+        x_scale, y_scale: Scale from data units to distance units per axis
+        max_distance: Only points strictly closer than this are returned
+
+    Returns:
+        (index, distance) of the nearest point in the original point order;
+        (-1, inf) if no point is close enough.
+    """
+    order, xs, ys, (x_min, x_max, y_min, y_max) = index
+    half_width = max_distance / abs(x_scale) if x_scale else np.inf
+    half_height = max_distance / abs(y_scale) if y_scale else np.inf
+
+    # Cursor over empty plot area: nothing within reach of the data's bounding box
+    if not (x_min - half_width <= px <= x_max + half_width
+            and y_min - half_height <= py <= y_max + half_height):
+        return -1, float('inf')
+
+    lo = int(np.searchsorted(xs, px - half_width, side='left'))
+    hi = int(np.searchsorted(xs, px + half_width, side='right'))
+    if lo >= hi:
+        return -1, float('inf')
+
+    i, distance = nearest_point(xs[lo:hi] * x_scale, ys[lo:hi] * y_scale, px * x_scale, py * y_scale)
+    if i < 0 or not distance < max_distance:
+        return -1, float('inf')
+    return int(order[lo + i]), distance
+
+
+def scatter_point_index(item: pg.ScatterPlotItem) -> PointIndex:
+    """
+    Spatial index of a scatter item's points, cached on the item.
+
+    ScatterPlotItem replaces its point array whenever its data changes, so the
+    cache is keyed on that array and rebuilt only when it is replaced.
+    """
+    cached = getattr(item, '_point_index', None)
+    if cached is not None and cached[0] is item.data:
+        return cached[1]
+
+    x_data, y_data = item.getData()
+    index = build_point_index(x_data, y_data)
+    item._point_index = (item.data, index)
+    return index
+
+
+def warm_up_kernels():
+    """
+    Compile the numba kernels before their first real call.
+
+    Run off the GUI thread so the first hover or grouping does not pay the
+    compile (or, with ``cache=True``, the on-disk cache load). No-op without numba.
+    """
+    if njit is None:
+        return
+    xs = np.zeros(1, dtype=np.float64)
+    codes = np.zeros(1, dtype=np.int64)
+    _nearest_point_kernel(xs, xs, 0.0, 0.0)
+    _group_first_last_kernel(codes, codes, 1)
+
+
 def calculate_group_spacing(
     num_groups: int,
     total_range: float,
@@ -13,10 +13,13 @@ Author: Generated for PCBA Database Application
 """
 import logging
 import os
+import subprocess
+import sys
+import tempfile
 import webbrowser
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from datetime import datetime
-from functools import partial
+from functools import partial, lru_cache
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
@@ -24,13 +27,15 @@ from PyQt6.QtWidgets import (
     QPushButton, QFrame, QScrollArea, QDateEdit, QMessageBox,
     QProgressDialog, QApplication, QFileDialog, QSplitter,
     QTextEdit, QGroupBox, QRadioButton, QButtonGroup, QSpacerItem,
-    QSizePolicy, QMenu, QCheckBox, QGridLayout
+    QSizePolicy, QMenu, QCheckBox, QGridLayout, QDialog, QFormLayout,
+    QDialogButtonBox
 )
 from PyQt6.QtCore import (
     QThread, pyqtSignal, Qt, QDate, QTimer, QSortFilterProxyModel,
     QAbstractTableModel, QModelIndex, QVariant
 )
 from PyQt6.QtGui import QAction, QColor, QBrush, QFont, QIcon
+from sqlalchemy import insert
 
 from src.database import DatabaseManager
 from src.database.database_device_tables import PCBABoard, PMT
@@ -42,6 +47,56 @@ from src.database.database_manufacturer_tables import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _format_datetime(dt: Optional[datetime], fmt: str = '%Y-%m-%d %H:%M') -> str:
+    """
+    Format a timestamp for display, memoized by value.
+    
+    The same records are re-formatted on every table load and detail
+    populate, so repeated timestamps come straight from the cache.
+    
+    Args:
+        dt: Timestamp to format (None gives 'N/A')
+        fmt: strftime format string
+    
+    Returns:
+        Formatted string
+    """
+    if dt is None:
+        return 'N/A'
+    return format(dt, fmt)
+
+
+def _resolve_attr(record, attr_path: str):
+    """
+    Follow a dotted attribute path (e.g. ``"pia_board.serial_number"``).
+
+    Returns None as soon as any link in the path is None.
+    """
+    value = record
+    for attr in attr_path.split('.'):
+        value = getattr(value, attr, None)
+        if value is None:
+            break
+    return value
+
+
+# Status cell styling, allocated once and shared by every row
+_STATUS_COLORS = {
+    True: QColor('#22c55e'),   # Green
+    False: QColor('#ef4444'),  # Red
+}
+_STATUS_BRUSHES = {status: QBrush(color) for status, color in _STATUS_COLORS.items()}
+
+
+@lru_cache(maxsize=1)
+def _status_font() -> QFont:
+    """Bold font for status cells (created on first use, after QApplication exists)."""
+    font = QFont()
+    font.setBold(True)
+    return font
+
+
 class ViewMode:
     """View mode constants for the database browser."""
     TEST_LOGS = "Test Logs"
@@ -121,7 +176,7 @@ class TestLogTableModel(QAbstractTableModel):
             row = {
                 'id': tl.id,
                 'name': tl.name or 'N/A',
-                'created_at': tl.created_at.strftime('%Y-%m-%d %H:%M') if tl.created_at else 'N/A',
+                'created_at': _format_datetime(tl.created_at),
                 'full_test_passed': tl.full_test_passed,
                 'full_test_completed': tl.full_test_completed,
                 'test_fixture': tl.test_fixture or 'N/A',
@@ -166,17 +221,12 @@ class TestLogTableModel(QAbstractTableModel):
         elif role == Qt.ItemDataRole.ForegroundRole:
             if col_name == 'full_test_passed':
                 value = row_data.get(col_name)
-                if value is True:
-                    return QBrush(QColor('#22c55e'))  # Green
-                elif value is False:
-                    return QBrush(QColor('#ef4444'))  # Red
+                return _STATUS_BRUSHES.get(value)
             return None
         
         elif role == Qt.ItemDataRole.FontRole:
             if col_name in ('full_test_passed', 'full_test_completed'):
-                font = QFont()
-                font.setBold(True)
-                return font
+                return _status_font()
             return None
         
         elif role == Qt.ItemDataRole.UserRole:
@@ -235,7 +285,7 @@ class PIABoardTableModel(QAbstractTableModel):
                 'generation_project': board.generation_project or 'N/A',
                 'version': board.version or 'N/A',
                 'test_count': test_counts.get(board.id, 0),
-                'created_at': board.created_at.strftime('%Y-%m-%d') if board.created_at else 'N/A',
+                'created_at': _format_datetime(board.created_at, '%Y-%m-%d'),
                 '_board': board,
             }
             self._raw_data.append(row)
@@ -304,7 +354,7 @@ class PMTDeviceTableModel(QAbstractTableModel):
                 'generation': pmt.generation or 'N/A',
                 'batch_number': pmt.batch_number or 'N/A',
                 'test_count': test_counts.get(pmt.id, 0),
-                'created_at': pmt.created_at.strftime('%Y-%m-%d') if pmt.created_at else 'N/A',
+                'created_at': _format_datetime(pmt.created_at, '%Y-%m-%d'),
                 '_pmt': pmt,
             }
             self._raw_data.append(row)
@@ -374,7 +424,7 @@ class ManufacturerTableModel(QAbstractTableModel):
                 'website': mfr.website or 'N/A',
                 'spec_count': len(mfr.specs) if mfr.specs else 0,
                 'batch_count': len(mfr.device_batches) if mfr.device_batches else 0,
-                'created_at': mfr.created_at.strftime('%Y-%m-%d') if mfr.created_at else 'N/A',
+                'created_at': _format_datetime(mfr.created_at, '%Y-%m-%d'),
                 '_manufacturer': mfr,
             }
             self._raw_data.append(row)
@@ -419,6 +469,46 @@ class DatabasePage:
     - HTML report viewing
     """
     
+    # Detail panel field specs:
+    # (label, detail field key, column, record attribute path, read-only)
+    _TEST_LOG_FIELDS = [
+        ("Test Name", "name", 0, "name", True),
+        ("Test Fixture", "test_fixture", 0, "test_fixture", False),
+        ("PIA Serial Number", "pia_serial_number", 1, "pia_board.serial_number", False),
+        ("PIA Part Number", "pia_part_number", 1, "pia_board.part_number", False),
+        ("PMT Serial Number", "pmt_serial_number", 2, "pmt_device.pmt_serial_number", False),
+    ]
+    _PIA_BOARD_FIELDS = [
+        ("Serial Number", "serial_number", 0, "serial_number", False),
+        ("Part Number", "part_number", 0, "part_number", False),
+        ("Generation/Project", "generation_project", 1, "generation_project", False),
+        ("Version", "version", 1, "version", False),
+    ]
+    _PMT_FIELDS = [
+        ("Serial Number", "pmt_serial_number", 0, "pmt_serial_number", False),
+        ("Batch Number", "batch_number", 0, "batch_number", False),
+        ("Generation", "generation", 1, "generation", False),
+    ]
+    _MANUFACTURER_FIELDS = [
+        ("Name", "name", 0, "name", False),
+        ("Website", "website", 0, "website", False),
+        ("Description", "description", 1, "description", False),
+        ("Contact Info", "contact_info", 1, "contact_info", False),
+    ]
+    
+    # Table columns that show editable fields: {record type: {column: attribute path}}
+    _TABLE_EDITABLE_COLUMNS = {
+        TestLog: {
+            4: "test_fixture",
+            5: "pia_board.part_number",
+            6: "pia_board.serial_number",
+            8: "pmt_device.pmt_serial_number",
+        },
+        PCBABoard: {0: "serial_number", 1: "part_number", 2: "generation_project", 3: "version"},
+        PMT: {0: "pmt_serial_number", 1: "generation", 2: "batch_number"},
+        Manufacturer: {0: "name", 1: "description", 2: "website"},
+    }
+    
     def __init__(self, main_window, db_manager: DatabaseManager):
         """
         Initialize the database page.
@@ -445,6 +535,22 @@ class DatabasePage:
         self.pmt_device_model = PMTDeviceTableModel()
         self.manufacturer_model = ManufacturerTableModel()
         
+        # Detail forms cached per record type: (container, fields, columns)
+        self._detail_forms: Dict[type, Tuple[QWidget, Dict[str, QLineEdit], List[QVBoxLayout]]] = {}
+        self._test_log_result_label: Optional[QLabel] = None
+        
+        # Coalesce rapid selection changes (e.g. holding an arrow key) into
+        # a single detail panel populate once the selection settles
+        self._selection_timer = QTimer()
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(50)
+        self._selection_timer.timeout.connect(self._do_populate)
+        self._last_populated_record = None
+        
+        # Table context menus (built lazily on first right-click, then reused)
+        self._context_menu_test_logs: Optional[QMenu] = None
+        self._context_menu_generic: Optional[QMenu] = None
+        
         # Build the UI
         self.setup_ui()
         
@@ -940,6 +1046,8 @@ class DatabasePage:
     
     def load_data(self):
         """Load data based on current view mode and filters."""
+        # The reloaded rows are new objects; the detail panel must be refilled
+        self._last_populated_record = None
         try:
             if self.current_view_mode == ViewMode.TEST_LOGS:
                 self._load_test_logs()
@@ -964,12 +1072,14 @@ class DatabasePage:
         """Load test logs with current filters."""
         try:
             with self.db.session_scope() as session:
-                from sqlalchemy.orm import joinedload
+                from sqlalchemy.orm import selectinload
                 from sqlalchemy import desc
                 
+                # selectinload fetches boards/PMTs in bounded IN batches instead of
+                # widening every row with a second copy of the search joins
                 query = session.query(TestLog).options(
-                    joinedload(TestLog.pia_board),
-                    joinedload(TestLog.pmt_device)
+                    selectinload(TestLog.pia_board),
+                    selectinload(TestLog.pmt_device)
                 )
                 
                 # Apply filters
@@ -1057,7 +1167,7 @@ class DatabasePage:
             items.append(item)
             
             # Test Date
-            date_str = tl.created_at.strftime('%Y-%m-%d %H:%M') if tl.created_at else 'N/A'
+            date_str = _format_datetime(tl.created_at)
             items.append(QTableWidgetItem(date_str))
             
             # Result
@@ -1065,11 +1175,11 @@ class DatabasePage:
                 result_item = QTableWidgetItem('N/A')
             elif tl.full_test_passed:
                 result_item = QTableWidgetItem('✓ PASS')
-                result_item.setForeground(QBrush(QColor('#22c55e')))
+                result_item.setForeground(_STATUS_BRUSHES[True])
             else:
                 result_item = QTableWidgetItem('✗ FAIL')
-                result_item.setForeground(QBrush(QColor('#ef4444')))
-            result_item.setFont(QFont('', -1, QFont.Weight.Bold))
+                result_item.setForeground(_STATUS_BRUSHES[False])
+            result_item.setFont(_status_font())
             items.append(result_item)
             
             # Full Test
@@ -1077,7 +1187,7 @@ class DatabasePage:
                 full_item = QTableWidgetItem('N/A')
             elif tl.full_test_completed:
                 full_item = QTableWidgetItem('✓ Yes')
-                full_item.setForeground(QBrush(QColor('#22c55e')))
+                full_item.setForeground(_STATUS_BRUSHES[True])
             else:
                 full_item = QTableWidgetItem('○ No')
             items.append(full_item)
@@ -1161,7 +1271,7 @@ class DatabasePage:
                 QTableWidgetItem(board.generation_project or 'N/A'),
                 QTableWidgetItem(board.version or 'N/A'),
                 QTableWidgetItem(str(test_counts.get(board.id, 0))),
-                QTableWidgetItem(board.created_at.strftime('%Y-%m-%d') if board.created_at else 'N/A'),
+                QTableWidgetItem(_format_datetime(board.created_at, '%Y-%m-%d')),
             ]
             
             items[0].setData(Qt.ItemDataRole.UserRole, board)
@@ -1225,7 +1335,7 @@ class DatabasePage:
                 QTableWidgetItem(pmt.generation or 'N/A'),
                 QTableWidgetItem(pmt.batch_number or 'N/A'),
                 QTableWidgetItem(str(test_counts.get(pmt.id, 0))),
-                QTableWidgetItem(pmt.created_at.strftime('%Y-%m-%d') if pmt.created_at else 'N/A'),
+                QTableWidgetItem(_format_datetime(pmt.created_at, '%Y-%m-%d')),
             ]
             
             items[0].setData(Qt.ItemDataRole.UserRole, pmt)
@@ -1240,11 +1350,13 @@ class DatabasePage:
         """Load manufacturers with current filters."""
         try:
             with self.db.session_scope() as session:
-                from sqlalchemy.orm import joinedload
+                from sqlalchemy.orm import selectinload
                 
+                # Two joined collections would multiply rows (specs x batches);
+                # load each with its own IN query instead
                 query = session.query(Manufacturer).options(
-                    joinedload(Manufacturer.specs),
-                    joinedload(Manufacturer.device_batches)
+                    selectinload(Manufacturer.specs),
+                    selectinload(Manufacturer.device_batches)
                 )
                 
                 # Apply search filter
@@ -1285,7 +1397,7 @@ class DatabasePage:
                 QTableWidgetItem(mfr.website or 'N/A'),
                 QTableWidgetItem(str(len(mfr.specs) if mfr.specs else 0)),
                 QTableWidgetItem(str(len(mfr.device_batches) if mfr.device_batches else 0)),
-                QTableWidgetItem(mfr.created_at.strftime('%Y-%m-%d') if mfr.created_at else 'N/A'),
+                QTableWidgetItem(_format_datetime(mfr.created_at, '%Y-%m-%d')),
             ]
             
             items[0].setData(Qt.ItemDataRole.UserRole, mfr)
@@ -1306,12 +1418,24 @@ class DatabasePage:
         except Exception as e:
             logger.error(f"Error updating stats: {e}")
     
-    def on_table_selection_changed(self):
-        """Handle table row selection change."""
+    def on_table_selection_changed(self, *_):
+        """
+        Handle table row selection change.
+        
+        Extra signal arguments (e.g. QAction.triggered's ``checked``) are ignored
+        so the slot can be connected directly without a lambda. The detail
+        panel is populated after a short debounce so intermediate selections
+        are skipped.
+        """
+        self._selection_timer.start()
+    
+    def _do_populate(self):
+        """Populate the detail panel for the current (settled) table selection."""
         selected_items = self.table_view.selectedItems()
         if not selected_items:
             self.detail_panel.setVisible(False)
             self.selected_record = None
+            self._last_populated_record = None
             return
         
         # Get the record from the first column's user data
@@ -1325,298 +1449,248 @@ class DatabasePage:
             return
         
         self.selected_record = record
+        
+        # Same record object already on display and unedited - nothing to rebuild.
+        # Reloaded tables hold new objects, and re-selecting resets unsaved edits
+        if (record is self._last_populated_record and not self.is_dirty
+                and not self.detail_panel.isHidden()):
+            return
+        
         self._populate_detail_panel(record)
+        self._last_populated_record = record
         self.detail_panel.setVisible(True)
     
     def _populate_detail_panel(self, record):
-        """Populate the detail panel based on record type."""
-        # Clear existing fields
-        while self.detail_fields_layout.count():
-            child = self.detail_fields_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Store field references for saving
-        self.detail_fields = {}
-        
-        if isinstance(record, TestLog):
-            self._populate_test_log_details(record)
-        elif isinstance(record, PCBABoard):
-            self._populate_pia_board_details(record)
-        elif isinstance(record, PMT):
-            self._populate_pmt_details(record)
-        elif isinstance(record, Manufacturer):
-            self._populate_manufacturer_details(record)
-    
+        """
+        Populate the detail panel based on record type.
+
+        Repaints are suspended on the panel while the form is swapped and
+        filled so Qt issues a single paint once the new values are in place.
+        """
+        self.detail_panel.setUpdatesEnabled(False)
+        try:
+            # Store field references for saving
+            self.detail_fields = {}
+            self.is_dirty = False
+
+            if isinstance(record, TestLog):
+                self._populate_test_log_details(record)
+            elif isinstance(record, PCBABoard):
+                self._populate_pia_board_details(record)
+            elif isinstance(record, PMT):
+                self._populate_pmt_details(record)
+            elif isinstance(record, Manufacturer):
+                self._populate_manufacturer_details(record)
+        finally:
+            self.detail_panel.setUpdatesEnabled(True)
+
+    def _fill_detail_form(self, record, spec: List[Tuple[str, str, int, str, bool]]) -> List[QVBoxLayout]:
+        """
+        Show the cached form for this record type and fill it from the record.
+
+        The form is built from ``spec`` the first time a record type is shown;
+        afterwards only the field text is updated.
+
+        Args:
+            record: ORM record being displayed
+            spec: Field spec (see ``_TEST_LOG_FIELDS``)
+
+        Returns:
+            The form's column layouts
+        """
+        form_key = type(record)
+        if form_key not in self._detail_forms:
+            self._detail_forms[form_key] = self._build_form_from_spec(spec)
+        container, fields, columns = self._detail_forms[form_key]
+
+        self._show_detail_fields_container(container)
+
+        for _label, key, _column, attr_path, _read_only in spec:
+            fields[key].setText(_resolve_attr(record, attr_path) or '')
+
+        self.detail_fields = fields
+        return columns
+
+    def _build_form_from_spec(self, spec: List[Tuple[str, str, int, str, bool]]):
+        """
+        Build a detail form container from a field spec.
+
+        Args:
+            spec: Field spec (see ``_TEST_LOG_FIELDS``)
+
+        Returns:
+            Tuple of (container widget, {key: QLineEdit}, column layouts)
+        """
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(20)
+
+        columns: List[QVBoxLayout] = []
+        fields: Dict[str, QLineEdit] = {}
+
+        for label, key, column, _attr_path, read_only in spec:
+            while len(columns) <= column:
+                col_layout = QVBoxLayout()
+                col_layout.setSpacing(8)
+                col_widget = QWidget()
+                col_widget.setLayout(col_layout)
+                layout.addWidget(col_widget)
+                columns.append(col_layout)
+
+            columns[column].addWidget(QLabel(label))
+            edit = QLineEdit()
+            if read_only:
+                edit.setReadOnly(True)
+                edit.setStyleSheet("background-color: #1e293b;")
+            columns[column].addWidget(edit)
+            edit.textEdited.connect(self._on_detail_field_edited)
+            fields[key] = edit
+
+        for col_layout in columns:
+            col_layout.addStretch()
+        layout.addStretch()
+
+        return container, fields, columns
+
+    def _show_detail_fields_container(self, container: QWidget):
+        """
+        Swap a form container into the detail panel.
+
+        Swapping whole containers is much cheaper for Qt than taking each
+        child out of the layout and reparenting it. Cached forms are kept
+        alive for reuse; anything else is deleted.
+        """
+        old_container = self.detail_fields_container
+        if old_container is container:
+            return
+
+        parent_layout = old_container.parentWidget().layout()
+        parent_layout.replaceWidget(old_container, container)
+        old_container.setParent(None)
+        if not any(form[0] is old_container for form in self._detail_forms.values()):
+            old_container.deleteLater()
+        container.show()
+
+        self.detail_fields_container = container
+        self.detail_fields_layout = container.layout()
+
     def _populate_test_log_details(self, test_log: TestLog):
         """Populate detail panel for a test log."""
         self.detail_title.setText("📋 Test Log Details")
         self.detail_id_label.setText(f"ID: {test_log.id}")
         self.detail_created_label.setText(
-            f"Created: {test_log.created_at.strftime('%Y-%m-%d %H:%M') if test_log.created_at else 'N/A'}"
+            f"Created: {_format_datetime(test_log.created_at)}"
         )
         
         # Show HTML buttons for test logs
         self.view_html_btn.setVisible(True)
         self.open_browser_btn.setVisible(True)
         
-        # Column 1: Test info
-        col1 = QVBoxLayout()
-        col1.setSpacing(8)
-        
-        # Test Name (read-only)
-        col1.addWidget(QLabel("Test Name"))
-        name_edit = QLineEdit(test_log.name or '')
-        name_edit.setReadOnly(True)
-        name_edit.setStyleSheet("background-color: #1e293b;")
-        col1.addWidget(name_edit)
-        
-        # Test Fixture (editable)
-        col1.addWidget(QLabel("Test Fixture"))
-        fixture_edit = QLineEdit(test_log.test_fixture or '')
-        self.detail_fields['test_fixture'] = fixture_edit
-        col1.addWidget(fixture_edit)
-        
-        col1.addStretch()
-        
-        col1_widget = QWidget()
-        col1_widget.setLayout(col1)
-        self.detail_fields_layout.addWidget(col1_widget)
-        
-        # Column 2: PIA info
-        col2 = QVBoxLayout()
-        col2.setSpacing(8)
-        
-        col2.addWidget(QLabel("PIA Serial Number"))
-        pia_serial_edit = QLineEdit(
-            test_log.pia_board.serial_number if test_log.pia_board else ''
-        )
-        self.detail_fields['pia_serial_number'] = pia_serial_edit
-        col2.addWidget(pia_serial_edit)
-        
-        col2.addWidget(QLabel("PIA Part Number"))
-        pia_part_edit = QLineEdit(
-            test_log.pia_board.part_number if test_log.pia_board else ''
-        )
-        self.detail_fields['pia_part_number'] = pia_part_edit
-        col2.addWidget(pia_part_edit)
-        
-        col2.addStretch()
-        
-        col2_widget = QWidget()
-        col2_widget.setLayout(col2)
-        self.detail_fields_layout.addWidget(col2_widget)
+        columns = self._fill_detail_form(test_log, self._TEST_LOG_FIELDS)
         
-        # Column 3: PMT info
-        col3 = QVBoxLayout()
-        col3.setSpacing(8)
+        # Result is display-only, shown under the PMT column
+        if self._test_log_result_label is None:
+            columns[2].insertWidget(columns[2].count() - 1, QLabel("Result"))
+            self._test_log_result_label = QLabel()
+            columns[2].insertWidget(columns[2].count() - 1, self._test_log_result_label)
         
-        col3.addWidget(QLabel("PMT Serial Number"))
-        pmt_serial_edit = QLineEdit(
-            test_log.pmt_device.pmt_serial_number if test_log.pmt_device else ''
-        )
-        self.detail_fields['pmt_serial_number'] = pmt_serial_edit
-        col3.addWidget(pmt_serial_edit)
-        
-        col3.addWidget(QLabel("Result"))
-        result_label = QLabel()
+        result_label = self._test_log_result_label
         if test_log.full_test_passed is None:
             result_label.setText("N/A")
+            result_label.setStyleSheet("")
         elif test_log.full_test_passed:
             result_label.setText("✓ PASSED")
             result_label.setStyleSheet("color: #22c55e; font-weight: bold; font-size: 14px;")
         else:
             result_label.setText("✗ FAILED")
             result_label.setStyleSheet("color: #ef4444; font-weight: bold; font-size: 14px;")
-        col3.addWidget(result_label)
-        
-        col3.addStretch()
-        
-        col3_widget = QWidget()
-        col3_widget.setLayout(col3)
-        self.detail_fields_layout.addWidget(col3_widget)
-        
-        self.detail_fields_layout.addStretch()
     
     def _populate_pia_board_details(self, board: PCBABoard):
         """Populate detail panel for a PIA board."""
         self.detail_title.setText("🔧 PIA Board Details")
         self.detail_id_label.setText(f"ID: {board.id}")
         self.detail_created_label.setText(
-            f"Created: {board.created_at.strftime('%Y-%m-%d %H:%M') if board.created_at else 'N/A'}"
+            f"Created: {_format_datetime(board.created_at)}"
         )
         
         # Hide HTML buttons for non-test-log records
         self.view_html_btn.setVisible(False)
         self.open_browser_btn.setVisible(False)
         
-        # Column 1
-        col1 = QVBoxLayout()
-        col1.setSpacing(8)
-        
-        col1.addWidget(QLabel("Serial Number"))
-        serial_edit = QLineEdit(board.serial_number or '')
-        self.detail_fields['serial_number'] = serial_edit
-        col1.addWidget(serial_edit)
-        
-        col1.addWidget(QLabel("Part Number"))
-        part_edit = QLineEdit(board.part_number or '')
-        self.detail_fields['part_number'] = part_edit
-        col1.addWidget(part_edit)
-        
-        col1.addStretch()
-        
-        col1_widget = QWidget()
-        col1_widget.setLayout(col1)
-        self.detail_fields_layout.addWidget(col1_widget)
-        
-        # Column 2
-        col2 = QVBoxLayout()
-        col2.setSpacing(8)
-        
-        col2.addWidget(QLabel("Generation/Project"))
-        gen_edit = QLineEdit(board.generation_project or '')
-        self.detail_fields['generation_project'] = gen_edit
-        col2.addWidget(gen_edit)
-        
-        col2.addWidget(QLabel("Version"))
-        version_edit = QLineEdit(board.version or '')
-        self.detail_fields['version'] = version_edit
-        col2.addWidget(version_edit)
-        
-        col2.addStretch()
-        
-        col2_widget = QWidget()
-        col2_widget.setLayout(col2)
-        self.detail_fields_layout.addWidget(col2_widget)
-        
-        self.detail_fields_layout.addStretch()
+        self._fill_detail_form(board, self._PIA_BOARD_FIELDS)
     
     def _populate_pmt_details(self, pmt: PMT):
         """Populate detail panel for a PMT device."""
         self.detail_title.setText("💡 PMT Device Details")
         self.detail_id_label.setText(f"ID: {pmt.id}")
         self.detail_created_label.setText(
-            f"Created: {pmt.created_at.strftime('%Y-%m-%d %H:%M') if pmt.created_at else 'N/A'}"
+            f"Created: {_format_datetime(pmt.created_at)}"
         )
         
         self.view_html_btn.setVisible(False)
         self.open_browser_btn.setVisible(False)
         
-        # Column 1
-        col1 = QVBoxLayout()
-        col1.setSpacing(8)
-        
-        col1.addWidget(QLabel("Serial Number"))
-        serial_edit = QLineEdit(pmt.pmt_serial_number or '')
-        self.detail_fields['pmt_serial_number'] = serial_edit
-        col1.addWidget(serial_edit)
-        
-        col1.addWidget(QLabel("Batch Number"))
-        batch_edit = QLineEdit(pmt.batch_number or '')
-        self.detail_fields['batch_number'] = batch_edit
-        col1.addWidget(batch_edit)
-        
-        col1.addStretch()
-        
-        col1_widget = QWidget()
-        col1_widget.setLayout(col1)
-        self.detail_fields_layout.addWidget(col1_widget)
-        
-        # Column 2
-        col2 = QVBoxLayout()
-        col2.setSpacing(8)
-        
-        col2.addWidget(QLabel("Generation"))
-        gen_edit = QLineEdit(pmt.generation or '')
-        self.detail_fields['generation'] = gen_edit
-        col2.addWidget(gen_edit)
-        
-        col2.addStretch()
-        
-        col2_widget = QWidget()
-        col2_widget.setLayout(col2)
-        self.detail_fields_layout.addWidget(col2_widget)
-        
-        self.detail_fields_layout.addStretch()
+        self._fill_detail_form(pmt, self._PMT_FIELDS)
     
     def _populate_manufacturer_details(self, mfr: Manufacturer):
         """Populate detail panel for a manufacturer."""
         self.detail_title.setText("🏭 Manufacturer Details")
         self.detail_id_label.setText(f"ID: {mfr.id}")
         self.detail_created_label.setText(
-            f"Created: {mfr.created_at.strftime('%Y-%m-%d %H:%M') if mfr.created_at else 'N/A'}"
+            f"Created: {_format_datetime(mfr.created_at)}"
         )
         
         self.view_html_btn.setVisible(False)
         self.open_browser_btn.setVisible(False)
         
-        # Column 1
-        col1 = QVBoxLayout()
-        col1.setSpacing(8)
-        
-        col1.addWidget(QLabel("Name"))
-        name_edit = QLineEdit(mfr.name or '')
-        self.detail_fields['name'] = name_edit
-        col1.addWidget(name_edit)
-        
-        col1.addWidget(QLabel("Website"))
-        website_edit = QLineEdit(mfr.website or '')
-        self.detail_fields['website'] = website_edit
-        col1.addWidget(website_edit)
-        
-        col1.addStretch()
-        
-        col1_widget = QWidget()
-        col1_widget.setLayout(col1)
-        self.detail_fields_layout.addWidget(col1_widget)
-        
-        # Column 2
-        col2 = QVBoxLayout()
-        col2.setSpacing(8)
-        
-        col2.addWidget(QLabel("Description"))
-        desc_edit = QLineEdit(mfr.description or '')
-        self.detail_fields['description'] = desc_edit
-        col2.addWidget(desc_edit)
-        
-        col2.addWidget(QLabel("Contact Info"))
-        contact_edit = QLineEdit(mfr.contact_info or '')
-        self.detail_fields['contact_info'] = contact_edit
-        col2.addWidget(contact_edit)
-        
-        col2.addStretch()
-        
-        col2_widget = QWidget()
-        col2_widget.setLayout(col2)
-        self.detail_fields_layout.addWidget(col2_widget)
-        
-        self.detail_fields_layout.addStretch()
+        self._fill_detail_form(mfr, self._MANUFACTURER_FIELDS)
     
     def on_table_context_menu(self, position):
         """Show context menu for table."""
-        menu = QMenu()
+        if self.current_view_mode == ViewMode.TEST_LOGS:
+            if self._context_menu_test_logs is None:
+                self._context_menu_test_logs = self._build_table_context_menu(include_html=True)
+            menu = self._context_menu_test_logs
+        else:
+            if self._context_menu_generic is None:
+                self._context_menu_generic = self._build_table_context_menu(include_html=False)
+            menu = self._context_menu_generic
+        
+        menu.exec(self.table_view.viewport().mapToGlobal(position))
+    
+    def _build_table_context_menu(self, include_html: bool) -> QMenu:
+        """
+        Build a table context menu whose actions stay connected for reuse.
         
-        view_action = QAction("View Details", self.main_window)
-        view_action.triggered.connect(lambda: self.on_table_selection_changed())
+        Args:
+            include_html: Add the HTML report actions (test log view only)
+        
+        Returns:
+            QMenu parented to the main window
+        """
+        menu = QMenu(self.main_window)
+        
+        view_action = QAction("View Details", menu)
+        view_action.triggered.connect(self.on_table_selection_changed)
         menu.addAction(view_action)
         
-        if self.current_view_mode == ViewMode.TEST_LOGS:
-            html_action = QAction("View HTML Report", self.main_window)
+        if include_html:
+            html_action = QAction("View HTML Report", menu)
             html_action.triggered.connect(self.on_view_html_report)
             menu.addAction(html_action)
             
-            browser_action = QAction("Open in Browser", self.main_window)
+            browser_action = QAction("Open in Browser", menu)
             browser_action.triggered.connect(self.on_open_in_browser)
             menu.addAction(browser_action)
         
         menu.addSeparator()
         
-        delete_action = QAction("Delete Record", self.main_window)
+        delete_action = QAction("Delete Record", menu)
         delete_action.triggered.connect(self.on_delete_record)
         menu.addAction(delete_action)
         
-        menu.exec(self.table_view.viewport().mapToGlobal(position))
+        return menu
     
     def on_save_changes(self):
         """Save changes to the selected record."""
@@ -1663,14 +1737,14 @@ class DatabasePage:
                         mfr.website = self.detail_fields['website'].text() or None
                         mfr.contact_info = self.detail_fields['contact_info'].text() or None
             
-            QMessageBox.information(
-                self.main_window,
-                "Success",
-                "Changes saved successfully."
-            )
+            # Mirror the saved values onto the displayed records and refresh
+            # only the table cells that changed, instead of re-querying everything
+            self._apply_detail_fields_to_record(self.selected_record)
+            self._refresh_edited_table_cells()
+            self.is_dirty = False
+            self._invalidate_graph_cache()
             
-            # Reload data to reflect changes
-            self.load_data()
+            self.main_window.statusBar().showMessage("Changes saved successfully.", 3000)
             
         except Exception as e:
             logger.exception("Error saving changes")
@@ -1680,8 +1754,72 @@ class DatabasePage:
                 f"Failed to save changes: {str(e)}"
             )
     
+    def _invalidate_graph_cache(self):
+        """Drop the graph page's cached plots, which may show the records just changed."""
+        graph_page = getattr(self.main_window, 'graph_page_handler', None)
+        if graph_page:
+            graph_page.clear_cached_plots()
+    
+    def _apply_detail_fields_to_record(self, record):
+        """
+        Copy the editable detail field values onto a (detached) record.
+        
+        Related objects are shared between rows loaded in the same session,
+        so every row showing e.g. the same PIA board sees the new values.
+        """
+        if isinstance(record, TestLog):
+            spec = self._TEST_LOG_FIELDS
+        elif isinstance(record, PCBABoard):
+            spec = self._PIA_BOARD_FIELDS
+        elif isinstance(record, PMT):
+            spec = self._PMT_FIELDS
+        elif isinstance(record, Manufacturer):
+            spec = self._MANUFACTURER_FIELDS
+        else:
+            return
+        
+        for _label, key, _column, attr_path, read_only in spec:
+            if read_only or key not in self.detail_fields:
+                continue
+            parent_path, _, attr = attr_path.rpartition('.')
+            target = _resolve_attr(record, parent_path) if parent_path else record
+            if target is not None:
+                setattr(target, attr, self.detail_fields[key].text() or None)
+    
+    def _refresh_edited_table_cells(self):
+        """Re-render the editable table columns, touching only cells whose text changed."""
+        first_item = self.table_view.item(0, 0)
+        record = first_item.data(Qt.ItemDataRole.UserRole) if first_item else None
+        columns = self._TABLE_EDITABLE_COLUMNS.get(type(record))
+        if not columns:
+            return
+        
+        # Keep rows in place while their text changes
+        sorting_enabled = self.table_view.isSortingEnabled()
+        self.table_view.setSortingEnabled(False)
+        try:
+            for row in range(self.table_view.rowCount()):
+                first_item = self.table_view.item(row, 0)
+                record = first_item.data(Qt.ItemDataRole.UserRole) if first_item else None
+                if record is None:
+                    continue
+                for col, attr_path in columns.items():
+                    item = self.table_view.item(row, col)
+                    text = _resolve_attr(record, attr_path) or 'N/A'
+                    if item and item.text() != text:
+                        item.setText(text)
+        finally:
+            self.table_view.setSortingEnabled(sorting_enabled)
+    
+    def _on_detail_field_edited(self, *_):
+        """Mark the detail panel as having unsaved user edits."""
+        self.is_dirty = True
+    
     def on_discard_changes(self):
         """Discard changes and reload the detail panel."""
+        # Nothing was edited - the panel already shows the record
+        if not self.is_dirty:
+            return
         if self.selected_record:
             self._populate_detail_panel(self.selected_record)
     
@@ -1722,6 +1860,7 @@ class DatabasePage:
                 if record:
                     session.delete(record)
             
+            self._invalidate_graph_cache()
             QMessageBox.information(
                 self.main_window,
                 "Success",
@@ -1787,10 +1926,6 @@ class DatabasePage:
             return
         
         try:
-            import subprocess
-            import sys
-            import tempfile
-            
             # Get the HTML content or path
             html_path = None
             if self.selected_record.html_path and os.path.exists(self.selected_record.html_path):
@@ -1861,8 +1996,6 @@ class DatabasePage:
     
     def _add_manufacturer_dialog(self):
         """Show dialog to add a new manufacturer."""
-        from PyQt6.QtWidgets import QDialog, QFormLayout, QDialogButtonBox
-        
         dialog = QDialog(self.main_window)
         dialog.setWindowTitle("Add Manufacturer")
         dialog.setMinimumWidth(400)
@@ -1903,14 +2036,20 @@ class DatabasePage:
             
             try:
                 with self.db.session_scope() as session:
-                    mfr = Manufacturer(
+                    # Single-row Core INSERT; no need for the ORM unit of work here.
+                    # The new id comes from the cursor's lastrowid (no RETURNING,
+                    # which SQLite only supports from 3.35)
+                    stmt = insert(Manufacturer).values(
                         name=name,
                         description=desc_edit.text().strip() or None,
                         website=website_edit.text().strip() or None,
                         contact_info=contact_edit.text().strip() or None
                     )
-                    session.add(mfr)
-                
+                    mfr_id = session.execute(stmt).inserted_primary_key[0]
+
+                logger.info(f"Added manufacturer '{name}' (id={mfr_id})")
+                self._invalidate_graph_cache()
+
                 QMessageBox.information(
                     self.main_window,
                     "Success",
@@ -1961,4 +2100,12 @@ class DatabasePage:
             self.query_thread.quit()
             self.query_thread.wait()
         
+        self._selection_timer.stop()
+        
+        for menu in (self._context_menu_test_logs, self._context_menu_generic):
+            if menu is not None:
+                menu.deleteLater()
+        self._context_menu_test_logs = None
+        self._context_menu_generic = None
+        
         logger.info("DatabasePage cleaned up")
@@ -7,26 +7,180 @@ Supports:
 - Relational mode: Measurement vs Measurement (Scatter, Line)
 - Plot Overlay mode: Overlaid line plots for waveform data
 """
+import functools
+import hashlib
 import logging
-from typing import Optional, List, Dict, Any
+import sys
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterable
 from datetime import datetime
-from collections import defaultdict
+from collections import OrderedDict
+from operator import itemgetter
 import numpy as np
+import pandas as pd
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QMessageBox, QProgressDialog,
-    QFileDialog, QApplication, QCompleter, QMenu
+    QFileDialog, QApplication, QCompleter, QMenu, QGraphicsItem
 )
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QDate, QTimer, QPointF
-from PyQt6.QtGui import QAction, QActionGroup
+from PyQt6.QtCore import QThread, QThreadPool, pyqtSignal, Qt, QDate, QTimer, QStringListModel
+from PyQt6.QtGui import QActionGroup
 import pyqtgraph as pg
+from sqlalchemy import distinct, func, select
 
-from src.database import DatabaseManager, PMT, TestLog, PCBABoard
-from src.database.database_worker import DatabaseQueryWorker
+from src.database import DatabaseManager, PMT, TestLog, PCBABoard, Spec
+from src.database.database_queries import Queries
+from src.database.database_worker import (
+    QUERY_CHUNK_SIZE, BackgroundTask, DatabaseQueryWorker, DatabaseTask, as_recarray,
+    take_measurement_columns
+)
 from src.gui.graph_generation.graph_config import GraphConfig, GraphType, ColorScheme, ComparisonMode
+from src.gui.graph_generation.graph_data_types import PairedPoint
+from src.gui.graph_generation.graph_utils import (
+    group_first_last, nearest_point_indexed, scatter_point_index, warm_up_kernels
+)
 
 logger = logging.getLogger(__name__)
 
+# Plotted coordinates are handed to Qt as float32: the painter works in
+# single precision anyway and sensor readings need far fewer than 7 digits.
+# Tooltips and exports read values from the measurements, not these arrays.
+PLOT_DTYPE = np.float32
+
+# The overlay plot draws many waveforms at once, so it renders through an
+# OpenGL viewport. Other plots are small and stay on the raster path.
+OVERLAY_USE_OPENGL = True
+
+# Generations (one per Generate click with distinct settings) and built plot
+# widgets kept for switching back without re-querying; least recently used
+# entries are dropped beyond this.
+PLOT_CACHE_SIZE = 32
+
+# Prepared (grouped, extracted) standard-plot data kept per input, so a
+# cosmetic option change or another display type of the same data skips
+# prepare_data and histogram binning. Bounded LRU.
+PREPARED_DATA_CACHE_SIZE = 16
+
+# Comparison/relational plots run their nearest-point hover search once the
+# cursor has paused this long (ms); moves in between only update the crosshair.
+HOVER_SEARCH_DELAY_MS = 16
+
+# GraphConfig fields that MeasurementGraphGenerator.prepare_data reads; any
+# other field only affects drawing and styling.
+PREPARED_DATA_FIELDS = (
+    'comparison_mode', 'group_by_field', 'auto_overlay_plots', 'remove_outliers',
+    'x_axis_field', 'x_axis_measurement', 'y_axis_measurement', 'y_axis_field',
+    'pairing_device', 'pairing_strategy', 'x_label', 'y_label',
+)
+
+# Relationships the _get_* accessors walk on every measurement. The query
+# (Spec_Queries.get_statement_multi) must load them, otherwise each row
+# lazy-loads them one SELECT at a time (or fails once the session is closed).
+REQUIRED_EAGER_LOADS = (
+    'sub_test',
+    'sub_test.test_log',
+    'sub_test.test_log.pia_board',
+    'sub_test.test_log.pmt_device',
+)
+
+# "X-Axis Values" combobox text -> (comparison x-axis field, axis label)
+X_AXIS_MAPPING = {
+    "Index (Default)": ("index", "Device Index"),
+    "PIA Serial Number": ("pia_serial", "PIA Serial Number"),
+    "PIA Part Number": ("pia_part", "PIA Part Number"),
+    "PMT Serial Number": ("pmt_serial", "PMT Serial Number"),
+    "PMT Batch Number": ("pmt_batch", "PMT Batch Number"),
+    "PMT Generation": ("pmt_generation", "PMT Generation"),
+    "Test Fixture": ("test_fixture", "Test Fixture"),
+    "Test Date": ("test_date", "Test Date"),
+}
+
+# "Group Values By" combobox text -> group-by field
+GROUP_BY_MAPPING = {
+    "PIA Serial Number": "pia_serial",
+    "PIA Part Number": "pia_part",
+    "PMT Serial Number": "pmt_serial",
+    "PMT Batch Number": "pmt_batch",
+    "PMT Generation": "pmt_generation",
+    "Test Fixture": "test_fixture",
+    "Test Date": "test_date",
+}
+
+# Series colors of grouped plots, assigned to groups in order
+GROUP_COLORS = (
+    '#2196F3', '#4CAF50', '#FF9800', '#E91E63', '#9C27B0',
+    '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#F44336',
+)
+
+# Pens and brushes are built once and shared by every plot (pyqtgraph copies
+# them into each item): scatter outline/fill, dotted connecting line, dashed
+# grouping box and series line per group color, ungrouped data and comparison series, y = x reference
+# line, spec limit lines as (horizontal, vertical) per limit type.
+GROUP_PENS = tuple(pg.mkPen(color, width=1) for color in GROUP_COLORS)
+GROUP_BRUSHES = tuple(pg.mkBrush(color) for color in GROUP_COLORS)
+GROUP_DOT_PENS = tuple(pg.mkPen(color, width=1, style=Qt.PenStyle.DotLine) for color in GROUP_COLORS)
+GROUP_BOX_PENS = tuple(pg.mkPen(color, width=1, style=Qt.PenStyle.DashLine) for color in GROUP_COLORS)
+GROUP_LINE_PENS = tuple(pg.mkPen(color, width=2) for color in GROUP_COLORS)
+NEUTRAL_DOT_PEN = pg.mkPen('#666666', width=1, style=Qt.PenStyle.DotLine)
+POSITIVE_DOT_PEN = pg.mkPen('#4CAF50', width=1, style=Qt.PenStyle.DotLine)
+NEGATIVE_DOT_PEN = pg.mkPen('#FF4444', width=1, style=Qt.PenStyle.DotLine)
+POSITIVE_BRUSH = pg.mkBrush('#4CAF50')
+NEGATIVE_BRUSH = pg.mkBrush('#FF4444')
+DATA_PEN = pg.mkPen('#2196F3', width=1)
+DATA_BRUSH = pg.mkBrush('#2196F3')
+DATA_LINE_PEN = pg.mkPen('#2196F3', width=2)
+COMPARISON_PEN = pg.mkPen('#4CAF50', width=1)
+COMPARISON_BRUSH = pg.mkBrush('#4CAF50')
+REFERENCE_LINE_PEN = pg.mkPen('#888888', width=2, style=Qt.PenStyle.DashLine)
+SPEC_LIMIT_PENS = {
+    'lower': (pg.mkPen('#FFA500', width=2, style=Qt.PenStyle.DashLine),
+              pg.mkPen('#FFA500', width=1, style=Qt.PenStyle.DotLine)),
+    'upper': (pg.mkPen('#FF4444', width=2, style=Qt.PenStyle.DashLine),
+              pg.mkPen('#FF4444', width=1, style=Qt.PenStyle.DotLine)),
+}
+CROSSHAIR_PEN = pg.mkPen('#888888', width=1, style=Qt.PenStyle.DashLine)
+
+# Group-by field -> value of that field for a TestLog
+_GROUP_EXTRACTORS: Dict[str, Callable[[Any], Optional[str]]] = {
+    'pia_serial': lambda tl: tl.pia_board.serial_number if tl.pia_board else None,
+    'pia_part': lambda tl: tl.pia_board.part_number if tl.pia_board else None,
+    'pmt_serial': lambda tl: tl.pmt_device.pmt_serial_number if tl.pmt_device else None,
+    'pmt_batch': lambda tl: tl.pmt_device.batch_number if tl.pmt_device else None,
+    'pmt_generation': lambda tl: (str(tl.pmt_device.generation)
+                                  if tl.pmt_device and tl.pmt_device.generation else None),
+    'test_fixture': lambda tl: tl.test_fixture,
+    'test_date': lambda tl: tl.created_at.strftime('%Y-%m-%d') if tl.created_at else None,
+}
+
+
+def _intern_str(value):
+    """Intern string group / X-axis values; they come from a small vocabulary."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _memoized_accessor(method):
+    """
+    Cache a GraphPage measurement accessor per measurement and arguments.
+
+    The cache (``GraphPage._accessor_cache``) is keyed by ``id(measurement)``
+    and holds the measurement itself, so an id reused by a new object is
+    detected. It is cleared at the start of each generate_graphs.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, measurement, *args):
+        entry = self._accessor_cache.get(id(measurement))
+        if entry is None or entry[0] is not measurement:
+            entry = (measurement, {})
+            self._accessor_cache[id(measurement)] = entry
+        values = entry[1]
+        key = (name,) + args
+        if key not in values:
+            values[key] = method(self, measurement, *args)
+        return values[key]
+
+    return wrapper
+
 
 class GraphMode:
     """Graph mode constants."""
@@ -86,23 +240,88 @@ class GraphPage:
         # Current plot widget
         self.current_plot = None
 
-        # Cached plots for quick switching
-        self.cached_plots: Dict[str, pg.PlotWidget] = {}
+        # Cached plots for quick switching, keyed by generation key + display
+        # type and ordered least recently shown first
+        self.cached_plots: Dict[tuple, pg.PlotWidget] = OrderedDict()
+
+        # Generations keyed by (mode, y, x, settings hash, data version): the
+        # measurements and deferred plot builders each set of plots came from
+        self._generations: Dict[tuple, dict] = OrderedDict()
+        self._generation_key: Optional[tuple] = None
+        self._pending_generation_key: Optional[tuple] = None
+
+        # Data version read by the last Generate; mode switches key cached
+        # generations with it instead of querying the database again
+        self._data_version: Optional[tuple] = None
+
+        # Plot label (what a plot was built from) -> key of the cached plot,
+        # so a new generation reuses any plot whose inputs did not change
+        self._plot_labels: Dict[tuple, tuple] = {}
+
+        # (prepared_data, original_data) of standard-plot generators keyed by
+        # prepared_data_key, least recently used first
+        self._prepared_data_cache: Dict[tuple, tuple] = OrderedDict()
+
+        # Bumped by clear_cached_plots; background results from an older epoch
+        # were prepared from rows that may have changed since and are dropped
+        self._cache_epoch = 0
+
+        # Deferred plot builders of the current generation, materialized on first display
+        self._plot_factories: Dict[str, Callable[[], Optional[pg.PlotWidget]]] = {}
 
         # Current mode and state
         self.current_mode = GraphMode.STANDARD
         self.current_measurements = None
         self.current_x_measurements = None  # For relational/comparison modes
+        self.current_columns: Optional[Dict[str, np.ndarray]] = None
+        self.current_x_columns: Optional[Dict[str, np.ndarray]] = None
 
         # Workers
         self.query_worker = None
         self.query_thread = None
-        self.x_query_worker = None
-        self.x_query_thread = None
+
+        # Pool for the short combo-populating lookups, so they run in
+        # parallel off the GUI thread. Signal objects of in-flight tasks are
+        # held here until their result has been delivered.
+        self._thread_pool = QThreadPool()
+        self._thread_pool.setMaxThreadCount(4)
+        self._pending_task_signals = set()
+
+        # Compile the numba kernels (hover search, first/last grouping) in the
+        # background instead of on the first hover
+        self.submit_task(warm_up_kernels, lambda _: None)
 
         # Progress dialog
         self.progress_dialog = None
 
+        # Per-measurement results of the _get_* accessors, see _memoized_accessor
+        self._accessor_cache: Dict[int, tuple] = {}
+
+        # Query progress is accumulated and applied at most once per frame:
+        # QProgressDialog.setValue on a modal dialog spins the event loop
+        self._progress_pending = 0
+        self._progress_timer = QTimer()
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self.flush_query_progress)
+
+        # Table fingerprint the filter combos were last populated for
+        self._filter_options_fingerprint = None
+
+        # One string model per filter combo, refreshed with a single setStringList()
+        self._filter_models: Dict[str, QStringListModel] = {}
+
+        # Spec names sorted once per database load and reused by the axis combos
+        self._all_spec_names_sorted: Tuple[str, ...] = ()
+        self._plot_spec_names_sorted: Tuple[str, ...] = ()
+
+        # Coalesce rapid Y-axis changes into a single paired-X reload
+        # once the selection settles
+        self._pair_reload_timer = QTimer()
+        self._pair_reload_timer.setSingleShot(True)
+        self._pair_reload_timer.setInterval(150)
+        self._pair_reload_timer.timeout.connect(self.load_paired_x_measurements)
+
         # Connect UI controls
         self.setup_connections()
 
@@ -152,6 +371,9 @@ class GraphPage:
         try:
             logger.info("Loading database data into UI...")
 
+            # Fetch and sort spec names once for all axis combo reloads
+            self.load_spec_names()
+
             # Load measurements for Y-axis
             self.load_y_axis_measurements()
 
@@ -175,6 +397,66 @@ class GraphPage:
         except Exception as e:
             logger.error(f"Error loading database data: {e}")
 
+    def submit_db_task(self, fn: Callable[[Any], Any], on_finished: Callable[[Any], None],
+                       on_error: Optional[Callable[[str], None]] = None):
+        """
+        Run ``fn(session)`` on the page thread pool.
+
+        ``on_finished`` receives the return value on the GUI thread;
+        ``on_error`` (optional) receives the error message.
+        """
+        self._start_task(DatabaseTask(self.db.get_new_session, fn), on_finished, on_error)
+
+    def submit_task(self, fn: Callable[[], Any], on_finished: Callable[[Any], None],
+                    on_error: Optional[Callable[[str], None]] = None):
+        """Run ``fn()`` on the page thread pool; callbacks as for ``submit_db_task``."""
+        self._start_task(BackgroundTask(fn), on_finished, on_error)
+
+    def _start_task(self, task, on_finished: Callable[[Any], None],
+                    on_error: Optional[Callable[[str], None]]):
+        """Keep the task's signals alive until it reports back, then start it."""
+        signals = task.signals
+        self._pending_task_signals.add(signals)
+
+        def finished(result):
+            self._pending_task_signals.discard(signals)
+            on_finished(result)
+
+        def failed(message: str):
+            self._pending_task_signals.discard(signals)
+            logger.error(f"Background task failed: {message}")
+            if on_error:
+                on_error(message)
+
+        signals.finished.connect(finished)
+        signals.error.connect(failed)
+        self._thread_pool.start(task)
+
+    def load_spec_names(self):
+        """Fetch spec names in the background and cache them presorted."""
+        self.submit_db_task(
+            lambda session: tuple(sorted(Queries(session).specs.get_all_spec_names())),
+            self.on_all_spec_names_loaded
+        )
+        self.submit_db_task(
+            lambda session: tuple(sorted(Queries(session).specs.get_plot_spec_names())),
+            self.on_plot_spec_names_loaded
+        )
+
+    def on_all_spec_names_loaded(self, spec_names: Tuple[str, ...]):
+        """Cache all spec names and refresh the Y-axis if it lists them."""
+        self._all_spec_names_sorted = spec_names
+        logger.info(f"Cached {len(spec_names)} spec names")
+        if self.current_mode != GraphMode.PLOT_OVERLAY:
+            self.load_y_axis_measurements()
+
+    def on_plot_spec_names_loaded(self, spec_names: Tuple[str, ...]):
+        """Cache plot spec names and refresh the Y-axis if it lists them."""
+        self._plot_spec_names_sorted = spec_names
+        logger.info(f"Cached {len(spec_names)} plot spec names")
+        if self.current_mode == GraphMode.PLOT_OVERLAY:
+            self.load_y_axis_measurements()
+
     def load_y_axis_measurements(self):
         """Load measurements into Y-axis combo box based on current mode."""
         try:
@@ -182,20 +464,19 @@ class GraphPage:
             if not hasattr(mw, 'graphs_y_axis_values_combobox'):
                 return
 
-            mw.graphs_y_axis_values_combobox.clear()
-
             if self.current_mode == GraphMode.PLOT_OVERLAY:
                 # Only show plot-type measurements
-                spec_names = self.db.queries.specs.get_plot_spec_names()
+                spec_names = self._plot_spec_names_sorted
                 if spec_names:
-                    mw.graphs_y_axis_values_combobox.addItems(sorted(spec_names))
+                    self._replace_items(mw.graphs_y_axis_values_combobox, spec_names)
+                    mw.graphs_y_axis_values_combobox.setEnabled(True)
                 else:
-                    mw.graphs_y_axis_values_combobox.addItem("No plot measurements available")
+                    self._replace_items(mw.graphs_y_axis_values_combobox, ["No plot measurements available"])
                     mw.graphs_y_axis_values_combobox.setEnabled(False)
             else:
                 # Show all measurements
-                spec_names = self.db.queries.specs.get_all_spec_names()
-                mw.graphs_y_axis_values_combobox.addItems(sorted(spec_names))
+                spec_names = self._all_spec_names_sorted
+                self._replace_items(mw.graphs_y_axis_values_combobox, spec_names)
                 mw.graphs_y_axis_values_combobox.setEnabled(True)
 
             logger.info(f"Loaded {len(spec_names)} measurements into Y-axis")
@@ -209,8 +490,6 @@ class GraphPage:
             if not hasattr(mw, 'graphs_x_axis_values_combobox'):
                 return
 
-            mw.graphs_x_axis_values_combobox.clear()
-
             if self.current_mode == GraphMode.STANDARD:
                 # Standard mode: grouping/ordering options
                 x_axis_options = [
@@ -223,7 +502,7 @@ class GraphPage:
                     "Test Fixture",
                     "Test Date"
                 ]
-                mw.graphs_x_axis_values_combobox.addItems(x_axis_options)
+                self._replace_items(mw.graphs_x_axis_values_combobox, x_axis_options)
                 mw.graphs_x_axis_values_combobox.setEnabled(True)
 
             elif self.current_mode == GraphMode.COMPARISON:
@@ -239,7 +518,7 @@ class GraphPage:
                     "Test Fixture",
                     "Test Date"
                 ]
-                mw.graphs_x_axis_values_combobox.addItems(x_axis_options)
+                self._replace_items(mw.graphs_x_axis_values_combobox, x_axis_options)
                 mw.graphs_x_axis_values_combobox.setEnabled(True)
 
             elif self.current_mode == GraphMode.RELATIONAL:
@@ -248,7 +527,7 @@ class GraphPage:
 
             elif self.current_mode == GraphMode.PLOT_OVERLAY:
                 # Plot overlay: X-axis not relevant
-                mw.graphs_x_axis_values_combobox.addItem("N/A (Plot Data)")
+                self._replace_items(mw.graphs_x_axis_values_combobox, ["N/A (Plot Data)"])
                 mw.graphs_x_axis_values_combobox.setEnabled(False)
 
             logger.info("Loaded X-axis options")
@@ -262,28 +541,30 @@ class GraphPage:
             if not hasattr(mw, 'graphs_x_axis_values_combobox'):
                 return
 
-            mw.graphs_x_axis_values_combobox.clear()
-
             # Get selected Y-axis measurement
             y_measurement = None
             if hasattr(mw, 'graphs_y_axis_values_combobox'):
                 y_measurement = mw.graphs_y_axis_values_combobox.currentText()
 
             if not y_measurement:
-                spec_names = self.db.queries.specs.get_all_spec_names()
-                mw.graphs_x_axis_values_combobox.addItems(sorted(spec_names))
+                self._replace_items(mw.graphs_x_axis_values_combobox, self._all_spec_names_sorted)
                 return
 
             # Get paired measurements
             paired_specs = self.db.queries.specs.get_paired_spec_names(y_measurement)
 
             if paired_specs:
-                # Remove Y measurement from options
-                paired_specs = [s for s in paired_specs if s != y_measurement]
-                mw.graphs_x_axis_values_combobox.addItems(sorted(paired_specs))
+                # Remove Y measurement from options, keeping the presorted order
+                paired = set(paired_specs)
+                paired.discard(y_measurement)
+                paired_specs = [s for s in self._all_spec_names_sorted if s in paired]
+                if len(paired_specs) != len(paired):
+                    # Specs added since the cache was loaded
+                    paired_specs = sorted(paired)
+                self._replace_items(mw.graphs_x_axis_values_combobox, paired_specs)
                 mw.graphs_x_axis_values_combobox.setEnabled(True)
             else:
-                mw.graphs_x_axis_values_combobox.addItem("No paired measurements")
+                self._replace_items(mw.graphs_x_axis_values_combobox, ["No paired measurements"])
                 mw.graphs_x_axis_values_combobox.setEnabled(False)
 
         except Exception as e:
@@ -304,8 +585,7 @@ class GraphPage:
                     "Test Fixture",
                     "Test Date"
                 ]
-                mw.graphs_group_values_by_combobox.clear()
-                mw.graphs_group_values_by_combobox.addItems(grouping_options)
+                self._replace_items(mw.graphs_group_values_by_combobox, grouping_options)
         except Exception as e:
             logger.error(f"Error loading grouping options: {e}")
 
@@ -318,47 +598,114 @@ class GraphPage:
                     "PIA Serial Number",
                     "PMT Serial Number"
                 ]
-                mw.graphs_pair_values_by_combobox.clear()
-                mw.graphs_pair_values_by_combobox.addItems(pairing_options)
+                self._replace_items(mw.graphs_pair_values_by_combobox, pairing_options)
         except Exception as e:
             logger.error(f"Error loading pairing options: {e}")
 
     def load_filter_options(self):
-        """Load all filter combo boxes with database values."""
-        try:
-            mw = self.main_window
+        """
+        Load all filter combo boxes with database values.
 
-            pia_serials = self.db.queries.pias.get_all_serial_numbers()
-            pia_parts = self.db.queries.pias.get_all_part_numbers()
-            pmt_serials = self.db.queries.pmts.get_all_serial_numbers()
-            pmt_batches = self.get_all_pmt_batches()
+        Runs in the background: the combos are only repopulated when the
+        board/PMT tables changed since the last load (see
+        ``get_filter_options_fingerprint``), and the four option queries
+        then run in parallel.
+        """
+        self.submit_db_task(
+            self.get_filter_options_fingerprint,
+            self.on_filter_options_fingerprint,
+            on_error=lambda message: self.on_filter_options_fingerprint(None)
+        )
 
-            self.populate_filter_combo(mw, 'graphs_filter_pia_serial_num_comboBox', pia_serials)
-            self.populate_filter_combo(mw, 'graphs_filter_pia_part_num_comboBox', pia_parts)
-            self.populate_filter_combo(mw, 'graphs_filter_pmt_serial_num_comboBox', pmt_serials)
-            self.populate_filter_combo(mw, 'graphs_filter_pmt_batch_id_comboBox', pmt_batches)
+    def on_filter_options_fingerprint(self, fingerprint: Optional[tuple]):
+        """Repopulate the filter combos unless the fingerprint is unchanged."""
+        if fingerprint is not None and fingerprint == self._filter_options_fingerprint:
+            logger.info("Filter options unchanged, keeping populated combos")
+            return
+        self._filter_options_fingerprint = fingerprint
+
+        loaders = {
+            'graphs_filter_pia_serial_num_comboBox':
+                lambda session: self._sorted_unique(Queries(session).pias.get_all_serial_numbers()),
+            'graphs_filter_pia_part_num_comboBox':
+                lambda session: self._sorted_unique(Queries(session).pias.get_all_part_numbers()),
+            'graphs_filter_pmt_serial_num_comboBox':
+                lambda session: self._sorted_unique(Queries(session).pmts.get_all_serial_numbers()),
+            'graphs_filter_pmt_batch_id_comboBox': self.get_all_pmt_batches,
+        }
+        for combo_name, loader in loaders.items():
+            self.submit_db_task(
+                loader,
+                lambda items, name=combo_name: self.populate_filter_combo(self.main_window, name, items),
+                on_error=self._forget_filter_options_fingerprint
+            )
 
-        except Exception as e:
-            logger.error(f"Error loading filter options: {e}")
+    def _forget_filter_options_fingerprint(self, message: str = ""):
+        """Force the next load_filter_options to repopulate (a combo failed to load)."""
+        self._filter_options_fingerprint = None
 
-    def get_all_pmt_batches(self) -> List[str]:
+    @staticmethod
+    def get_filter_options_fingerprint(session) -> tuple:
+        """
+        Cheap change marker for the filter option tables.
+
+        Returns (max id, row count) of the PIA board and PMT tables.
+        """
+        pia_key = session.query(func.max(PCBABoard.id), func.count(PCBABoard.id)).one()
+        pmt_key = session.query(func.max(PMT.id), func.count(PMT.id)).one()
+        return tuple(pia_key) + tuple(pmt_key)
+
+    @classmethod
+    def get_all_pmt_batches(cls, session) -> List[str]:
         """Get all unique PMT batches from database."""
-        try:
-            with self.db.session_scope() as session:
-                from sqlalchemy import distinct
-                batches = session.query(distinct(PMT.batch_number)).all()
-                return sorted([b[0] for b in batches if b[0]])
-        except Exception as e:
-            logger.error(f"Error getting PMT batches: {e}")
+        batches = session.query(distinct(PMT.batch_number)).all()
+        return cls._sorted_unique([b[0] for b in batches])
+
+    @staticmethod
+    def _sorted_unique(values: List[Optional[str]]) -> List[str]:
+        """Sorted, de-duplicated, non-empty strings."""
+        values = [v for v in values if v]
+        if not values:
             return []
+        return np.unique(np.asarray(values, dtype=str)).tolist()
 
     def populate_filter_combo(self, main_window, combo_name: str, items: List[str]):
-        """Populate a filter combo box with items."""
+        """
+        Populate a filter combo box with items.
+
+        Each combo is backed by its own QStringListModel, so a refresh is one
+        setStringList() call instead of a clear() plus per-item inserts.
+        """
         if hasattr(main_window, combo_name):
             combo = getattr(main_window, combo_name)
-            combo.clear()
-            combo.addItem("All")
-            combo.addItems(items)
+            if combo_name not in self._filter_models:
+                model = QStringListModel(combo)
+                self._filter_models[combo_name] = model
+                combo.setModel(model)
+            self._replace_items(combo, ["All"] + list(items))
+
+    @staticmethod
+    def _replace_items(combo, items):
+        """
+        Replace the items of a combo box, emitting currentTextChanged once.
+
+        Signals are blocked while the items change, so listeners see only the
+        final selection instead of one change per inserted item. Combos backed
+        by a QStringListModel are refreshed with a single setStringList().
+        """
+        combo.blockSignals(True)
+        try:
+            model = combo.model()
+            if isinstance(model, QStringListModel):
+                model.setStringList(list(items))
+            else:
+                combo.clear()
+                combo.addItems(list(items))
+            if combo.currentIndex() < 0 and combo.count() > 0:
+                combo.setCurrentIndex(0)
+        finally:
+            combo.blockSignals(False)
+        combo.currentTextChanged.emit(combo.currentText())
 
     def update_display_type_options(self):
         """Update display type combo box based on current mode."""
@@ -411,8 +758,8 @@ class GraphPage:
         elif "Overlay" in mode_text or "Plot" in mode_text:
             self.current_mode = GraphMode.PLOT_OVERLAY
 
-        # Clear cached plots when mode changes
-        self.clear_cached_plots()
+        # Drop any paired-X reload still pending from the previous mode
+        self._pair_reload_timer.stop()
 
         # Update UI
         self.update_display_type_options()
@@ -422,6 +769,15 @@ class GraphPage:
         # Show/hide comparison controls
         self.update_comparison_controls_visibility()
 
+        # Cached plots are kept across mode changes; show them again if this
+        # mode was already generated with the current settings
+        self.flush_pair_reload()
+        y_measurement = ""
+        if hasattr(self.main_window, 'graphs_y_axis_values_combobox'):
+            y_measurement = self.main_window.graphs_y_axis_values_combobox.currentText()
+        if y_measurement:
+            self.restore_generation(self.build_generation_key(y_measurement, self.build_query_filters()))
+
     def on_display_type_changed(self, display_type: str):
         """Handle display type change - switch to cached plot."""
         if not display_type:
@@ -429,17 +785,24 @@ class GraphPage:
 
         logger.info(f"Display type changed to: {display_type}")
 
-        # Check if we have a cached plot for this type
-        if display_type in self.cached_plots:
-            self.display_plot(self.cached_plots[display_type])
+        # Use the cached plot, building it on first request
+        try:
+            plot = self._get_or_build_plot(display_type)
+        except Exception as e:
+            logger.exception(f"Error building {display_type} plot")
+            self.show_error("Error", f"Failed to generate graph: {e}")
+            return
+
+        if plot:
+            self.display_plot(plot)
         else:
             logger.warning(f"No cached plot for: {display_type}")
 
     def on_y_axis_changed(self, y_measurement: str):
         """Handle Y-axis measurement change."""
         if self.current_mode == GraphMode.RELATIONAL:
-            # Update X-axis with paired measurements
-            self.load_paired_x_measurements()
+            # Update X-axis with paired measurements (debounced)
+            self._pair_reload_timer.start()
 
     def update_comparison_controls_visibility(self):
         """Show/hide and populate comparison-specific controls."""
@@ -452,8 +815,7 @@ class GraphPage:
 
             if is_comparison:
                 # Populate with comparison options
-                mw.graphs_pair_values_by_combobox.clear()
-                mw.graphs_pair_values_by_combobox.addItems([
+                self._replace_items(mw.graphs_pair_values_by_combobox, [
                     CompareBy.MANUFACTURER,
                     CompareBy.TEST_FIXTURE,
                     CompareBy.FIRST_LAST,
@@ -483,6 +845,17 @@ class GraphPage:
 
         logger.info(f"Generating graph for Y-axis: {y_measurement}")
 
+        # Apply a paired-X reload still waiting on the debounce
+        self.flush_pair_reload()
+
+        # Build filters
+        filters = self.build_query_filters()
+
+        # An explicit Generate always re-queries (records may have been edited);
+        # the new generation replaces any cached one with the same key
+        self._data_version = self.get_data_version()
+        self._pending_generation_key = self.build_generation_key(y_measurement, filters)
+
         # Show progress dialog
         self.progress_dialog = QProgressDialog(
             "Querying database...", "Cancel", 0, 100, self.main_window
@@ -490,12 +863,6 @@ class GraphPage:
         self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
         self.progress_dialog.show()
 
-        # Build filters
-        filters = self.build_query_filters()
-
-        # Clear cached plots
-        self.clear_cached_plots()
-
         # Query based on mode
         if self.current_mode == GraphMode.RELATIONAL:
             # Relational mode: Need to query both Y and X measurements
@@ -509,12 +876,102 @@ class GraphPage:
                     self.progress_dialog.close()
                 return
 
-            self.query_both_measurements(y_measurement, x_measurement, filters)
+            self.query_database(y_measurement, filters, x_spec_name=x_measurement)
         else:
             # Standard, Comparison, or Plot Overlay - only Y measurement needed
             # For Comparison mode, manufacturer data is fetched separately
             self.query_database(y_measurement, filters)
 
+    def flush_pair_reload(self):
+        """Run a paired-X reload still waiting on the debounce timer now."""
+        if self._pair_reload_timer.isActive():
+            self._pair_reload_timer.stop()
+            self.load_paired_x_measurements()
+
+    def build_generation_key(self, y_measurement: str, filters: dict) -> tuple:
+        """
+        Cache key for the plots a Generate click would produce.
+
+        (mode, Y measurement, X-axis selection, settings hash, data version).
+        The hash covers the query filters and the grouping/compare/label
+        options the plots are built with; the data version changes when
+        results are imported, so cached plots never hide new data. It is the
+        version read by the last Generate (no query here); edits made on the
+        database page clear the cache (clear_cached_plots).
+        """
+        options = self.get_graph_options()
+        settings = repr(sorted(filters.items())) + repr(sorted(options.items()))
+        settings_hash = hashlib.blake2b(settings.encode(), digest_size=8).hexdigest()
+
+        return (self.current_mode, y_measurement, options.get('graphs_x_axis_values_combobox', ""),
+                settings_hash, self._data_version)
+
+    def get_graph_options(self) -> dict:
+        """Current X-axis, grouping, compare-by and label options the plots are built with."""
+        mw = self.main_window
+        options = {}
+        for attr in ('graphs_x_axis_values_combobox', 'graphs_group_values_by_combobox',
+                     'graphs_pair_values_by_combobox'):
+            if hasattr(mw, attr):
+                options[attr] = getattr(mw, attr).currentText()
+        for attr in ('graphs_title_lineEdit', 'graphs_x_label_lineEdit', 'graphs_y_label_lineEdit'):
+            if hasattr(mw, attr):
+                options[attr] = getattr(mw, attr).text()
+        if hasattr(mw, 'show_box_groupings_pushButton'):
+            options['show_box_groupings_pushButton'] = mw.show_box_groupings_pushButton.isChecked()
+        return options
+
+    def compute_plot_label(self, y_measurements: list, x_measurements: Optional[list] = None) -> tuple:
+        """
+        Label of the plots built from these measurements with the current options.
+
+        (mode, Y ids digest, X ids digest, options hash); append the display
+        type for a single plot. Two generations with the same label draw
+        identical plots, whatever filters or query produced the rows.
+        """
+        options = repr(sorted(self.get_graph_options().items()))
+        options_hash = hashlib.blake2b(options.encode(), digest_size=8).hexdigest()
+        return (self.current_mode, self._ids_digest(y_measurements), self._ids_digest(x_measurements),
+                options_hash)
+
+    @staticmethod
+    def _ids_digest(measurements: Optional[list]) -> str:
+        """Short digest of the measurement ids, in order."""
+        ids = np.fromiter((m.id for m in measurements or ()), dtype=np.int64)
+        return hashlib.blake2b(ids.tobytes(), digest_size=8).hexdigest()
+
+    @classmethod
+    def prepared_data_key(cls, config: GraphConfig) -> tuple:
+        """
+        Key of the data MeasurementGraphGenerator.prepare_data derives from ``config``.
+
+        Only scatter plots lay points out by index, so Line and Histogram of
+        the same measurements share one entry.
+        """
+        index_x = config.x_axis_use_indices and config.graph_type == GraphType.SCATTER
+        return (
+            cls._ids_digest(config.measurements),
+            index_x,
+            tuple(getattr(config, name) for name in PREPARED_DATA_FIELDS),
+        )
+
+    def get_data_version(self) -> Optional[tuple]:
+        """
+        Highest test log and spec ids; they change whenever results are imported.
+
+        One round trip of two primary-key lookups. Read once per Generate
+        (see ``_data_version``); edits on the database page clear the plot
+        cache instead.
+        """
+        try:
+            with self.db.session_scope() as session:
+                stmt = select(select(func.max(TestLog.id)).scalar_subquery(),
+                              select(func.max(Spec.id)).scalar_subquery())
+                return tuple(session.execute(stmt).one())
+        except Exception as e:
+            logger.error(f"Error reading data version: {e}")
+            return None
+
     def build_query_filters(self) -> dict:
         """Build filter dictionary from UI elements."""
         mw = self.main_window
@@ -556,8 +1013,13 @@ class GraphPage:
         logger.info(f"Built query filters: {filters}")
         return filters
 
-    def query_database(self, spec_name: str, filters: dict):
-        """Query database for single measurement."""
+    def query_database(self, spec_name: str, filters: dict, x_spec_name: Optional[str] = None):
+        """
+        Query database for a measurement.
+
+        When ``x_spec_name`` is given (relational mode) both specs are fetched
+        by a single statement and split by name once the worker finishes.
+        """
         try:
             # Build date filter tuple if from_date is provided
             date_filter = None
@@ -567,8 +1029,9 @@ class GraphPage:
                 end_date = datetime.now()
                 date_filter = (from_date, end_date)
 
-            stmt = self.db.queries.specs.get_statement(
-                spec_name=spec_name,
+            spec_names = [spec_name] if x_spec_name is None else [spec_name, x_spec_name]
+            stmt = self.db.queries.specs.get_statement_multi(
+                spec_names,
                 include_only_full_tests=filters.get('full_test_only', False),
                 filter_by_pia_serial_number=filters.get('pia_serial'),
                 filter_by_pia_part_number=filters.get('pia_part'),
@@ -584,62 +1047,16 @@ class GraphPage:
             self.query_thread.started.connect(self.query_worker.run)
             self.query_worker.init_progress.connect(self.on_query_progress_init)
             self.query_worker.increment_progress.connect(self.on_query_progress_increment)
-            self.query_worker.finished.connect(lambda m: self.on_query_finished(m, filters))
-            self.query_worker.error.connect(self.on_query_error)
-
-            if self.progress_dialog:
-                self.progress_dialog.canceled.connect(self.query_worker.cancel)
-
-            self.query_thread.start()
-            logger.info(f"Started database query for: {spec_name}")
-
-        except Exception as e:
-            logger.exception("Error querying database")
-            self.cleanup_query_thread()
-            if self.progress_dialog:
-                self.progress_dialog.close()
-            self.show_error("Error", f"Database query failed: {e}")
-
-    def query_both_measurements(self, y_spec: str, x_spec: str, filters: dict):
-        """Query database for both Y and X measurements (comparison/relational mode)."""
-        try:
-            # Store X spec for later
-            self._pending_x_spec = x_spec
-            self._pending_filters = filters
-
-            # Build date filter tuple if from_date is provided
-            date_filter = None
-            if filters.get('from_date'):
-                from_date = filters['from_date']
-                end_date = datetime.now()
-                date_filter = (from_date, end_date)
-
-            # Query Y measurement first
-            stmt = self.db.queries.specs.get_statement(
-                spec_name=y_spec,
-                include_only_full_tests=filters.get('full_test_only', False),
-                filter_by_pia_serial_number=filters.get('pia_serial'),
-                filter_by_pia_part_number=filters.get('pia_part'),
-                filter_by_pmt=filters.get('pmt_serial'),
-                filter_by_pmt_batch=filters.get('pmt_batch'),
-                filter_by_dates=date_filter
+            self.query_worker.finished.connect(
+                lambda m, columns: self.on_query_finished(m, columns, filters, spec_name, x_spec_name)
             )
-
-            self.query_worker = DatabaseQueryWorker(stmt)
-            self.query_thread = QThread()
-            self.query_worker.moveToThread(self.query_thread)
-
-            self.query_thread.started.connect(self.query_worker.run)
-            self.query_worker.init_progress.connect(self.on_query_progress_init)
-            self.query_worker.increment_progress.connect(self.on_query_progress_increment)
-            self.query_worker.finished.connect(self.on_y_query_finished)
             self.query_worker.error.connect(self.on_query_error)
 
             if self.progress_dialog:
                 self.progress_dialog.canceled.connect(self.query_worker.cancel)
 
             self.query_thread.start()
-            logger.info(f"Started Y-axis query for: {y_spec}")
+            logger.info(f"Started database query for: {', '.join(spec_names)}")
 
         except Exception as e:
             logger.exception("Error querying database")
@@ -648,97 +1065,64 @@ class GraphPage:
                 self.progress_dialog.close()
             self.show_error("Error", f"Database query failed: {e}")
 
-    def on_y_query_finished(self, y_measurements: list):
-        """Handle Y measurement query completion, then query X."""
-        logger.info(f"Y-axis query finished: {len(y_measurements)} measurements")
-        self.cleanup_query_thread()
-
-        if not y_measurements:
-            if self.progress_dialog:
-                self.progress_dialog.close()
-            self.show_info("No Data", "No Y-axis measurements found.")
-            return
-
-        # Store Y measurements
-        self._pending_y_measurements = y_measurements
-
-        # Now query X measurement
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Querying X-axis data...")
-
-        try:
-            # Build date filter tuple
-            date_filter = None
-            if self._pending_filters.get('from_date'):
-                from_date = self._pending_filters['from_date']
-                end_date = datetime.now()
-                date_filter = (from_date, end_date)
-
-            stmt = self.db.queries.specs.get_statement(
-                spec_name=self._pending_x_spec,
-                include_only_full_tests=self._pending_filters.get('full_test_only', False),
-                filter_by_pia_serial_number=self._pending_filters.get('pia_serial'),
-                filter_by_pia_part_number=self._pending_filters.get('pia_part'),
-                filter_by_pmt=self._pending_filters.get('pmt_serial'),
-                filter_by_pmt_batch=self._pending_filters.get('pmt_batch'),
-                filter_by_dates=date_filter
-            )
-
-            self.x_query_worker = DatabaseQueryWorker(stmt)
-            self.x_query_thread = QThread()
-            self.x_query_worker.moveToThread(self.x_query_thread)
-
-            self.x_query_thread.started.connect(self.x_query_worker.run)
-            self.x_query_worker.finished.connect(self.on_x_query_finished)
-            self.x_query_worker.error.connect(self.on_query_error)
-
-            self.x_query_thread.start()
-
-        except Exception as e:
-            logger.exception("Error querying X measurement")
-            if self.progress_dialog:
-                self.progress_dialog.close()
-            self.show_error("Error", f"X-axis query failed: {e}")
-
-    def on_x_query_finished(self, x_measurements: list):
-        """Handle X measurement query completion."""
-        logger.info(f"X-axis query finished: {len(x_measurements)} measurements")
-
-        # Cleanup X query thread
-        if self.x_query_thread:
-            self.x_query_thread.quit()
-            self.x_query_thread.wait()
-            self.x_query_thread = None
-            self.x_query_worker = None
-
-        if not x_measurements:
-            if self.progress_dialog:
-                self.progress_dialog.close()
-            self.show_info("No Data", "No X-axis measurements found.")
-            return
-
-        # Apply test selection filter
-        y_measurements = self.apply_test_selection(self._pending_y_measurements, self._pending_filters)
-        x_measurements = self.apply_test_selection(x_measurements, self._pending_filters)
-
-        # Generate graph with both measurements
-        self.generate_graphs(y_measurements, x_measurements)
-
     def on_query_progress_init(self, total: int):
         """Initialize progress bar."""
+        self._progress_timer.stop()
+        self._progress_pending = 0
         if self.progress_dialog:
             self.progress_dialog.setMaximum(total)
             self.progress_dialog.setValue(0)
 
-    def on_query_progress_increment(self):
-        """Increment progress bar."""
-        if self.progress_dialog:
-            self.progress_dialog.setValue(self.progress_dialog.value() + 1)
+    def on_query_progress_increment(self, count: int = 1):
+        """Record rows the worker just processed; the bar catches up on the next refresh."""
+        self._progress_pending += count
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def flush_query_progress(self):
+        """Advance progress bar by the rows reported since the last refresh."""
+        self._progress_timer.stop()
+        count, self._progress_pending = self._progress_pending, 0
+        if self.progress_dialog and count:
+            self.progress_dialog.setValue(self.progress_dialog.value() + count)
+
+    def on_query_finished(self, measurements: list, columns: Dict[str, np.ndarray], filters: dict,
+                          spec_name: Optional[str] = None, x_spec_name: Optional[str] = None):
+        """
+        Handle query completion, splitting Y/X rows in relational mode.
 
-    def on_query_finished(self, measurements: list, filters: dict):
-        """Handle query completion for single measurement mode."""
+        ``columns`` holds the worker's parallel NumPy arrays for
+        ``measurements`` (see ``empty_measurement_columns``).
+        """
         logger.info(f"Query finished: {len(measurements)} measurements")
         self.cleanup_query_thread()
+        self.flush_query_progress()
+        self.current_columns = columns
+
+        if x_spec_name is not None:
+            y_idx = np.flatnonzero(columns['name'] == spec_name)
+            x_idx = np.flatnonzero(columns['name'] == x_spec_name)
+            y_measurements = [measurements[i] for i in y_idx]
+            x_measurements = [measurements[i] for i in x_idx]
+            self.current_columns = take_measurement_columns(columns, y_idx)
+            self.current_x_columns = take_measurement_columns(columns, x_idx)
+            logger.info(f"Split into {len(y_measurements)} Y and {len(x_measurements)} X measurements")
+
+            if not y_measurements or not x_measurements:
+                if self.progress_dialog:
+                    self.progress_dialog.close()
+                axis = "Y-axis" if not y_measurements else "X-axis"
+                self.show_info("No Data", f"No {axis} measurements found.")
+                return
+
+            y_measurements, self.current_columns = self.apply_test_selection(
+                y_measurements, filters, self.current_columns
+            )
+            x_measurements, self.current_x_columns = self.apply_test_selection(
+                x_measurements, filters, self.current_x_columns
+            )
+            self.generate_graphs(y_measurements, x_measurements)
+            return
 
         if not measurements:
             if self.progress_dialog:
@@ -746,7 +1130,7 @@ class GraphPage:
             self.show_info("No Data", "No measurements found.")
             return
 
-        measurements = self.apply_test_selection(measurements, filters)
+        measurements, self.current_columns = self.apply_test_selection(measurements, filters, columns)
 
         if not measurements:
             if self.progress_dialog:
@@ -764,43 +1148,84 @@ class GraphPage:
             self.progress_dialog.close()
         self.show_error("Database Error", f"Query failed: {error_msg}")
 
-    def apply_test_selection(self, measurements: list, filters: dict) -> list:
-        """Apply first/last test selection filter."""
+    def apply_test_selection(self, measurements: list, filters: dict,
+                             columns: Optional[Dict[str, np.ndarray]] = None) -> Tuple[list, Optional[Dict[str, np.ndarray]]]:
+        """
+        Apply first/last test selection filter.
+
+        Returns the selected measurements and the matching rows of ``columns``.
+        With columns the per-device reduction runs in NumPy; without them it
+        falls back to grouping the ORM objects in Python (columns stay None).
+        """
         test_selection = filters.get('test_selection', 'all')
 
         if test_selection == 'all':
-            return measurements
+            return measurements, columns
 
-        device_tests = defaultdict(list)
+        if columns is not None and len(columns['pia_serial']) == len(measurements):
+            indices = self._select_test_indices(columns, test_selection)
+            logger.info(f"Test selection '{test_selection}': {len(measurements)} -> {len(indices)}")
+            return [measurements[i] for i in indices], take_measurement_columns(columns, indices)
+
+        # Single pass keeping the earliest/latest test per device; ties keep
+        # the first row for 'first' and the last row for 'last'
+        latest = test_selection == 'last'
+        best = {}
         for m in measurements:
             device_id = self._get_device_id(m)
-            if device_id:
-                device_tests[device_id].append(m)
+            if not device_id:
+                continue
+            created_at = m.created_at or datetime.min
+            current = best.get(device_id)
+            if current is None or (created_at >= current[0] if latest else created_at < current[0]):
+                best[device_id] = (created_at, m)
 
-        filtered = []
-        for device_id, device_measurements in device_tests.items():
-            sorted_measurements = sorted(
-                device_measurements,
-                key=lambda m: m.created_at if m.created_at else datetime.min
-            )
-            if test_selection == 'first':
-                filtered.append(sorted_measurements[0])
-            elif test_selection == 'last':
-                filtered.append(sorted_measurements[-1])
+        filtered = [m for _, m in best.values()] if test_selection in ('first', 'last') else []
 
         logger.info(f"Test selection '{test_selection}': {len(measurements)} -> {len(filtered)}")
-        return filtered
+        return filtered, None
+
+    def _select_test_indices(self, columns: Dict[str, np.ndarray], test_selection: str) -> np.ndarray:
+        """
+        Row indices of the first or last test per PIA serial number.
+
+        Rows without a serial are dropped and missing dates sort first, as in
+        the list-based path. Devices come back in order of first appearance.
+        """
+        rows = np.flatnonzero(columns['pia_serial'].astype(bool))
+        first, last, _ = self._grouped_first_last(columns, rows)
+        return first if test_selection == 'first' else last
+
+    @staticmethod
+    def _grouped_first_last(columns: Dict[str, np.ndarray], rows: np.ndarray,
+                            key: str = 'pia_serial') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Earliest/latest row per device among ``rows``, devices keyed by ``columns[key]``.
+
+        Returns (first_rows, last_rows, counts) with one entry per device, in
+        order of first appearance. NaT dates count as the earliest.
+        """
+        if len(rows) == 0:
+            return rows, rows, rows
+
+        _, first_seen, codes = np.unique(columns[key][rows], return_index=True, return_inverse=True)
+        times = columns['created_at'][rows].astype(np.int64)
+        first, last, counts = group_first_last(codes, times, len(first_seen))
 
+        order = np.argsort(first_seen, kind='stable')
+        return rows[first[order]], rows[last[order]], counts[order]
+
+    @_memoized_accessor
     def _get_device_id(self, measurement) -> Optional[str]:
         """Get device identifier from measurement."""
-        try:
-            if hasattr(measurement, 'sub_test') and measurement.sub_test:
-                if hasattr(measurement.sub_test, 'test_log') and measurement.sub_test.test_log:
-                    if hasattr(measurement.sub_test.test_log, 'pia_board') and measurement.sub_test.test_log.pia_board:
-                        return measurement.sub_test.test_log.pia_board.serial_number
-        except:
-            pass
-        return None
+        pia_board = getattr(self._test_log_of(measurement), 'pia_board', None)
+        return pia_board.serial_number if pia_board else None
+
+    @staticmethod
+    def _test_log_of(measurement):
+        """Test log of a measurement, or None when it has no sub test / test log."""
+        sub_test = getattr(measurement, 'sub_test', None)
+        return getattr(sub_test, 'test_log', None) if sub_test else None
 
     def cleanup_query_thread(self):
         """Clean up query thread."""
@@ -815,47 +1240,63 @@ class GraphPage:
     def generate_graphs(self, y_measurements: list, x_measurements: list = None):
         """Generate all plot types for the current mode."""
         try:
+            self._check_eager_loads(y_measurements)
+            self._check_eager_loads(x_measurements)
+
             self.current_measurements = y_measurements
             self.current_x_measurements = x_measurements
+            self._accessor_cache.clear()
 
             if self.progress_dialog:
                 self.progress_dialog.setLabelText("Generating plots...")
-            QApplication.processEvents()
 
-            # Clear existing cached plots
-            self.clear_cached_plots()
+            # Start a cache entry for this generation's plots
+            self._begin_generation(self._pending_generation_key, y_measurements, x_measurements)
+            self._pending_generation_key = None
 
             # Generate plots based on mode
             if self.current_mode == GraphMode.STANDARD:
                 self._generate_standard_plots(y_measurements)
             elif self.current_mode == GraphMode.COMPARISON:
+                # Pairing runs on the thread pool; it finishes the generation itself
                 self._generate_comparison_plots(y_measurements, x_measurements)
+                return
             elif self.current_mode == GraphMode.RELATIONAL:
+                # Likewise for relational pairing
                 self._generate_relational_plots(y_measurements, x_measurements)
+                return
             elif self.current_mode == GraphMode.PLOT_OVERLAY:
                 self._generate_overlay_plot(y_measurements)
 
-            # Close progress dialog
-            if self.progress_dialog:
-                self.progress_dialog.close()
+            self._finish_generation(y_measurements)
 
-            # Display the first/default plot
-            self._display_default_plot()
+        except Exception as e:
+            logger.exception("Error generating graphs")
+            self._fail_generation(e)
 
-            # Populate spec line selectors
-            if y_measurements:
-                self.populate_spec_line_selectors(y_measurements)
+    def _finish_generation(self, y_measurements: list):
+        """Show the default plot and close out a generation once its factories exist."""
+        # Display the first/default plot (built here if it was deferred)
+        self._display_default_plot()
 
-            # Update page subtitle
-            self.update_page_subtitle()
+        # Close progress dialog
+        if self.progress_dialog:
+            self.progress_dialog.close()
 
-            logger.info("Graph generation complete")
+        # Populate spec line selectors
+        if y_measurements:
+            self.populate_spec_line_selectors(y_measurements)
 
-        except Exception as e:
-            logger.exception("Error generating graphs")
-            if self.progress_dialog:
-                self.progress_dialog.close()
-            self.show_error("Error", f"Failed to generate graph: {e}")
+        # Update page subtitle
+        self.update_page_subtitle()
+
+        logger.info("Graph generation complete")
+
+    def _fail_generation(self, error):
+        """Report a failed generation and close the progress dialog."""
+        if self.progress_dialog:
+            self.progress_dialog.close()
+        self.show_error("Error", f"Failed to generate graph: {error}")
 
     def _generate_standard_plots(self, measurements: list):
         """Generate Scatter, Line, and Histogram plots."""
@@ -863,31 +1304,29 @@ class GraphPage:
 
         base_config = self._build_base_config(measurements)
 
-        # Scatter plot
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Scatter Plot...")
-        QApplication.processEvents()
-
-        scatter_config = GraphConfig(**{**base_config, 'graph_type': GraphType.SCATTER})
-        self.cached_plots[DisplayType.SCATTER] = self._create_plot(scatter_config)
-
-        # Line plot
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Line Plot...")
-        QApplication.processEvents()
+        def factory(graph_type: GraphType):
+            return lambda: self._create_plot(GraphConfig(**{**base_config, 'graph_type': graph_type}))
 
-        line_config = GraphConfig(**{**base_config, 'graph_type': GraphType.LINE})
-        self.cached_plots[DisplayType.LINE] = self._create_plot(line_config)
+        # Only the displayed plot gets built; the rest wait for a display type switch
+        self._plot_factories[DisplayType.SCATTER] = factory(GraphType.SCATTER)
+        self._plot_factories[DisplayType.LINE] = factory(GraphType.LINE)
+        self._plot_factories[DisplayType.HISTOGRAM] = factory(GraphType.HISTOGRAM)
 
-        # Histogram
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Histogram...")
-        QApplication.processEvents()
-
-        histogram_config = GraphConfig(**{**base_config, 'graph_type': GraphType.HISTOGRAM})
-        self.cached_plots[DisplayType.HISTOGRAM] = self._create_plot(histogram_config)
+        logger.info("Registered standard plots: Scatter, Line, Histogram")
 
-        logger.info("Generated standard plots: Scatter, Line, Histogram")
+        # The displayed plot prepares its data on this thread right away; the
+        # others prepare theirs in the background so switching only draws
+        mw = self.main_window
+        displayed = None
+        if hasattr(mw, 'display_graph_type_comboBox'):
+            displayed = mw.display_graph_type_comboBox.currentText()
+        graph_types = {DisplayType.SCATTER: GraphType.SCATTER, DisplayType.LINE: GraphType.LINE,
+                       DisplayType.HISTOGRAM: GraphType.HISTOGRAM}
+        configs = {display_type: GraphConfig(**{**base_config, 'graph_type': graph_type})
+                   for display_type, graph_type in graph_types.items()}
+        displayed_key = self.prepared_data_key(configs[displayed]) if displayed in configs else None
+        self._prefetch_prepared_data(config for display_type, config in configs.items()
+                                     if self.prepared_data_key(config) != displayed_key)
 
     def _generate_comparison_plots(self, y_measurements: list, x_measurements: list = None):
         """
@@ -913,6 +1352,7 @@ class GraphPage:
         spec_name = y_measurements[0].name if y_measurements else None
         if not spec_name:
             logger.warning("No measurement name for comparison")
+            self._finish_generation(y_measurements)
             return
 
         # Get "Compare By" selection
@@ -925,48 +1365,54 @@ class GraphPage:
         x_axis_label = 'Device Index'
         if hasattr(mw, 'graphs_x_axis_values_combobox'):
             x_axis_text = mw.graphs_x_axis_values_combobox.currentText()
-            x_axis_mapping = {
-                "Index (Default)": ("index", "Device Index"),
-                "PIA Serial Number": ("pia_serial", "PIA Serial Number"),
-                "PIA Part Number": ("pia_part", "PIA Part Number"),
-                "PMT Serial Number": ("pmt_serial", "PMT Serial Number"),
-                "PMT Batch Number": ("pmt_batch", "PMT Batch Number"),
-                "PMT Generation": ("pmt_generation", "PMT Generation"),
-                "Test Fixture": ("test_fixture", "Test Fixture"),
-                "Test Date": ("test_date", "Test Date")
-            }
-            if x_axis_text in x_axis_mapping:
-                x_axis_field, x_axis_label = x_axis_mapping[x_axis_text]
+            if x_axis_text in X_AXIS_MAPPING:
+                x_axis_field, x_axis_label = X_AXIS_MAPPING[x_axis_text]
 
         # Get grouping option
         group_by_field = None
         if hasattr(mw, 'graphs_group_values_by_combobox'):
             group_by_text = mw.graphs_group_values_by_combobox.currentText()
             if group_by_text and group_by_text != "None":
-                group_mapping = {
-                    "PIA Serial Number": "pia_serial",
-                    "PIA Part Number": "pia_part",
-                    "PMT Serial Number": "pmt_serial",
-                    "PMT Batch Number": "pmt_batch",
-                    "PMT Generation": "pmt_generation",
-                    "Test Fixture": "test_fixture",
-                    "Test Date": "test_date"
-                }
-                group_by_field = group_mapping.get(group_by_text)
+                group_by_field = GROUP_BY_MAPPING.get(group_by_text)
 
         logger.info(f"Generating comparison plots - Compare By: {compare_by}, Group By: {group_by_field}, X-Axis: {x_axis_field}")
 
         # Get spec limits from our measurements
-        lower_limit = None
-        upper_limit = None
+        lower_limit, upper_limit = self._find_spec_limits(y_measurements)
         y_unit = y_measurements[0].unit if y_measurements else ""
-        for m in y_measurements:
-            if m.lower_limit is not None:
-                lower_limit = m.lower_limit
-            if m.upper_limit is not None:
-                upper_limit = m.upper_limit
-            if lower_limit and upper_limit:
-                break
+
+        if self.progress_dialog:
+            self.progress_dialog.setLabelText("Pairing measurements...")
+
+        # Pairing and grouping are pure data work, so they run on the thread
+        # pool; plot widgets are only created later, on the GUI thread.
+        generation_key = self._generation_key
+        columns = self.current_columns
+        options = {
+            'spec_name': spec_name,
+            'y_unit': y_unit,
+            'lower_limit': lower_limit,
+            'upper_limit': upper_limit,
+            'group_by_field': group_by_field,
+            'x_axis_field': x_axis_field,
+            'x_axis_label': x_axis_label,
+        }
+        self.submit_task(
+            lambda: self._prepare_comparison_data(y_measurements, columns, compare_by, options),
+            lambda prepared: self._on_comparison_prepared(generation_key, y_measurements, compare_by, prepared),
+            lambda message: self._on_prepare_failed(generation_key, message)
+        )
+
+    def _prepare_comparison_data(self, y_measurements: list, columns: Optional[dict],
+                                 compare_by: str, options: dict) -> Optional[dict]:
+        """
+        Pair, group and order measurements for the comparison plots.
+
+        Runs on a pool thread: no widget access. Returns ``options`` extended
+        with the paired data and series labels, or None when nothing paired.
+        """
+        spec_name = options['spec_name']
+        group_by_field = options['group_by_field']
 
         # Generate paired data based on Compare By selection
         paired_data = None
@@ -977,7 +1423,7 @@ class GraphPage:
         if compare_by == CompareBy.MANUFACTURER:
             # Compare against manufacturer data
             manufacturer_data = self._get_manufacturer_data_for_spec(spec_name)
-            paired_data = self._pair_with_manufacturer_data(y_measurements, manufacturer_data)
+            paired_data = self._pair_with_manufacturer_data(y_measurements, manufacturer_data, columns)
             compare_label = "Manufacturer"
             other_label = "Manufacturer Expected"
 
@@ -990,7 +1436,7 @@ class GraphPage:
 
         elif compare_by == CompareBy.FIRST_LAST:
             # Compare first vs last test for each device
-            paired_data = self._pair_first_last_tests(y_measurements)
+            paired_data = self._pair_first_last_tests(y_measurements, columns)
             compare_label = "First vs Last"
             our_label = "Last Test"
             other_label = "First Test"
@@ -1011,23 +1457,70 @@ class GraphPage:
 
         if not paired_data:
             logger.warning(f"No paired data available for {compare_by} comparison")
-            self.show_info("No Data", f"Could not find paired data for {compare_by} comparison.\n\n"
-                          f"Make sure you have the required data in your database.")
+            return None
+
+        # Add grouping and X-axis ordering info to paired data
+        self._annotate_paired_data(paired_data, group_by_field, options['x_axis_field'])
+
+        return {
+            **options,
+            'compare_by': compare_by,
+            'paired_data': paired_data,
+            'columns': self._paired_to_columns(paired_data, options['x_axis_field']),
+            'compare_label': compare_label,
+            'our_label': our_label,
+            'other_label': other_label,
+        }
+
+    def _on_comparison_prepared(self, generation_key: Optional[tuple], y_measurements: list,
+                                compare_by: str, prepared: Optional[dict]):
+        """Register the comparison plot factories for prepared data (GUI thread)."""
+        generation = self._generations.get(generation_key)
+        if generation is None:
+            logger.info("Discarding comparison data for a generation that no longer exists")
             return
+        is_current = self._generation_key == generation_key
 
-        # Add grouping info to paired data
-        if group_by_field:
-            self._add_grouping_to_paired_data(paired_data, group_by_field)
+        if prepared is None:
+            if is_current:
+                if self.progress_dialog:
+                    self.progress_dialog.close()
+                self.show_info("No Data", f"Could not find paired data for {compare_by} comparison.\n\n"
+                              f"Make sure you have the required data in your database.")
+            return
 
-        # Add X-axis ordering info to paired data
-        self._add_x_axis_ordering_to_paired_data(paired_data, x_axis_field)
+        try:
+            self._register_comparison_factories(generation['factories'], prepared)
+            if is_current:
+                self._finish_generation(y_measurements)
+        except Exception as e:
+            logger.exception("Error registering comparison plots")
+            if is_current:
+                self._fail_generation(e)
+
+    def _on_prepare_failed(self, generation_key: Optional[tuple], message: str):
+        """Report a pairing failure if its generation is still the one on screen."""
+        logger.error(f"Error preparing plot data: {message}")
+        if self._generation_key == generation_key:
+            self._fail_generation(message)
+
+    def _register_comparison_factories(self, factories: dict, prepared: dict):
+        """Register lazy Dumbbell, Correlation and Difference plot factories."""
+        paired_data = prepared['paired_data']
+        columns = prepared['columns']
+        spec_name = prepared['spec_name']
+        y_unit = prepared['y_unit']
+        lower_limit = prepared['lower_limit']
+        upper_limit = prepared['upper_limit']
+        group_by_field = prepared['group_by_field']
+        x_axis_field = prepared['x_axis_field']
+        x_axis_label = prepared['x_axis_label']
+        compare_label = prepared['compare_label']
+        our_label = prepared['our_label']
+        other_label = prepared['other_label']
 
         # 1. Dumbbell Plot (Side-by-side with connecting lines)
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Dumbbell Plot...")
-        QApplication.processEvents()
-
-        dumbbell_plot = self._create_dumbbell_plot(
+        factories[DisplayType.DUMBBELL] = lambda: self._create_dumbbell_plot(
             paired_data,
             title=f"{compare_label} Comparison: {spec_name}",
             y_label=f"{spec_name} ({y_unit})" if y_unit else spec_name,
@@ -1037,140 +1530,274 @@ class GraphPage:
             lower_limit=lower_limit,
             upper_limit=upper_limit,
             group_by_field=group_by_field,
-            x_axis_field=x_axis_field
+            x_axis_field=x_axis_field,
+            columns=columns
         )
-        if dumbbell_plot:
-            self.cached_plots[DisplayType.DUMBBELL] = dumbbell_plot
 
         # 2. Correlation Plot (X=Other, Y=Ours with y=x line)
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Correlation Plot...")
-        QApplication.processEvents()
-
-        correlation_plot = self._create_correlation_plot(
+        factories[DisplayType.CORRELATION] = lambda: self._create_correlation_plot(
             paired_data,
             title=f"{spec_name} Correlation ({compare_label})",
             x_label=f"{other_label} - {spec_name} ({y_unit})" if y_unit else f"{other_label} - {spec_name}",
             y_label=f"{our_label} - {spec_name} ({y_unit})" if y_unit else f"{our_label} - {spec_name}",
             lower_limit=lower_limit,
             upper_limit=upper_limit,
-            group_by_field=group_by_field
+            group_by_field=group_by_field,
+            columns=columns
         )
-        if correlation_plot:
-            self.cached_plots[DisplayType.CORRELATION] = correlation_plot
 
         # 3. Difference Plot
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Difference Plot...")
-        QApplication.processEvents()
-
-        diff_plot = self._create_difference_plot_v2(
+        factories[DisplayType.DIFFERENCE] = lambda: self._create_difference_plot_v2(
             paired_data,
             title=f"Difference Plot: {spec_name} ({our_label} - {other_label})",
             y_label=f"Difference ({y_unit})" if y_unit else "Difference",
             x_label=x_axis_label,
             group_by_field=group_by_field,
-            x_axis_field=x_axis_field
+            x_axis_field=x_axis_field,
+            columns=columns
         )
-        if diff_plot:
-            self.cached_plots[DisplayType.DIFFERENCE] = diff_plot
 
-        logger.info(f"Generated comparison plots for {compare_by}")
+        logger.info(f"Registered comparison plots for {prepared['compare_by']}")
+
+    @staticmethod
+    def _find_spec_limits(measurements: list) -> Tuple[Optional[float], Optional[float]]:
+        """
+        (lower, upper) spec limits of a measurement list.
+
+        Measurements of one spec normally share their limits, so the first
+        measurement decides unless one of its limits is missing; the scan
+        stops as soon as both are known (a limit of 0.0 counts as known).
+        """
+        if not measurements:
+            return None, None
+
+        lower_limit = measurements[0].lower_limit
+        upper_limit = measurements[0].upper_limit
+        if lower_limit is None or upper_limit is None:
+            for m in measurements[1:]:
+                if lower_limit is None and m.lower_limit is not None:
+                    lower_limit = m.lower_limit
+                if upper_limit is None and m.upper_limit is not None:
+                    upper_limit = m.upper_limit
+                if lower_limit is not None and upper_limit is not None:
+                    break
+        return lower_limit, upper_limit
+
+    def _annotate_paired_data(self, paired_data: list, group_by_field: Optional[str], x_axis_field: str):
+        """
+        Add grouping ('group'), X-axis ordering ('x_axis_value') and tooltip
+        metadata ('meta_html') info to paired data.
+
+        One pass over the pairs; each pair's test log is resolved once for all fields.
+        """
+        group_extractor = _GROUP_EXTRACTORS.get(group_by_field) if group_by_field else None
+        x_extractor = _GROUP_EXTRACTORS.get(x_axis_field) if x_axis_field != 'index' else None
 
-    def _add_grouping_to_paired_data(self, paired_data: list, group_by_field: str):
-        """Add grouping information to paired data based on the group_by_field."""
         for pair in paired_data:
-            our_m = pair.get('our_measurement')
+            group_value = x_value = None
+            meta_rows = []
+            our_m = pair.our_measurement
             if our_m:
-                group_value = self._get_group_value(our_m, group_by_field)
-                pair['group'] = group_value if group_value else 'Unknown'
-            else:
-                pair['group'] = 'Unknown'
+                try:
+                    tl = self._test_log_of(our_m)
+                    if tl:
+                        if group_extractor:
+                            group_value = _intern_str(group_extractor(tl))
+                        if x_extractor:
+                            x_value = _intern_str(x_extractor(tl))
+                        if tl.test_fixture:
+                            meta_rows.append(f"<b>Fixture:</b> {tl.test_fixture}")
+                        if tl.created_at:
+                            meta_rows.append(f"<b>Date:</b> {tl.created_at.strftime('%Y-%m-%d')}")
+                except Exception as e:
+                    logger.error(f"Error annotating paired data: {e}")
 
-    def _add_x_axis_ordering_to_paired_data(self, paired_data: list, x_axis_field: str):
-        """Add X-axis ordering/label information to paired data based on the field."""
-        for pair in paired_data:
-            our_m = pair.get('our_measurement')
-            if our_m and x_axis_field != 'index':
-                x_value = self._get_group_value(our_m, x_axis_field)
-                pair['x_axis_value'] = x_value if x_value else pair.get('device_id', 'Unknown')
-            else:
-                pair['x_axis_value'] = pair.get('device_id', 'Unknown')
+            if group_by_field:
+                pair.group = group_value if group_value is not None else 'Unknown'
+            pair.x_axis_value = x_value if x_value else pair.device_id
+            pair.meta_html = '<br>'.join(meta_rows)
+
+    @staticmethod
+    def _group_rows(group_ids: np.ndarray, n_groups: int) -> List[np.ndarray]:
+        """
+        Rows of each group (ascending), from one stable sort of the group ids.
+
+        ``group_ids[r] == k`` for every row ``r`` of ``_group_rows(...)[k]``.
+        """
+        rows = np.argsort(group_ids, kind='stable')
+        bounds = np.searchsorted(group_ids[rows], np.arange(1, n_groups))
+        return np.split(rows, bounds)
+
+    @staticmethod
+    def _paired_to_columns(paired_data: List[PairedPoint], x_axis_field: str = 'index') -> Dict[str, np.ndarray]:
+        """
+        Struct-of-arrays view of paired data, built once for all comparison plots.
+
+        'our_value', 'mfr_value', 'difference', 'group', 'group_id' and
+        'x_axis_value' are aligned with ``paired_data``. 'group_names' holds
+        the sorted distinct groups ('group_id' indexes it), so group-colored
+        plots select a group with one vectorized comparison. 'order' holds
+        the row order of the dumbbell and difference plots: by device, or by
+        X-axis value then device when an X-axis field is selected.
+        """
+        n = len(paired_data)
+        our_value = np.fromiter((p.our_value for p in paired_data), dtype=np.float64, count=n)
+        mfr_value = np.fromiter((p.mfr_value for p in paired_data), dtype=np.float64, count=n)
+        group = np.empty(n, dtype=object)
+        group[:] = [p.group for p in paired_data]
+        x_axis_value = np.empty(n, dtype=object)
+        x_axis_value[:] = [p.x_axis_value for p in paired_data]
+        group_names, group_id = np.unique(group, return_inverse=True)
+
+        # Stable argsorts on object arrays; (X value, device) order is a stable
+        # sort by device followed by a stable sort by X value
+        device_id = np.empty(n, dtype=object)
+        if x_axis_field == 'index':
+            device_id[:] = [p.device_id for p in paired_data]
+            order = np.argsort(device_id, kind='stable')
+        else:
+            device_id[:] = [p.device_id or '' for p in paired_data]
+            x_key = np.empty(n, dtype=object)
+            x_key[:] = [value or '' for value in x_axis_value]
+            by_device = np.argsort(device_id, kind='stable')
+            order = by_device[np.argsort(x_key[by_device], kind='stable')]
+
+        return {
+            'our_value': our_value,
+            'mfr_value': mfr_value,
+            'difference': our_value - mfr_value,
+            'group': group,
+            'group_id': group_id,
+            'group_names': group_names,
+            'x_axis_value': x_axis_value,
+            'order': order.astype(np.intp, copy=False),
+        }
 
+    @_memoized_accessor
     def _get_group_value(self, measurement, group_by_field: str) -> Optional[str]:
         """Extract the group value from a measurement based on the field."""
-        try:
-            if not hasattr(measurement, 'sub_test') or not measurement.sub_test:
-                return None
-            if not hasattr(measurement.sub_test, 'test_log') or not measurement.sub_test.test_log:
-                return None
+        tl = self._test_log_of(measurement)
+        extractor = _GROUP_EXTRACTORS.get(group_by_field)
+        return _intern_str(extractor(tl)) if tl and extractor else None
 
-            tl = measurement.sub_test.test_log
-
-            if group_by_field == 'pia_serial':
-                return tl.pia_board.serial_number if tl.pia_board else None
-            elif group_by_field == 'pia_part':
-                return tl.pia_board.part_number if tl.pia_board else None
-            elif group_by_field == 'pmt_serial':
-                return tl.pmt_device.pmt_serial_number if tl.pmt_device else None
-            elif group_by_field == 'pmt_batch':
-                return tl.pmt_device.batch_number if tl.pmt_device else None
-            elif group_by_field == 'pmt_generation':
-                return str(tl.pmt_device.generation) if tl.pmt_device and tl.pmt_device.generation else None
-            elif group_by_field == 'test_fixture':
-                return tl.test_fixture
-            elif group_by_field == 'test_date':
-                return tl.created_at.strftime('%Y-%m-%d') if tl.created_at else None
-        except Exception as e:
-            logger.error(f"Error getting group value: {e}")
-        return None
+    @staticmethod
+    def _check_eager_loads(measurements: Optional[list]):
+        """Raise if the measurements came without the relationships in REQUIRED_EAGER_LOADS."""
+        if not measurements:
+            return
+
+        from sqlalchemy import inspect
+        for path in REQUIRED_EAGER_LOADS:
+            obj = measurements[0]
+            for attr in path.split('.'):
+                state = inspect(obj, raiseerr=False)
+                if state is not None and attr in state.unloaded:
+                    raise RuntimeError(
+                        f"Measurements were queried without loading '{path}'; "
+                        f"see REQUIRED_EAGER_LOADS"
+                    )
+                obj = getattr(obj, attr, None)
+                if obj is None:
+                    break
 
     def _get_manufacturer_data_for_spec(self, spec_name: str) -> List[Dict]:
+        """Get manufacturer data for one spec name (see _get_manufacturer_data_for_specs)."""
+        return self._get_manufacturer_data_for_specs([spec_name]).get(spec_name, [])
+
+    def _get_manufacturer_data_for_specs(self, spec_names: Iterable[str]) -> Dict[str, List[Dict]]:
         """
-        Get manufacturer data from the manufacturer tables for a given spec name.
+        Get manufacturer data from the manufacturer tables for several spec names.
 
-        Returns list of dicts with:
+        All specs are fetched in one query (``spec_name IN (...)``). Returns
+        a dict keyed by spec name; each value is a list of dicts with:
             - device_serial: Device serial number
             - measurement: Manufacturer's measurement value
             - manufacturer_name: Name of manufacturer
         """
+        spec_names = list(dict.fromkeys(spec_names))
+        if not spec_names:
+            return {}
+
         try:
+            from sqlalchemy.orm import joinedload
             from src.database.database_manufacturer_tables import ManufacturerSpec
 
             with self.db.session_scope() as session:
-                mfr_specs = session.query(ManufacturerSpec).filter(
-                    ManufacturerSpec.spec_name == spec_name
-                ).all()
+                mfr_specs = session.query(ManufacturerSpec).options(
+                    joinedload(ManufacturerSpec.manufacturer)
+                ).filter(
+                    ManufacturerSpec.spec_name.in_(spec_names)
+                ).yield_per(QUERY_CHUNK_SIZE)
 
-                result = []
+                result = {}
                 for ms in mfr_specs:
                     if ms.device_serial and ms.measurement is not None:
-                        result.append({
+                        result.setdefault(ms.spec_name, []).append({
                             'device_serial': ms.device_serial,
                             'measurement': ms.measurement,
                             'manufacturer_name': ms.manufacturer.name if ms.manufacturer else 'Unknown'
                         })
 
-                logger.info(f"Found {len(result)} manufacturer specs for '{spec_name}'")
+                for spec_name in spec_names:
+                    logger.info(f"Found {len(result.get(spec_name, []))} manufacturer specs for '{spec_name}'")
                 return result
 
         except Exception as e:
             logger.warning(f"Could not get manufacturer data: {e}")
-            return []
+            return {}
 
-    def _pair_with_manufacturer_data(self, our_measurements: list, manufacturer_data: list) -> List[Dict]:
+    @staticmethod
+    def _join_rows(left: pd.DataFrame, right: pd.DataFrame, on: List[str]) -> pd.DataFrame:
+        """
+        Inner-join two row-index frames on ``on`` (pandas hash join).
+
+        Rows with a null key never match, and for duplicate keys on the right
+        the last row wins, like the dict lookups this replaces. The result
+        keeps the left frame's row order.
+        """
+        left = left.dropna(subset=on)
+        right = right.dropna(subset=on).drop_duplicates(subset=on, keep='last')
+        return left.merge(right, on=on, how='inner', sort=False)
+
+    def _pair_with_manufacturer_data(self, our_measurements: list, manufacturer_data: list,
+                                     columns: Optional[Dict[str, np.ndarray]] = None) -> List[PairedPoint]:
         """
         Pair our measurements with manufacturer data by device serial number.
 
-        Returns list of dicts with:
-            - device_id: Device serial number
-            - our_value: Our measured value
-            - mfr_value: Manufacturer's value
-            - our_measurement: Full measurement object
+        Our devices are matched by PIA serial, else PMT serial (_get_device_serial).
+        Returns one PairedPoint per device with device_id, our_value,
+        mfr_value (manufacturer's value), our_measurement and manufacturer_name.
         """
         if not manufacturer_data:
             return []
 
+        if columns is not None and len(columns['device_serial']) == len(our_measurements):
+            ours = pd.DataFrame({
+                'serial': np.where(columns['device_serial'].astype(bool), columns['device_serial'], None),
+                'our_row': np.arange(len(our_measurements)),
+            })
+            theirs = pd.DataFrame({
+                'serial': [m['device_serial'] for m in manufacturer_data],
+                'mfr_row': np.arange(len(manufacturer_data)),
+            })
+            joined = self._join_rows(ours, theirs, ['serial'])
+
+            paired = []
+            for serial, our_idx, mfr_idx in zip(joined['serial'], joined['our_row'], joined['mfr_row']):
+                our_m = our_measurements[our_idx]
+                mfr_data = manufacturer_data[mfr_idx]
+                if our_m.measurement is not None and mfr_data['measurement'] is not None:
+                    paired.append(PairedPoint(
+                        device_id=serial,
+                        our_value=our_m.measurement,
+                        mfr_value=mfr_data['measurement'],
+                        our_measurement=our_m,
+                        manufacturer_name=mfr_data.get('manufacturer_name', 'Manufacturer')
+                    ))
+
+            logger.info(f"Paired {len(paired)} measurements with manufacturer data")
+            return paired
+
         # Build lookup by device serial
         mfr_by_serial = {m['device_serial']: m for m in manufacturer_data}
 
@@ -1185,98 +1812,126 @@ class GraphPage:
                 mfr_value = mfr_data['measurement']
 
                 if our_value is not None and mfr_value is not None:
-                    paired.append({
-                        'device_id': serial,
-                        'our_value': our_value,
-                        'mfr_value': mfr_value,
-                        'our_measurement': our_m,
-                        'manufacturer_name': mfr_data.get('manufacturer_name', 'Manufacturer')
-                    })
+                    paired.append(PairedPoint(
+                        device_id=serial,
+                        our_value=our_value,
+                        mfr_value=mfr_value,
+                        our_measurement=our_m,
+                        manufacturer_name=mfr_data.get('manufacturer_name', 'Manufacturer')
+                    ))
 
         logger.info(f"Paired {len(paired)} measurements with manufacturer data")
         return paired
 
-    def _pair_by_test_fixture(self, measurements: list) -> List[Dict]:
+    def _pair_by_test_fixture(self, measurements: list) -> List[PairedPoint]:
         """
         Pair measurements by test fixture for fixture-to-fixture comparison.
 
         Groups measurements by device, then pairs across different fixtures.
         Returns pairs where we have the same device tested on different fixtures.
         """
-        # Group by device and fixture
-        device_fixture_data = defaultdict(dict)
+        frame = self._measurements_to_frame(measurements)
+        frame = frame[frame['serial'].notna() & frame['fixture'].notna() & frame['measurement'].notna()]
 
-        for m in measurements:
-            serial = self._get_device_serial(m)
-            fixture = self._get_test_fixture(m)
+        # First measurement per (device, fixture), then the first two fixtures per device
+        frame = frame.drop_duplicates(['serial', 'fixture'], keep='first')
+        rank = frame.groupby('serial', sort=False).cumcount()
+        pairs = frame[rank == 0].merge(frame[rank == 1], on='serial', suffixes=('_a', '_b'))
 
-            if serial and fixture and m.measurement is not None:
-                if fixture not in device_fixture_data[serial]:
-                    device_fixture_data[serial][fixture] = m
-
-        # Find devices tested on multiple fixtures
         paired = []
-        for device_id, fixtures in device_fixture_data.items():
-            fixture_names = list(fixtures.keys())
-            if len(fixture_names) >= 2:
-                # Use first two fixtures for comparison
-                fixture_a = fixture_names[0]
-                fixture_b = fixture_names[1]
-                m_a = fixtures[fixture_a]
-                m_b = fixtures[fixture_b]
-
-                paired.append({
-                    'device_id': device_id,
-                    'our_value': m_a.measurement,
-                    'mfr_value': m_b.measurement,  # Using mfr_value for consistency
-                    'our_measurement': m_a,
-                    'other_measurement': m_b,
-                    'fixture_a': fixture_a,
-                    'fixture_b': fixture_b
-                })
+        for device_id, fixture_a, fixture_b, idx_a, idx_b in zip(
+                pairs['serial'], pairs['fixture_a'], pairs['fixture_b'], pairs['idx_a'], pairs['idx_b']):
+            m_a = measurements[idx_a]
+            m_b = measurements[idx_b]
+            paired.append(PairedPoint(
+                device_id=device_id,
+                our_value=m_a.measurement,
+                mfr_value=m_b.measurement,  # Using mfr_value for consistency
+                our_measurement=m_a,
+                other_measurement=m_b,
+                fixture_a=fixture_a,
+                fixture_b=fixture_b
+            ))
 
         logger.info(f"Paired {len(paired)} measurements by test fixture")
         return paired
 
-    def _pair_first_last_tests(self, measurements: list) -> List[Dict]:
+    def _pair_first_last_tests(self, measurements: list,
+                               columns: Optional[Dict[str, np.ndarray]] = None) -> List[PairedPoint]:
         """
         Pair first and last tests for each device.
 
         Returns pairs comparing the first test vs the last test for each device.
+        Devices are keyed by PIA serial, else PMT serial (_get_device_serial).
+        When the query columns are given the per-device reduction runs on them
+        instead of grouping the ORM objects.
         """
-        # Group by device
-        device_measurements = defaultdict(list)
-        for m in measurements:
-            serial = self._get_device_serial(m)
-            if serial and m.measurement is not None:
-                device_measurements[serial].append(m)
+        if columns is not None and len(columns['device_serial']) == len(measurements):
+            rows = np.flatnonzero(columns['device_serial'].astype(bool) & ~np.isnan(columns['value']))
+            first_rows, last_rows, counts = self._grouped_first_last(columns, rows, 'device_serial')
+
+            keep = counts >= 2
+            last_records = as_recarray(take_measurement_columns(columns, last_rows[keep]))
+
+            paired = []
+            for first_idx, last_idx, record in zip(first_rows[keep], last_rows[keep], last_records):
+                first_m = measurements[first_idx]
+                last_m = measurements[last_idx]
+                paired.append(PairedPoint(
+                    device_id=record.device_serial,
+                    our_value=last_m.measurement,  # Last test is "our" current value
+                    mfr_value=first_m.measurement,  # First test is comparison
+                    our_measurement=last_m,
+                    other_measurement=first_m,
+                    first_date=first_m.created_at,
+                    last_date=last_m.created_at
+                ))
+
+            logger.info(f"Paired {len(paired)} first/last test measurements")
+            return paired
+
+        devices = self._first_last_by_device(measurements, with_value_only=True)
 
         paired = []
-        for device_id, device_ms in device_measurements.items():
-            if len(device_ms) >= 2:
-                # Sort by date
-                sorted_ms = sorted(
-                    device_ms,
-                    key=lambda m: m.created_at if m.created_at else datetime.min
-                )
-                first_m = sorted_ms[0]
-                last_m = sorted_ms[-1]
-
+        for device_id, (_, first_m, _, last_m, count) in devices.items():
+            if count >= 2:
                 if first_m.measurement is not None and last_m.measurement is not None:
-                    paired.append({
-                        'device_id': device_id,
-                        'our_value': last_m.measurement,  # Last test is "our" current value
-                        'mfr_value': first_m.measurement,  # First test is comparison
-                        'our_measurement': last_m,
-                        'other_measurement': first_m,
-                        'first_date': first_m.created_at,
-                        'last_date': last_m.created_at
-                    })
+                    paired.append(PairedPoint(
+                        device_id=device_id,
+                        our_value=last_m.measurement,  # Last test is "our" current value
+                        mfr_value=first_m.measurement,  # First test is comparison
+                        our_measurement=last_m,
+                        other_measurement=first_m,
+                        first_date=first_m.created_at,
+                        last_date=last_m.created_at
+                    ))
 
         logger.info(f"Paired {len(paired)} first/last test measurements")
         return paired
 
-    def _pair_by_batch(self, measurements: list, batch_type: str) -> List[Dict]:
+    def _first_last_by_device(self, measurements: list, with_value_only: bool = False) -> Dict[str, list]:
+        """
+        Earliest and latest test per device serial in a single pass.
+
+        Returns {serial: [first date, first, last date, last, count]} in order
+        of first appearance. Ties resolve like a stable sort by created_at:
+        the first row seen stays first, the last row seen becomes last.
+        """
+        devices = {}
+        for m in measurements:
+            serial = self._get_device_serial(m)
+            if not serial or (with_value_only and m.measurement is None):
+                continue
+            created_at = m.created_at or datetime.min
+            state = devices.setdefault(serial, [created_at, m, created_at, m, 0])
+            if created_at < state[0]:
+                state[0], state[1] = created_at, m
+            if created_at >= state[2]:
+                state[2], state[3] = created_at, m
+            state[4] += 1
+        return devices
+
+    def _pair_by_batch(self, measurements: list, batch_type: str) -> List[PairedPoint]:
         """
         Pair measurements by batch for batch-to-batch comparison.
 
@@ -1286,81 +1941,83 @@ class GraphPage:
 
         Returns pairs comparing devices from different batches.
         """
-        # Group by batch
-        batch_measurements = defaultdict(list)
+        frame = self._measurements_to_frame(measurements)
+        batch_column = 'pia_batch' if batch_type == 'pia' else 'pmt_batch'
+        frame = frame[frame[batch_column].notna() & frame['measurement'].notna()]
 
-        for m in measurements:
-            if batch_type == 'pia':
-                batch = self._get_pia_batch(m)
-            else:
-                batch = self._get_pmt_batch(m)
-
-            if batch and m.measurement is not None:
-                batch_measurements[batch].append(m)
-
-        batch_names = list(batch_measurements.keys())
+        # Batches in order of first appearance, then by size (stable for ties)
+        batches = frame.groupby(batch_column, sort=False)['measurement'].agg(['size', 'mean'])
 
-        if len(batch_names) < 2:
-            logger.warning(f"Need at least 2 {batch_type} batches for comparison, found {len(batch_names)}")
+        if len(batches) < 2:
+            logger.warning(f"Need at least 2 {batch_type} batches for comparison, found {len(batches)}")
             return []
 
-        # Compare first two batches with the most data
-        sorted_batches = sorted(batch_names, key=lambda b: len(batch_measurements[b]), reverse=True)
-        batch_a = sorted_batches[0]
-        batch_b = sorted_batches[1]
-
-        # Calculate averages for each batch
-        avg_a = sum(m.measurement for m in batch_measurements[batch_a]) / len(batch_measurements[batch_a])
-        avg_b = sum(m.measurement for m in batch_measurements[batch_b]) / len(batch_measurements[batch_b])
+        # Compare the two batches with the most data (ties keep first appearance)
+        batch_a, batch_b = batches['size'].nlargest(2, keep='first').index
+        avg_b = float(batches.at[batch_b, 'mean'])
 
         # Create paired data - one entry per device in batch A, compared to batch B average
+        rows_a = frame[frame[batch_column] == batch_a]
         paired = []
-        for m in batch_measurements[batch_a]:
-            serial = self._get_device_serial(m)
-            paired.append({
-                'device_id': serial or f"Device {len(paired)+1}",
-                'our_value': m.measurement,
-                'mfr_value': avg_b,  # Compare against batch B average
-                'our_measurement': m,
-                'batch_a': batch_a,
-                'batch_b': batch_b,
-                'batch_b_avg': avg_b
-            })
+        for serial, idx in zip(rows_a['serial'], rows_a['idx']):
+            m = measurements[idx]
+            paired.append(PairedPoint(
+                device_id=serial if pd.notna(serial) else f"Device {len(paired)+1}",
+                our_value=m.measurement,
+                mfr_value=avg_b,  # Compare against batch B average
+                our_measurement=m,
+                batch_a=batch_a,
+                batch_b=batch_b,
+                batch_b_avg=avg_b
+            ))
 
         logger.info(f"Paired {len(paired)} measurements for {batch_type} batch comparison ({batch_a} vs {batch_b})")
         return paired
 
+    def _measurements_to_frame(self, measurements: list) -> pd.DataFrame:
+        """
+        One pass over the measurements into a DataFrame for grouping.
+
+        Columns: serial, fixture, pia_batch, pmt_batch, created_at,
+        measurement and idx (position in ``measurements``). Missing values
+        are None/NaN so rows can be dropped with notna().
+        """
+        records = [
+            (
+                self._get_device_serial(m) or None,
+                self._get_test_fixture(m) or None,
+                self._get_pia_batch(m) or None,
+                self._get_pmt_batch(m) or None,
+                getattr(m, 'created_at', None),
+                getattr(m, 'measurement', None),
+                idx,
+            )
+            for idx, m in enumerate(measurements)
+        ]
+        frame = pd.DataFrame.from_records(
+            records,
+            columns=['serial', 'fixture', 'pia_batch', 'pmt_batch', 'created_at', 'measurement', 'idx']
+        )
+        frame['measurement'] = pd.to_numeric(frame['measurement'])
+        return frame
+
+    @_memoized_accessor
     def _get_test_fixture(self, measurement) -> Optional[str]:
         """Get test fixture from measurement."""
-        try:
-            if hasattr(measurement, 'sub_test') and measurement.sub_test:
-                if hasattr(measurement.sub_test, 'test_log') and measurement.sub_test.test_log:
-                    return measurement.sub_test.test_log.test_fixture
-        except Exception as e:
-            logger.error(f"Error getting test fixture: {e}")
-        return None
+        tl = self._test_log_of(measurement)
+        return tl.test_fixture if tl else None
 
+    @_memoized_accessor
     def _get_pia_batch(self, measurement) -> Optional[str]:
         """Get PIA part number (used as batch) from measurement."""
-        try:
-            if hasattr(measurement, 'sub_test') and measurement.sub_test:
-                if hasattr(measurement.sub_test, 'test_log') and measurement.sub_test.test_log:
-                    if measurement.sub_test.test_log.pia_board:
-                        return measurement.sub_test.test_log.pia_board.part_number
-        except Exception as e:
-            logger.error(f"Error getting PIA batch: {e}")
-        return None
+        pia_board = getattr(self._test_log_of(measurement), 'pia_board', None)
+        return pia_board.part_number if pia_board else None
 
+    @_memoized_accessor
     def _get_pmt_batch(self, measurement) -> Optional[str]:
         """Get PMT batch number from measurement."""
-        try:
-            if hasattr(measurement, 'sub_test') and measurement.sub_test:
-                if hasattr(measurement.sub_test, 'test_log') and measurement.sub_test.test_log:
-                    if measurement.sub_test.test_log.pmt_device:
-                        return measurement.sub_test.test_log.pmt_device.batch_number
-        except Exception as e:
-            logger.error(f"Error getting PMT batch: {e}")
-        return None
+        pmt_device = getattr(self._test_log_of(measurement), 'pmt_device', None)
+        return pmt_device.batch_number if pmt_device else None
 
     def _create_first_last_difference_plot(self, measurements: list, title: str,
                                             y_label: str) -> Optional[pg.PlotWidget]:
@@ -1368,25 +2025,13 @@ class GraphPage:
         Create difference plot showing (Last test - First test) for each device.
         """
         try:
-            # Group measurements by device
-            device_measurements = defaultdict(list)
-            for m in measurements:
-                serial = self._get_device_serial(m)
-                if serial:
-                    device_measurements[serial].append(m)
+            # First and last test per device
+            devices = self._first_last_by_device(measurements)
 
             # Calculate first-last differences
             paired_data = []
-            for device_id, device_ms in device_measurements.items():
-                if len(device_ms) >= 2:
-                    # Sort by date
-                    sorted_ms = sorted(
-                        device_ms,
-                        key=lambda m: m.created_at if m.created_at else datetime.min
-                    )
-                    first_m = sorted_ms[0]
-                    last_m = sorted_ms[-1]
-
+            for device_id, (_, first_m, _, last_m, count) in devices.items():
+                if count >= 2:
                     if first_m.measurement is not None and last_m.measurement is not None:
                         paired_data.append({
                             'device_id': device_id,
@@ -1404,15 +2049,15 @@ class GraphPage:
             plot_widget.showGrid(x=True, y=True, alpha=0.3)
 
             # Sort by device ID
-            sorted_data = sorted(paired_data, key=lambda p: p['device_id'])
+            sorted_data = sorted(paired_data, key=itemgetter('device_id'))
 
-            x_indices = list(range(len(sorted_data)))
-            differences = [p['difference'] for p in sorted_data]
+            x_indices = np.arange(len(sorted_data))
+            differences = np.fromiter((p['difference'] for p in sorted_data),
+                                      dtype=np.float64, count=len(sorted_data))
             device_ids = [p['device_id'] for p in sorted_data]
 
             # Color points based on sign (green=positive/improving, red=negative/degrading)
-            colors = ['#4CAF50' if d >= 0 else '#FF4444' for d in differences]
-            brushes = [pg.mkBrush(c) for c in colors]
+            brushes = self._sign_brushes(differences)
 
             # Create scatter plot
             scatter = pg.ScatterPlotItem(
@@ -1449,162 +2094,93 @@ class GraphPage:
             logger.error(f"Error creating first/last difference plot: {e}")
             return None
 
+    @_memoized_accessor
     def _get_device_serial(self, measurement) -> Optional[str]:
         """Get device serial number from measurement."""
-        try:
-            # For our Spec measurements
-            if hasattr(measurement, 'sub_test') and measurement.sub_test:
-                if hasattr(measurement.sub_test, 'test_log') and measurement.sub_test.test_log:
-                    tl = measurement.sub_test.test_log
-                    if hasattr(tl, 'pia_board') and tl.pia_board:
-                        return tl.pia_board.serial_number
-                    if hasattr(tl, 'pmt_device') and tl.pmt_device:
-                        return tl.pmt_device.pmt_serial_number
-
-            # For ManufacturerSpec
-            if hasattr(measurement, 'device_serial'):
-                return measurement.device_serial
-
-        except Exception as e:
-            logger.error(f"Error getting device serial: {e}")
-        return None
+        # For our Spec measurements
+        tl = self._test_log_of(measurement)
+        if tl:
+            pia_board = getattr(tl, 'pia_board', None)
+            if pia_board:
+                return pia_board.serial_number
+            pmt_device = getattr(tl, 'pmt_device', None)
+            if pmt_device:
+                return pmt_device.pmt_serial_number
+
+        # For ManufacturerSpec
+        return getattr(measurement, 'device_serial', None)
 
     def _create_correlation_plot(self, paired_data: list, title: str, x_label: str,
                                   y_label: str, lower_limit: float = None,
                                   upper_limit: float = None,
-                                  group_by_field: str = None) -> Optional[pg.PlotWidget]:
+                                  group_by_field: str = None,
+                                  columns: Optional[Dict[str, np.ndarray]] = None) -> Optional[pg.PlotWidget]:
         """
         Create correlation plot: X = Comparison value, Y = Our value.
 
         Like Image 1 - Fixture Correlation plot with y=x reference line.
         Supports grouping/coloring by field.
         Includes all interactive features: tooltips, hover, spec line toggles, etc.
+        ``columns`` is the _paired_to_columns view of paired_data (built if omitted).
         """
         try:
-            plot_widget = pg.PlotWidget()
-            plot_widget.setBackground('#1e1e1e')
-            plot_widget.showGrid(x=True, y=True, alpha=0.3)
-
-            # Extract data
-            x_values = [p['mfr_value'] for p in paired_data]
-            y_values = [p['our_value'] for p in paired_data]
-
-            if not x_values:
+            if not paired_data:
                 return None
 
-            # Create legend FIRST so it captures all items added after
-            legend = plot_widget.addLegend()
-            legend.setBrush(pg.mkBrush(30, 30, 30, 235))
-            legend.setOffset((10, 10))
-
-            # Store paired data for tooltips
-            plot_widget.paired_data = paired_data
-            plot_widget.plot_type = 'correlation'
+            # Extract data
+            if columns is None:
+                columns = self._paired_to_columns(paired_data)
+            x_values = columns['mfr_value']
+            y_values = columns['our_value']
 
-            # Color palette for groups
-            group_colors = [
-                '#2196F3', '#4CAF50', '#FF9800', '#E91E63', '#9C27B0',
-                '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#F44336'
-            ]
+            plot_widget = self._new_comparison_plot('correlation', paired_data)
 
             # Get unique groups if grouping is enabled
             if group_by_field:
-                groups = list(set(p.get('group', 'Unknown') for p in paired_data))
-                groups.sort()
-                group_to_color = {g: group_colors[i % len(group_colors)] for i, g in enumerate(groups)}
+                groups = columns['group_names'].tolist()
+                group_rows = self._group_rows(columns['group_id'], len(groups))
 
                 # Create scatter plots per group for legend
-                for group in groups:
-                    color = group_to_color[group]
+                for k, group in enumerate(groups):
                     # Get data for this group
-                    group_x = [p['mfr_value'] for p in paired_data if p.get('group') == group]
-                    group_y = [p['our_value'] for p in paired_data if p.get('group') == group]
-                    group_indices = [i for i, p in enumerate(paired_data) if p.get('group') == group]
+                    group_indices = group_rows[k]
 
                     scatter = pg.ScatterPlotItem(
-                        x=group_x, y=group_y,
-                        pen=pg.mkPen(color, width=1),
-                        brush=pg.mkBrush(color),
+                        x=x_values[group_indices], y=y_values[group_indices],
+                        data=group_indices,
+                        pen=GROUP_PENS[k % len(GROUP_PENS)],
+                        brush=GROUP_BRUSHES[k % len(GROUP_BRUSHES)],
                         size=12,
                         name=group
                     )
-                    scatter.paired_indices = group_indices
                     scatter.group = group
                     plot_widget.addItem(scatter)
             else:
                 # No grouping - single color
                 scatter = pg.ScatterPlotItem(
                     x=x_values, y=y_values,
-                    pen=pg.mkPen('#2196F3', width=1),
-                    brush=pg.mkBrush('#2196F3'),
+                    pen=DATA_PEN,
+                    brush=DATA_BRUSH,
                     size=12,
                     name='Measurements'
                 )
-                scatter.paired_indices = list(range(len(paired_data)))
                 plot_widget.addItem(scatter)
 
             # Add y=x reference line (dashed gray)
-            all_values = x_values + y_values
-            min_val = min(all_values) * 0.95
-            max_val = max(all_values) * 1.05
+            min_val = min(x_values.min(), y_values.min()) * 0.95
+            max_val = max(x_values.max(), y_values.max()) * 1.05
 
             ref_line = pg.PlotDataItem(
                 x=[min_val, max_val], y=[min_val, max_val],
-                pen=pg.mkPen('#888888', width=2, style=Qt.PenStyle.DashLine),
+                pen=REFERENCE_LINE_PEN,
                 name='y = x'
             )
             plot_widget.addItem(ref_line)
 
-            # Add spec lines if available (with spec_line attribute for toggling)
-            if lower_limit is not None:
-                # Horizontal lower limit (for Y-axis / our measurements)
-                lower_h = pg.InfiniteLine(
-                    pos=lower_limit, angle=0,
-                    pen=pg.mkPen('#FFA500', width=2, style=Qt.PenStyle.DashLine),
-                    label='Lower Limit', labelOpts={'position': 0.95, 'color': '#FFA500'}
-                )
-                lower_h.spec_line = True
-                lower_h.spec_line_type = 'lower'
-                plot_widget.addItem(lower_h)
-
-                # Vertical lower limit (for X-axis / manufacturer)
-                lower_v = pg.InfiniteLine(
-                    pos=lower_limit, angle=90,
-                    pen=pg.mkPen('#FFA500', width=1, style=Qt.PenStyle.DotLine)
-                )
-                lower_v.spec_line = True
-                lower_v.spec_line_type = 'lower'
-                plot_widget.addItem(lower_v)
-
-            if upper_limit is not None:
-                # Horizontal upper limit
-                upper_h = pg.InfiniteLine(
-                    pos=upper_limit, angle=0,
-                    pen=pg.mkPen('#FF4444', width=2, style=Qt.PenStyle.DashLine),
-                    label='Upper Limit', labelOpts={'position': 0.95, 'color': '#FF4444'}
-                )
-                upper_h.spec_line = True
-                upper_h.spec_line_type = 'upper'
-                plot_widget.addItem(upper_h)
-
-                # Vertical upper limit
-                upper_v = pg.InfiniteLine(
-                    pos=upper_limit, angle=90,
-                    pen=pg.mkPen('#FF4444', width=1, style=Qt.PenStyle.DotLine)
-                )
-                upper_v.spec_line = True
-                upper_v.spec_line_type = 'upper'
-                plot_widget.addItem(upper_v)
+            # Add spec lines (horizontal for our values, vertical for the comparison)
+            self._add_spec_limits(plot_widget, lower_limit, upper_limit, include_vertical=True)
 
-            # Set labels and title
-            plot_widget.setTitle(title, color='#e0e0e0')
-            plot_widget.setLabel('bottom', x_label, color='#e0e0e0')
-            plot_widget.setLabel('left', y_label, color='#e0e0e0')
-
-            # Setup interactive features
-            self._setup_comparison_plot_interactivity(plot_widget)
-
-            plot_widget.graph_page = self
+            self._finish_comparison_plot(plot_widget, title, x_label, y_label)
             return plot_widget
 
         except Exception as e:
@@ -1618,7 +2194,8 @@ class GraphPage:
                                lower_limit: float = None,
                                upper_limit: float = None,
                                group_by_field: str = None,
-                               x_axis_field: str = 'index') -> Optional[pg.PlotWidget]:
+                               x_axis_field: str = 'index',
+                               columns: Optional[Dict[str, np.ndarray]] = None) -> Optional[pg.PlotWidget]:
         """
         Create dumbbell plot with side-by-side values connected by lines.
 
@@ -1627,86 +2204,66 @@ class GraphPage:
         Supports grouping/coloring by field with grouping boxes.
         X-axis ordering follows the x_axis_field selection.
         Includes all interactive features: tooltips, hover, spec line toggles, etc.
+        ``columns`` is the _paired_to_columns view of paired_data (built if omitted).
         """
         try:
-            plot_widget = pg.PlotWidget()
-            plot_widget.setBackground('#1e1e1e')
-            plot_widget.showGrid(x=True, y=True, alpha=0.3)
-
             if not paired_data:
                 return None
 
-            # Create legend FIRST so it captures all items added after
-            legend = plot_widget.addLegend()
-            legend.setBrush(pg.mkBrush(30, 30, 30, 235))
-            legend.setOffset((10, 10))
-
-            # Sort data based on x_axis_field
-            if x_axis_field == 'index':
-                sorted_data = sorted(paired_data, key=lambda p: p['device_id'])
-            else:
-                # Sort by x_axis_value, then by device_id for consistency within groups
-                sorted_data = sorted(paired_data, key=lambda p: (p.get('x_axis_value', ''), p.get('device_id', '')))
+            # Sort data based on x_axis_field (order computed with the columns)
+            if columns is None:
+                columns = self._paired_to_columns(paired_data, x_axis_field)
+            order = columns['order']
+            sorted_data = [paired_data[i] for i in order]
 
-            # Store paired data for tooltips
-            plot_widget.paired_data = sorted_data
-            plot_widget.plot_type = 'dumbbell'
+            plot_widget = self._new_comparison_plot('dumbbell', sorted_data)
             plot_widget.our_label = our_label
             plot_widget.other_label = other_label
 
-            # Color palette for groups
-            group_colors = [
-                '#2196F3', '#4CAF50', '#FF9800', '#E91E63', '#9C27B0',
-                '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#F44336'
-            ]
-
-            x_indices = list(range(len(sorted_data)))
-            our_values = [p['our_value'] for p in sorted_data]
-            other_values = [p['mfr_value'] for p in sorted_data]
-            x_tick_labels = [p.get('x_axis_value', p['device_id']) for p in sorted_data]
+            x_indices = np.arange(len(sorted_data))
+            our_values = columns['our_value'][order]
+            other_values = columns['mfr_value'][order]
+            x_tick_labels = columns['x_axis_value'][order].tolist()
 
             # Get unique groups if grouping is enabled
             if group_by_field:
-                groups = list(set(p.get('group', 'Unknown') for p in sorted_data))
-                groups.sort()
-                group_to_color = {g: group_colors[i % len(group_colors)] for i, g in enumerate(groups)}
-
-                # Add grouping boxes FIRST (behind everything)
-                self._add_comparison_grouping_boxes(plot_widget, sorted_data, x_indices,
-                                                    our_values + other_values, group_to_color)
-
-                # Draw connecting lines
-                for i, (our_v, other_v) in enumerate(zip(our_values, other_values)):
-                    group = sorted_data[i].get('group', 'Unknown')
-                    line_color = group_to_color.get(group, '#666666')
-
-                    line = pg.PlotDataItem(
-                        x=[i, i], y=[our_v, other_v],
-                        pen=pg.mkPen(line_color, width=1, style=Qt.PenStyle.DotLine)
-                    )
-                    line.connecting_line = True
-                    plot_widget.addItem(line)
+                groups = columns['group_names'].tolist()
+                group_ids = columns['group_id'][order]
+                group_rows = self._group_rows(group_ids, len(groups))
+
+                # Add grouping boxes FIRST (behind everything); one group needs none
+                if len(groups) > 1:
+                    y_min = float(min(our_values.min(), other_values.min()))
+                    y_max = float(max(our_values.max(), other_values.max()))
+                    self._add_comparison_grouping_boxes(plot_widget, group_ids, groups, y_min, y_max)
+
+                # Draw connecting lines, one item per group color
+                for k, group in enumerate(groups):
+                    group_indices = group_rows[k]
+                    self._add_connecting_lines(plot_widget, x_indices[group_indices], our_values[group_indices],
+                                               other_values[group_indices], GROUP_DOT_PENS[k % len(GROUP_DOT_PENS)])
 
                 # Create scatter plots per group - COMBINED legend entry
-                for group in groups:
-                    color = group_to_color[group]
+                for k, group in enumerate(groups):
+                    # Both series of a group share one pen and brush
+                    pen, brush = GROUP_PENS[k % len(GROUP_PENS)], GROUP_BRUSHES[k % len(GROUP_BRUSHES)]
 
                     # Get indices for this group
-                    group_indices = [i for i, p in enumerate(sorted_data) if p.get('group') == group]
-                    group_x = [x_indices[i] for i in group_indices]
-                    group_our = [our_values[i] for i in group_indices]
-                    group_other = [other_values[i] for i in group_indices]
+                    group_indices = group_rows[k]
+                    group_x = x_indices[group_indices]
+                    group_our = our_values[group_indices]
+                    group_other = other_values[group_indices]
 
                     # Our measurements for this group - circles (WITH legend entry)
                     our_scatter = pg.ScatterPlotItem(
                         x=group_x, y=group_our,
-                        pen=pg.mkPen(color, width=1),
-                        brush=pg.mkBrush(color),
+                        data=group_indices,
+                        pen=pen,
+                        brush=brush,
                         size=12,
                         symbol='o',
                         name=f"{group}"  # Single combined legend entry
                     )
-                    our_scatter.paired_indices = group_indices
                     our_scatter.data_type = 'our'
                     our_scatter.group = group
                     plot_widget.addItem(our_scatter)
@@ -1714,95 +2271,52 @@ class GraphPage:
                     # Other values for this group - triangles (NO legend entry - combined above)
                     other_scatter = pg.ScatterPlotItem(
                         x=group_x, y=group_other,
-                        pen=pg.mkPen(color, width=1),
-                        brush=pg.mkBrush(color),
+                        data=group_indices,
+                        pen=pen,
+                        brush=brush,
                         size=12,
                         symbol='t'
                         # No 'name' parameter - won't appear in legend
                     )
-                    other_scatter.paired_indices = group_indices
                     other_scatter.data_type = 'other'
                     other_scatter.group = group
                     plot_widget.addItem(other_scatter)
             else:
                 # No grouping - single color for each series
                 # Draw connecting lines
-                for i, (our_v, other_v) in enumerate(zip(our_values, other_values)):
-                    line = pg.PlotDataItem(
-                        x=[i, i], y=[our_v, other_v],
-                        pen=pg.mkPen('#666666', width=1, style=Qt.PenStyle.DotLine)
-                    )
-                    line.connecting_line = True
-                    plot_widget.addItem(line)
+                self._add_connecting_lines(plot_widget, x_indices, our_values, other_values, NEUTRAL_DOT_PEN)
 
                 # Our measurements - blue circles
                 our_scatter = pg.ScatterPlotItem(
                     x=x_indices, y=our_values,
-                    pen=pg.mkPen('#2196F3', width=1),
-                    brush=pg.mkBrush('#2196F3'),
+                    pen=DATA_PEN,
+                    brush=DATA_BRUSH,
                     size=12,
                     symbol='o',
                     name=our_label
                 )
-                our_scatter.paired_indices = list(range(len(sorted_data)))
                 our_scatter.data_type = 'our'
                 plot_widget.addItem(our_scatter)
 
                 # Other values - green triangles
                 other_scatter = pg.ScatterPlotItem(
                     x=x_indices, y=other_values,
-                    pen=pg.mkPen('#4CAF50', width=1),
-                    brush=pg.mkBrush('#4CAF50'),
+                    pen=COMPARISON_PEN,
+                    brush=COMPARISON_BRUSH,
                     size=12,
                     symbol='t',
                     name=other_label
                 )
-                other_scatter.paired_indices = list(range(len(sorted_data)))
                 other_scatter.data_type = 'other'
                 plot_widget.addItem(other_scatter)
 
             # Add spec lines with spec_line attribute for toggling
-            if lower_limit is not None:
-                lower_line = pg.InfiniteLine(
-                    pos=lower_limit, angle=0,
-                    pen=pg.mkPen('#FFA500', width=2, style=Qt.PenStyle.DashLine),
-                    label='Lower Limit', labelOpts={'position': 0.95, 'color': '#FFA500'}
-                )
-                lower_line.spec_line = True
-                lower_line.spec_line_type = 'lower'
-                plot_widget.addItem(lower_line)
-
-            if upper_limit is not None:
-                upper_line = pg.InfiniteLine(
-                    pos=upper_limit, angle=0,
-                    pen=pg.mkPen('#FF4444', width=2, style=Qt.PenStyle.DashLine),
-                    label='Upper Limit', labelOpts={'position': 0.95, 'color': '#FF4444'}
-                )
-                upper_line.spec_line = True
-                upper_line.spec_line_type = 'upper'
-                plot_widget.addItem(upper_line)
-
-            # Set labels and title
-            plot_widget.setTitle(title, color='#e0e0e0')
-            plot_widget.setLabel('bottom', x_label, color='#e0e0e0')
-            plot_widget.setLabel('left', y_label, color='#e0e0e0')
+            self._add_spec_limits(plot_widget, lower_limit, upper_limit)
 
             # Set X-axis ticks based on x_tick_labels (if not too many)
-            if len(x_tick_labels) <= 30:
-                ax = plot_widget.getAxis('bottom')
-                # Truncate long labels
-                tick_labels = []
-                for i, lbl in enumerate(x_tick_labels):
-                    lbl_str = str(lbl) if lbl else str(i)
-                    if len(lbl_str) > 10:
-                        lbl_str = lbl_str[-10:]  # Show last 10 chars
-                    tick_labels.append((i, lbl_str))
-                ax.setTicks([tick_labels])
-
-            # Setup interactive features
-            self._setup_comparison_plot_interactivity(plot_widget)
+            self._set_index_ticks(plot_widget, x_tick_labels)
 
-            plot_widget.graph_page = self
+            self._finish_comparison_plot(plot_widget, title, x_label, y_label)
             return plot_widget
 
         except Exception as e:
@@ -1812,107 +2326,77 @@ class GraphPage:
     def _create_difference_plot_v2(self, paired_data: list, title: str,
                                     y_label: str, x_label: str = "Device Index",
                                     group_by_field: str = None,
-                                    x_axis_field: str = 'index') -> Optional[pg.PlotWidget]:
+                                    x_axis_field: str = 'index',
+                                    columns: Optional[Dict[str, np.ndarray]] = None) -> Optional[pg.PlotWidget]:
         """
         Create difference plot showing (Our value - Comparison value) for each device.
         Supports grouping/coloring by field.
         X-axis ordering follows the x_axis_field selection.
         Includes all interactive features: tooltips, hover, etc.
+        ``columns`` is the _paired_to_columns view of paired_data (built if omitted).
         """
         try:
-            plot_widget = pg.PlotWidget()
-            plot_widget.setBackground('#1e1e1e')
-            plot_widget.showGrid(x=True, y=True, alpha=0.3)
-
             if not paired_data:
                 return None
 
-            # Create legend FIRST so it captures all items added after
-            legend = plot_widget.addLegend()
-            legend.setBrush(pg.mkBrush(30, 30, 30, 235))
-            legend.setOffset((10, 10))
-
-            # Sort data based on x_axis_field
-            if x_axis_field == 'index':
-                sorted_data = sorted(paired_data, key=lambda p: p['device_id'])
-            else:
-                sorted_data = sorted(paired_data, key=lambda p: (p.get('x_axis_value', ''), p.get('device_id', '')))
-
-            # Store paired data for tooltips
-            plot_widget.paired_data = sorted_data
-            plot_widget.plot_type = 'difference'
+            # Sort data based on x_axis_field (order computed with the columns)
+            if columns is None:
+                columns = self._paired_to_columns(paired_data, x_axis_field)
+            order = columns['order']
+            sorted_data = [paired_data[i] for i in order]
 
-            x_indices = list(range(len(sorted_data)))
-            differences = [p['our_value'] - p['mfr_value'] for p in sorted_data]
-            x_tick_labels = [p.get('x_axis_value', p['device_id']) for p in sorted_data]
+            plot_widget = self._new_comparison_plot('difference', sorted_data)
 
-            # Store differences in paired data for tooltip access
-            for i, p in enumerate(sorted_data):
-                p['difference'] = differences[i]
+            x_indices = np.arange(len(sorted_data))
+            differences = columns['difference'][order]
+            x_tick_labels = columns['x_axis_value'][order].tolist()
 
-            # Color palette for groups
-            group_colors = [
-                '#2196F3', '#4CAF50', '#FF9800', '#E91E63', '#9C27B0',
-                '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#F44336'
-            ]
+            # Differences in plotted order, for tooltips
+            plot_widget.differences = differences
 
             if group_by_field:
                 # Get unique groups
-                groups = list(set(p.get('group', 'Unknown') for p in sorted_data))
-                groups.sort()
-                group_to_color = {g: group_colors[i % len(group_colors)] for i, g in enumerate(groups)}
+                groups = columns['group_names'].tolist()
+                group_ids = columns['group_id'][order]
+                group_rows = self._group_rows(group_ids, len(groups))
 
-                # Add grouping boxes FIRST (behind everything)
-                self._add_comparison_grouping_boxes(plot_widget, sorted_data, x_indices,
-                                                    differences, group_to_color)
+                # Add grouping boxes FIRST (behind everything); one group needs none
+                if len(groups) > 1:
+                    self._add_comparison_grouping_boxes(plot_widget, group_ids, groups,
+                                                        float(differences.min()), float(differences.max()))
 
-                # Draw connecting lines to zero (behind points)
-                for i, diff in enumerate(differences):
-                    group = sorted_data[i].get('group', 'Unknown')
-                    line_color = group_to_color.get(group, '#666666')
-
-                    line = pg.PlotDataItem(
-                        x=[i, i], y=[0, diff],
-                        pen=pg.mkPen(line_color, width=1, style=Qt.PenStyle.DotLine)
-                    )
-                    line.connecting_line = True
-                    plot_widget.addItem(line)
+                # Draw connecting lines to zero (behind points), one item per group color
+                for k, group in enumerate(groups):
+                    group_indices = group_rows[k]
+                    self._add_connecting_lines(plot_widget, x_indices[group_indices], 0.0,
+                                               differences[group_indices], GROUP_DOT_PENS[k % len(GROUP_DOT_PENS)])
 
                 # Create scatter plots per group for legend
-                for group in groups:
-                    color = group_to_color[group]
-
+                for k, group in enumerate(groups):
                     # Get data for this group
-                    group_indices = [i for i, p in enumerate(sorted_data) if p.get('group') == group]
-                    group_x = [x_indices[i] for i in group_indices]
-                    group_diff = [differences[i] for i in group_indices]
+                    group_indices = group_rows[k]
 
                     scatter = pg.ScatterPlotItem(
-                        x=group_x, y=group_diff,
-                        pen=pg.mkPen(color, width=1),
-                        brush=pg.mkBrush(color),
+                        x=x_indices[group_indices], y=differences[group_indices],
+                        data=group_indices,
+                        pen=GROUP_PENS[k % len(GROUP_PENS)],
+                        brush=GROUP_BRUSHES[k % len(GROUP_BRUSHES)],
                         size=12,
                         name=group
                     )
-                    scatter.paired_indices = group_indices
                     scatter.group = group
                     plot_widget.addItem(scatter)
             else:
                 # Draw connecting lines to zero (behind points)
                 # Color based on sign: green for positive, red for negative
-                for i, diff in enumerate(differences):
-                    line_color = '#4CAF50' if diff >= 0 else '#FF4444'
-
-                    line = pg.PlotDataItem(
-                        x=[i, i], y=[0, diff],
-                        pen=pg.mkPen(line_color, width=1, style=Qt.PenStyle.DotLine)
-                    )
-                    line.connecting_line = True
-                    plot_widget.addItem(line)
+                positive = differences >= 0
+                self._add_connecting_lines(plot_widget, x_indices[positive], 0.0,
+                                           differences[positive], POSITIVE_DOT_PEN)
+                self._add_connecting_lines(plot_widget, x_indices[~positive], 0.0,
+                                           differences[~positive], NEGATIVE_DOT_PEN)
 
                 # Color points based on sign (green=positive, red=negative)
-                colors = ['#4CAF50' if d >= 0 else '#FF4444' for d in differences]
-                brushes = [pg.mkBrush(c) for c in colors]
+                brushes = self._sign_brushes(differences)
 
                 # Create scatter plot
                 scatter = pg.ScatterPlotItem(
@@ -1921,7 +2405,6 @@ class GraphPage:
                     brush=brushes,
                     size=12
                 )
-                scatter.paired_indices = list(range(len(sorted_data)))
                 plot_widget.addItem(scatter)
 
             # Add zero reference line
@@ -1932,105 +2415,170 @@ class GraphPage:
             )
             plot_widget.addItem(zero_line)
 
-            # Set labels and title
-            plot_widget.setTitle(title, color='#e0e0e0')
-            plot_widget.setLabel('bottom', x_label, color='#e0e0e0')
-            plot_widget.setLabel('left', y_label, color='#e0e0e0')
+            # Set X-axis ticks based on x_tick_labels (if not too many)
+            self._set_index_ticks(plot_widget, x_tick_labels)
+
+            self._finish_comparison_plot(plot_widget, title, x_label, y_label)
+            return plot_widget
+
+        except Exception as e:
+            logger.error(f"Error creating difference plot: {e}")
+            return None
+
+    @staticmethod
+    def _new_comparison_plot(plot_type: str, paired_data: list) -> pg.PlotWidget:
+        """
+        Empty comparison plot widget: dark background, grid and legend.
+
+        The legend is created first so it captures every series added after;
+        ``paired_data`` (in plotted order) is kept on the widget for tooltips,
+        with default series labels a builder may override.
+        """
+        plot_widget = pg.PlotWidget()
+        plot_widget.setBackground('#1e1e1e')
+        plot_widget.showGrid(x=True, y=True, alpha=0.3)
+
+        legend = plot_widget.addLegend()
+        legend.setBrush(pg.mkBrush(30, 30, 30, 235))
+        legend.setOffset((10, 10))
+
+        plot_widget.paired_data = paired_data
+        plot_widget.plot_type = plot_type
+        plot_widget.our_label = 'Our Value'
+        plot_widget.other_label = 'Comparison'
+        return plot_widget
+
+    def _finish_comparison_plot(self, plot_widget: pg.PlotWidget, title: str, x_label: str, y_label: str):
+        """Set title and axis labels, then cache the data items and add tooltips/crosshairs."""
+        plot_widget.setTitle(title, color='#e0e0e0')
+        plot_widget.setLabel('bottom', x_label, color='#e0e0e0')
+        plot_widget.setLabel('left', y_label, color='#e0e0e0')
+
+        # Cache the data items before the tooltip/crosshair items are added
+        self._cache_static_items(plot_widget)
+
+        # Setup interactive features
+        self._setup_comparison_plot_interactivity(plot_widget)
+
+        plot_widget.graph_page = self
+
+    @staticmethod
+    def _add_spec_limits(plot_widget: pg.PlotWidget, lower_limit: Optional[float],
+                         upper_limit: Optional[float], include_vertical: bool = False):
+        """
+        Add toggleable spec limit lines (``spec_line`` / ``spec_line_type`` set).
+
+        Horizontal labelled lines mark the limits on Y; ``include_vertical``
+        also marks them on X with thinner dotted lines (correlation plots).
+        """
+        for limit, limit_type, color, label in ((lower_limit, 'lower', '#FFA500', 'Lower Limit'),
+                                                (upper_limit, 'upper', '#FF4444', 'Upper Limit')):
+            if limit is None:
+                continue
 
-            # Set X-axis ticks based on x_tick_labels (if not too many)
-            if len(x_tick_labels) <= 30:
-                ax = plot_widget.getAxis('bottom')
-                # Truncate long labels
-                tick_labels = []
-                for i, lbl in enumerate(x_tick_labels):
-                    lbl_str = str(lbl) if lbl else str(i)
-                    if len(lbl_str) > 10:
-                        lbl_str = lbl_str[-10:]  # Show last 10 chars
-                    tick_labels.append((i, lbl_str))
-                ax.setTicks([tick_labels])
-
-            # Setup interactive features
-            self._setup_comparison_plot_interactivity(plot_widget)
+            horizontal_pen, vertical_pen = SPEC_LIMIT_PENS[limit_type]
+            horizontal = pg.InfiniteLine(
+                pos=limit, angle=0,
+                pen=horizontal_pen,
+                label=label, labelOpts={'position': 0.95, 'color': color}
+            )
+            horizontal.spec_line = True
+            horizontal.spec_line_type = limit_type
+            plot_widget.addItem(horizontal)
+
+            if include_vertical:
+                vertical = pg.InfiniteLine(pos=limit, angle=90, pen=vertical_pen)
+                vertical.spec_line = True
+                vertical.spec_line_type = limit_type
+                plot_widget.addItem(vertical)
+
+    @staticmethod
+    def _add_connecting_lines(plot_widget: pg.PlotWidget, x: np.ndarray, y_from, y_to: np.ndarray, pen):
+        """
+        Add dotted vertical segments from ``y_from`` to ``y_to`` at each ``x``.
 
-            plot_widget.graph_page = self
-            return plot_widget
+        All segments drawn with one (dotted) pen are a single bare
+        PlotCurveItem whose path pyqtgraph builds in one arrayToQPath call
+        (connect='pairs'), not one item per point.
+        """
+        if len(x) == 0:
+            return
+        xs = np.repeat(x, 2).astype(np.float64)
+        ys = np.empty(2 * len(x), dtype=np.float64)
+        ys[0::2] = y_from
+        ys[1::2] = y_to
+        line = pg.PlotCurveItem(x=xs, y=ys, connect='pairs', pen=pen)
+        line.connecting_line = True
+        plot_widget.addItem(line)
+
+    @staticmethod
+    def _set_index_ticks(plot_widget: pg.PlotWidget, x_tick_labels: list, max_ticks: int = 30):
+        """Label X indices with their values (last 10 chars; index if empty), up to ``max_ticks``."""
+        if len(x_tick_labels) > max_ticks:
+            return
+        tick_labels = [(i, str(lbl or i)[-10:]) for i, lbl in enumerate(x_tick_labels)]
+        plot_widget.getAxis('bottom').setTicks([tick_labels])
 
-        except Exception as e:
-            logger.error(f"Error creating difference plot: {e}")
-            return None
+    @staticmethod
+    def _cache_static_items(plot_widget: pg.PlotWidget):
+        """
+        Cache scatter, connecting-line and grouping-box items in device coordinates.
 
-    def _add_comparison_grouping_boxes(self, plot_widget: pg.PlotWidget, sorted_data: list,
-                                        x_indices: list, all_y_values: list,
-                                        group_to_color: dict):
+        Panning then blits their pixmaps instead of repainting every symbol.
+        Items that move with the mouse (tooltip, crosshairs) are left uncached.
+        """
+        for item in plot_widget.getPlotItem().items:
+            if (isinstance(item, pg.ScatterPlotItem) or getattr(item, 'connecting_line', False)
+                    or getattr(item, 'grouping_box', False) or getattr(item, 'grouping_box_label', False)):
+                item.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    @staticmethod
+    def _sign_brushes(values: np.ndarray) -> list:
+        """One brush per value: green for >= 0, red for negative (two shared brushes)."""
+        return np.where(values >= 0, POSITIVE_BRUSH, NEGATIVE_BRUSH).tolist()
+
+    def _add_comparison_grouping_boxes(self, plot_widget: pg.PlotWidget, group_ids: np.ndarray,
+                                        groups: list, y_min: float, y_max: float):
         """
         Add grouping boxes to comparison plots.
 
         Creates dashed rectangular boxes around each group of points with labels.
+        ``group_ids`` holds each plotted point's index into ``groups``, in X order,
+        which also picks the group's palette color; ``y_min``/``y_max`` is the Y
+        extent of the plotted values.
         """
         plot_item = plot_widget.getPlotItem()
 
-        if not group_to_color or len(group_to_color) <= 1:
+        if len(groups) <= 1:
             return
 
-        # Get Y range
-        y_min = min(all_y_values)
-        y_max = max(all_y_values)
+        # Pad the Y range
         y_range = y_max - y_min
         y_min_box = y_min - y_range * 0.1
         y_max_box = y_max + y_range * 0.15  # Extra space for label
 
-        # Group indices by group name
-        group_indices = defaultdict(list)
-        for i, p in enumerate(sorted_data):
-            group = p.get('group', 'Unknown')
-            group_indices[group].append(i)
-
-        for group_name, indices in group_indices.items():
-            if not indices:
-                continue
+        # First and last X index of each group, boxes in order of first appearance
+        present, first_indices = np.unique(group_ids, return_index=True)
+        last_indices = len(group_ids) - 1 - np.unique(group_ids[::-1], return_index=True)[1]
+        group_bounds = sorted(zip(first_indices.tolist(), last_indices.tolist(), present.tolist()))
 
-            color = group_to_color.get(group_name, '#888888')
+        for first_index, last_index, k in group_bounds:
+            group_name = groups[k]
+            color = GROUP_COLORS[k % len(GROUP_COLORS)]
 
             # Calculate box bounds
-            x_min_box = min(indices) - 0.4
-            x_max_box = max(indices) + 0.4
+            x_min_box = first_index - 0.4
+            x_max_box = last_index + 0.4
             x_center = (x_min_box + x_max_box) / 2
 
-            # Create dashed box using LinearRegionItem or custom path
-            # Use a simple approach with lines
-            pen = pg.mkPen(color=color, width=1, style=Qt.PenStyle.DashLine)
-
-            # Left vertical line
-            left_line = pg.PlotDataItem(
-                x=[x_min_box, x_min_box], y=[y_min_box, y_max_box],
-                pen=pen
-            )
-            left_line.grouping_box = True
-            plot_item.addItem(left_line)
-
-            # Right vertical line
-            right_line = pg.PlotDataItem(
-                x=[x_max_box, x_max_box], y=[y_min_box, y_max_box],
-                pen=pen
-            )
-            right_line.grouping_box = True
-            plot_item.addItem(right_line)
-
-            # Top horizontal line
-            top_line = pg.PlotDataItem(
-                x=[x_min_box, x_max_box], y=[y_max_box, y_max_box],
-                pen=pen
-            )
-            top_line.grouping_box = True
-            plot_item.addItem(top_line)
-
-            # Bottom horizontal line
-            bottom_line = pg.PlotDataItem(
-                x=[x_min_box, x_max_box], y=[y_min_box, y_min_box],
-                pen=pen
+            # Dashed box as one closed polyline (a single item per group)
+            box = pg.PlotDataItem(
+                x=[x_min_box, x_max_box, x_max_box, x_min_box, x_min_box],
+                y=[y_min_box, y_min_box, y_max_box, y_max_box, y_min_box],
+                pen=GROUP_BOX_PENS[k % len(GROUP_BOX_PENS)]
             )
-            bottom_line.grouping_box = True
-            plot_item.addItem(bottom_line)
+            box.grouping_box = True
+            plot_item.addItem(box)
 
             # Add label on top
             label = pg.TextItem(
@@ -2070,56 +2618,48 @@ class GraphPage:
         tooltip_label.setVisible(False)
         plot_item.addItem(tooltip_label)
         plot_widget.tooltip_label = tooltip_label
-
-        # Setup crosshairs
-        v_line = pg.InfiniteLine(angle=90, movable=False)
-        h_line = pg.InfiniteLine(angle=0, movable=False)
-        plot_item.addItem(v_line, ignoreBounds=True)
-        plot_item.addItem(h_line, ignoreBounds=True)
-
-        pen = pg.mkPen(color='#888888', width=1, style=Qt.PenStyle.DashLine)
-        v_line.setPen(pen)
-        h_line.setPen(pen)
-        v_line.setVisible(False)
-        h_line.setVisible(False)
-
-        plot_widget.crosshair_v = v_line
-        plot_widget.crosshair_h = h_line
+        plot_widget.tooltip_rows = self._comparison_tooltip_rows(plot_widget)
+        plot_widget.tooltip_key = None
+        plot_widget.point_menu = None
+        plot_widget.last_mouse_pos = None
+
+        # Crosshairs are created on the first hover (see _crosshairs)
+        plot_widget.crosshair_v = None
+        plot_widget.crosshair_h = None
         plot_widget.crosshairs_enabled = True
 
         # Track hover state
         plot_widget.hover_item = None
         plot_widget.hover_idx = None
         plot_widget.original_sizes = {}
+        schedule_hover = self._setup_comparison_hover_search(plot_widget)
 
         # Mouse move handler for hover and crosshairs
         def on_mouse_moved(pos):
             if isinstance(pos, tuple):
                 pos = pos[0]
+            if not self._mouse_moved_past_pixel(plot_widget, pos):
+                return
 
             # Update crosshairs
-            if getattr(plot_widget, 'crosshairs_enabled', True):
+            if plot_widget.crosshairs_enabled:
                 if plot_item.sceneBoundingRect().contains(pos):
                     mouse_point = plot_item.vb.mapSceneToView(pos)
+                    v_line, h_line = self._crosshairs(plot_widget)
                     v_line.setPos(mouse_point.x())
                     h_line.setPos(mouse_point.y())
                     v_line.setVisible(True)
                     h_line.setVisible(True)
-                else:
-                    v_line.setVisible(False)
-                    h_line.setVisible(False)
+                elif plot_widget.crosshair_v is not None:
+                    plot_widget.crosshair_v.setVisible(False)
+                    plot_widget.crosshair_h.setVisible(False)
 
             # Handle hover highlighting
             if not plot_item.sceneBoundingRect().contains(pos):
-                self._clear_comparison_hover(plot_widget)
+                schedule_hover(None)
                 return
 
-            nearest_item, nearest_idx, distance = self._find_comparison_nearest_point(pos, plot_widget)
-
-            if nearest_item is not None and nearest_idx is not None:
-                self._apply_comparison_hover(nearest_item, nearest_idx, plot_widget)
-            else:
-                self._clear_comparison_hover(plot_widget)
+            schedule_hover(pos)
 
         # Mouse click handler for tooltips and context menu
         def on_mouse_clicked(evt):
@@ -2148,151 +2688,296 @@ class GraphPage:
         # Extend context menu with grid density options
         self._extend_comparison_context_menu(plot_widget)
 
+    @staticmethod
+    def _crosshairs(plot_widget: pg.PlotWidget) -> Tuple[pg.InfiniteLine, pg.InfiniteLine]:
+        """
+        The plot's (vertical, horizontal) crosshair lines, created on first use.
+
+        Most plots on a page are never hovered, so their setup leaves
+        ``crosshair_v``/``crosshair_h`` as None instead of building lines.
+        """
+        if plot_widget.crosshair_v is None:
+            plot_item = plot_widget.getPlotItem()
+            for angle, attr in ((90, 'crosshair_v'), (0, 'crosshair_h')):
+                line = pg.InfiniteLine(angle=angle, movable=False, pen=CROSSHAIR_PEN)
+                line.setVisible(False)
+                plot_item.addItem(line, ignoreBounds=True)
+                setattr(plot_widget, attr, line)
+        return plot_widget.crosshair_v, plot_widget.crosshair_h
+
+    @staticmethod
+    def _mouse_moved_past_pixel(plot_widget: pg.PlotWidget, pos) -> bool:
+        """
+        True if the cursor is at least a pixel (|dx| + |dy|) from where the
+        plot's mouse-move handler last ran; sub-pixel jitter is ignored.
+        """
+        last_pos = plot_widget.last_mouse_pos
+        if last_pos is not None and abs(pos.x() - last_pos[0]) + abs(pos.y() - last_pos[1]) < 1.0:
+            return False
+        plot_widget.last_mouse_pos = (pos.x(), pos.y())
+        return True
+
+    def _setup_comparison_hover_search(self, plot_widget: pg.PlotWidget):
+        """
+        Install the deferred hover search of a comparison or relational plot.
+
+        Returns a function for the mouse-move handler: called with a scene
+        position it (re)starts a single-shot timer, so the nearest-point search
+        and highlight run once the cursor pauses; called with None it cancels a
+        pending search and clears the highlight.
+        """
+        plot_item = plot_widget.getPlotItem()
+        pending = {'pos': None}
+
+        # Last nearest-point lookup, reused while the pointer stays within a
+        # pixel of where it was made; any pan/zoom/resize invalidates it
+        last_hover = {'pos': None, 'nearest': (None, None)}
+
+        def forget_last_hover(*_):
+            last_hover['pos'] = None
+
+        plot_item.vb.sigTransformChanged.connect(forget_last_hover)
+
+        def run_hover_search():
+            pos = pending['pos']
+            if pos is None:
+                return
+
+            last_pos = last_hover['pos']
+            if last_pos is not None and (pos.x() - last_pos[0]) ** 2 + (pos.y() - last_pos[1]) ** 2 < 1.0:
+                nearest_item, nearest_idx = last_hover['nearest']
+            else:
+                nearest_item, nearest_idx, distance = self._find_comparison_nearest_point(pos, plot_widget)
+                last_hover['pos'] = (pos.x(), pos.y())
+                last_hover['nearest'] = (nearest_item, nearest_idx)
+
+            if nearest_item is not None and nearest_idx is not None:
+                # Re-highlighting the same point would only rebuild its size array
+                if nearest_item is not plot_widget.hover_item or nearest_idx != plot_widget.hover_idx:
+                    self._apply_comparison_hover(nearest_item, nearest_idx, plot_widget)
+            else:
+                self._clear_comparison_hover(plot_widget)
+
+        hover_timer = QTimer(plot_widget)
+        hover_timer.setSingleShot(True)
+        hover_timer.setInterval(HOVER_SEARCH_DELAY_MS)
+        hover_timer.timeout.connect(run_hover_search)
+        plot_widget.hover_timer = hover_timer
+
+        def schedule_hover(pos):
+            pending['pos'] = pos
+            if pos is None:
+                hover_timer.stop()
+                self._clear_comparison_hover(plot_widget)
+            else:
+                hover_timer.start()
+
+        return schedule_hover
+
     def _find_comparison_nearest_point(self, scene_pos, plot_widget, threshold=20):
-        """Find nearest scatter point to cursor position."""
+        """
+        Find nearest scatter point to cursor position.
+
+        The view box's view-to-scene transform only scales and translates, so
+        the pixel ``threshold`` becomes a per-axis scale in view coordinates and
+        each item is searched through its cached X-sorted point index.
+        """
         plot_item = plot_widget.getPlotItem()
         nearest_item, nearest_idx, min_distance = None, None, float('inf')
 
+        vb = plot_item.vb
+        to_scene = vb.childTransform() * vb.sceneTransform()
+        view_pos = vb.mapSceneToView(scene_pos)
+        x_scale, y_scale = to_scene.m11(), to_scene.m22()
+
         for item in plot_item.items:
             if isinstance(item, pg.ScatterPlotItem):
-                points = item.getData()
-                if points is None or len(points[0]) == 0:
+                if len(item.data) == 0:
                     continue
 
-                x_data, y_data = points
+                i, dist = nearest_point_indexed(scatter_point_index(item), view_pos.x(), view_pos.y(),
+                                                x_scale, y_scale, threshold)
+                if dist < threshold and dist < min_distance:
+                    min_distance = dist
+                    nearest_item = item
+                    nearest_idx = i
 
-                for i, (x, y) in enumerate(zip(x_data, y_data)):
-                    screen_pos = plot_item.vb.mapViewToScene(QPointF(x, y))
-                    dist = ((screen_pos.x() - scene_pos.x())**2 +
-                           (screen_pos.y() - scene_pos.y())**2)**0.5
+        return nearest_item, nearest_idx, min_distance
 
-                    if dist < threshold and dist < min_distance:
-                        min_distance = dist
-                        nearest_item = item
-                        nearest_idx = i
+    @staticmethod
+    def _paired_index(item, idx: int) -> int:
+        """
+        Row of the plot's paired data behind point ``idx`` of a scatter item.
 
-        return nearest_item, nearest_idx, min_distance
+        Grouped scatters carry each point's row as its point data (``data=``);
+        items without it are aligned with the paired data.
+        """
+        points = item.points()
+        row = points[idx].data() if idx < len(points) else None
+        return idx if row is None else int(row)
 
     def _apply_comparison_hover(self, item, idx, plot_widget):
         """Apply hover highlight to a point."""
-        # Clear previous hover
-        self._clear_comparison_hover(plot_widget)
+        original_size, sizes = self._comparison_hover_sizes(item, plot_widget)
 
-        # Store original size
-        if item not in plot_widget.original_sizes:
-            plot_widget.original_sizes[item] = item.opts.get('size', 12)
-
-        # Get current sizes and increase the hovered point
-        original_size = plot_widget.original_sizes[item]
+        # Clear previous hover; on the same item only its size entry needs resetting
+        if plot_widget.hover_item is item:
+            if plot_widget.hover_idx < len(sizes):
+                sizes[plot_widget.hover_idx] = original_size
+        else:
+            self._clear_comparison_hover(plot_widget)
 
-        # Create new size array with highlighted point
-        x_data, y_data = item.getData()
-        sizes = [original_size] * len(x_data)
         sizes[idx] = original_size * 1.5
-
         item.setSize(sizes)
 
         plot_widget.hover_item = item
         plot_widget.hover_idx = idx
 
+    @staticmethod
+    def _comparison_hover_sizes(item, plot_widget):
+        """
+        Original point size of a scatter item and its per-point size array.
+
+        The array is allocated once per item (and again if its point count
+        changes); hovering only updates the entries that change.
+        """
+        original_size, sizes = plot_widget.original_sizes.get(item, (None, None))
+        if sizes is None or len(sizes) != len(item.data):
+            if original_size is None:
+                original_size = item.opts.get('size', 12)
+            sizes = np.full(len(item.data), original_size, dtype=np.float32)
+            plot_widget.original_sizes[item] = (original_size, sizes)
+        return original_size, sizes
+
     def _clear_comparison_hover(self, plot_widget):
         """Clear hover highlight."""
         if plot_widget.hover_item is not None:
-            original_size = plot_widget.original_sizes.get(plot_widget.hover_item, 12)
-            plot_widget.hover_item.setSize(original_size)
+            item = plot_widget.hover_item
+            original_size, sizes = self._comparison_hover_sizes(item, plot_widget)
+            if plot_widget.hover_idx < len(sizes):
+                sizes[plot_widget.hover_idx] = original_size
+            item.setSize(sizes)
             plot_widget.hover_item = None
             plot_widget.hover_idx = None
 
     def _show_comparison_tooltip(self, item, idx, plot_widget):
         """Show tooltip for a comparison plot point."""
         tooltip_label = plot_widget.tooltip_label
-        paired_data = getattr(plot_widget, 'paired_data', None)
-        plot_type = getattr(plot_widget, 'plot_type', 'unknown')
+        paired_data = plot_widget.paired_data
 
-        # Get labels from plot_widget or use defaults
-        our_label = getattr(plot_widget, 'our_label', 'Our Value')
-        other_label = getattr(plot_widget, 'other_label', 'Comparison')
-
-        if paired_data is None or idx >= len(paired_data):
+        data_idx = self._paired_index(item, idx)
+        if data_idx >= len(paired_data):
             return
 
-        pair = paired_data[idx]
+        # The label still shows this point's text; skip re-rendering the HTML
+        if plot_widget.tooltip_key != (item, data_idx):
+            pair = paired_data[data_idx]
 
-        # Build tooltip text based on plot type
-        lines = []
-        lines.append(f"<b>Device:</b> {pair.get('device_id', 'N/A')}")
+            # Value rows for this plot type (chosen once per plot)
+            lines = [f"<b>Device:</b> {pair.device_id}"]
+            lines += plot_widget.tooltip_rows(pair, data_idx, getattr(item, 'data_type', 'unknown'))
 
-        if plot_type == 'correlation':
-            lines.append(f"<b>{our_label}:</b> {pair.get('our_value', 0):.4f}")
-            lines.append(f"<b>{other_label}:</b> {pair.get('mfr_value', 0):.4f}")
-            diff = pair.get('our_value', 0) - pair.get('mfr_value', 0)
-            lines.append(f"<b>Difference:</b> {diff:.4f}")
-        elif plot_type in ['dumbbell', 'manufacturer_comparison']:
-            data_type = getattr(item, 'data_type', 'unknown')
-            if data_type == 'our':
-                lines.append(f"<b>{our_label}:</b> {pair.get('our_value', 0):.4f}")
-            elif data_type in ['other', 'manufacturer']:
-                lines.append(f"<b>{other_label}:</b> {pair.get('mfr_value', 0):.4f}")
-            lines.append(f"<b>Difference:</b> {pair.get('our_value', 0) - pair.get('mfr_value', 0):.4f}")
-        elif plot_type == 'difference':
-            lines.append(f"<b>Difference:</b> {pair.get('difference', 0):.4f}")
-            lines.append(f"<b>{our_label}:</b> {pair.get('our_value', 0):.4f}")
-            lines.append(f"<b>{other_label}:</b> {pair.get('mfr_value', 0):.4f}")
-
-        # Get measurement info if available
-        our_m = pair.get('our_measurement')
-        if our_m:
-            if hasattr(our_m, 'sub_test') and our_m.sub_test:
-                if hasattr(our_m.sub_test, 'test_log') and our_m.sub_test.test_log:
-                    tl = our_m.sub_test.test_log
-                    if tl.test_fixture:
-                        lines.append(f"<b>Fixture:</b> {tl.test_fixture}")
-                    if tl.created_at:
-                        lines.append(f"<b>Date:</b> {tl.created_at.strftime('%Y-%m-%d')}")
+            # Measurement info, formatted when the pairs were annotated
+            if pair.meta_html:
+                lines.append(pair.meta_html)
 
-        tooltip_text = "<br>".join(lines)
-        tooltip_label.setHtml(f"<div style='padding: 5px;'>{tooltip_text}</div>")
+            tooltip_text = "<br>".join(lines)
+            tooltip_label.setHtml(f"<div style='padding: 5px;'>{tooltip_text}</div>")
+            plot_widget.tooltip_key = (item, data_idx)
 
         # Position tooltip near the point
         x_data, y_data = item.getData()
         tooltip_label.setPos(x_data[idx], y_data[idx])
         tooltip_label.setVisible(True)
 
+    @staticmethod
+    def _comparison_tooltip_rows(plot_widget):
+        """
+        Tooltip value-row builder of a comparison plot, chosen once per plot.
+
+        Returns ``rows(pair, data_idx, data_type) -> list`` of HTML rows for the
+        plot's type, with its series labels bound; ``data_type`` is the hovered
+        series of a dumbbell plot.
+        """
+        plot_type = plot_widget.plot_type
+        our_label = plot_widget.our_label
+        other_label = plot_widget.other_label
+
+        if plot_type == 'correlation':
+            def rows(pair, data_idx, data_type):
+                return [f"<b>{our_label}:</b> {pair.our_value:.4f}",
+                        f"<b>{other_label}:</b> {pair.mfr_value:.4f}",
+                        f"<b>Difference:</b> {pair.our_value - pair.mfr_value:.4f}"]
+        elif plot_type in ('dumbbell', 'manufacturer_comparison'):
+            def rows(pair, data_idx, data_type):
+                difference = f"<b>Difference:</b> {pair.our_value - pair.mfr_value:.4f}"
+                if data_type == 'our':
+                    return [f"<b>{our_label}:</b> {pair.our_value:.4f}", difference]
+                if data_type in ('other', 'manufacturer'):
+                    return [f"<b>{other_label}:</b> {pair.mfr_value:.4f}", difference]
+                return [difference]
+        elif plot_type == 'difference':
+            differences = plot_widget.differences
+
+            def rows(pair, data_idx, data_type):
+                return [f"<b>Difference:</b> {differences[data_idx]:.4f}",
+                        f"<b>{our_label}:</b> {pair.our_value:.4f}",
+                        f"<b>{other_label}:</b> {pair.mfr_value:.4f}"]
+        else:
+            def rows(pair, data_idx, data_type):
+                return []
+
+        return rows
+
     def _show_comparison_point_menu(self, event, item, idx, plot_widget):
         """Show context menu for a comparison point."""
-        paired_data = getattr(plot_widget, 'paired_data', None)
-        if paired_data is None or idx >= len(paired_data):
+        paired_data = plot_widget.paired_data
+        data_idx = self._paired_index(item, idx)
+        if data_idx >= len(paired_data):
             return
 
-        pair = paired_data[idx]
-
-        menu = QMenu()
-
-        # View test log action
-        view_log_action = menu.addAction("View Test Log")
+        pair = paired_data[data_idx]
 
-        # Copy values action
-        copy_action = menu.addAction("Copy Values")
+        menu, view_log_action, copy_action = self._point_menu(plot_widget)
+        view_log_action.setEnabled(True)
 
         # Show at cursor
         action = menu.exec(event.screenPos().toPoint())
 
         if action == view_log_action:
-            our_m = pair.get('our_measurement')
+            our_m = pair.our_measurement
             if our_m and hasattr(our_m, 'sub_test') and our_m.sub_test:
                 if hasattr(our_m.sub_test, 'test_log') and our_m.sub_test.test_log:
                     html_content = our_m.sub_test.test_log.html_content
                     if html_content:
                         self.view_test_log_html(html_content)
         elif action == copy_action:
-            our_label = getattr(plot_widget, 'our_label', 'Our Value')
-            other_label = getattr(plot_widget, 'other_label', 'Comparison')
-            text = f"Device: {pair.get('device_id')}\n"
-            text += f"{our_label}: {pair.get('our_value', 0):.4f}\n"
-            text += f"{other_label}: {pair.get('mfr_value', 0):.4f}\n"
-            text += f"Difference: {pair.get('our_value', 0) - pair.get('mfr_value', 0):.4f}"
+            our_label = plot_widget.our_label
+            other_label = plot_widget.other_label
+            text = f"Device: {pair.device_id}\n"
+            text += f"{our_label}: {pair.our_value:.4f}\n"
+            text += f"{other_label}: {pair.mfr_value:.4f}\n"
+            text += f"Difference: {pair.our_value - pair.mfr_value:.4f}"
             QApplication.clipboard().setText(text)
 
+    @staticmethod
+    def _point_menu(plot_widget):
+        """
+        Point context menu of a comparison or relational plot.
+
+        Built on the first right-click and kept on the plot widget; returns
+        ``(menu, view_log_action, copy_action)``. Callers dispatch on the
+        action ``exec`` returns.
+        """
+        cached = plot_widget.point_menu
+        if cached is None:
+            menu = QMenu(plot_widget)
+            view_log_action = menu.addAction("View Test Log")
+            menu.addSeparator()
+            copy_action = menu.addAction("Copy Values")
+            cached = plot_widget.point_menu = (menu, view_log_action, copy_action)
+        return cached
+
     def _extend_comparison_context_menu(self, plot_widget):
         """Extend the default context menu with grid density options."""
         plot_item = plot_widget.getPlotItem()
@@ -2304,35 +2989,19 @@ class GraphPage:
         # Add separator
         default_menu.addSeparator()
 
-        # Create Grid Density submenu
+        # Create Grid Density submenu; each action carries its (axis, density)
+        # and one slot on the submenu handles them all
         grid_density_menu = default_menu.addMenu("Grid Density")
 
-        # X-Axis density
-        x_density_menu = grid_density_menu.addMenu("X-Axis")
-        for density_name in ['Sparse', 'Normal', 'Dense']:
-            action = QAction(density_name, x_density_menu)
-            action.triggered.connect(
-                lambda checked, d=density_name.lower(): self._set_comparison_grid_density(plot_widget, 'x', d)
-            )
-            x_density_menu.addAction(action)
-
-        # Y-Axis density
-        y_density_menu = grid_density_menu.addMenu("Y-Axis")
-        for density_name in ['Sparse', 'Normal', 'Dense']:
-            action = QAction(density_name, y_density_menu)
-            action.triggered.connect(
-                lambda checked, d=density_name.lower(): self._set_comparison_grid_density(plot_widget, 'y', d)
-            )
-            y_density_menu.addAction(action)
-
-        # Both Axes density
-        both_density_menu = grid_density_menu.addMenu("Both Axes")
-        for density_name in ['Sparse', 'Normal', 'Dense']:
-            action = QAction(density_name, both_density_menu)
-            action.triggered.connect(
-                lambda checked, d=density_name.lower(): self._set_comparison_grid_density(plot_widget, 'both', d)
-            )
-            both_density_menu.addAction(action)
+        for axis_name, axis in (("X-Axis", 'x'), ("Y-Axis", 'y'), ("Both Axes", 'both')):
+            axis_menu = grid_density_menu.addMenu(axis_name)
+            for density_name in ['Sparse', 'Normal', 'Dense']:
+                action = axis_menu.addAction(density_name)
+                action.setData((axis, density_name.lower()))
+
+        grid_density_menu.triggered.connect(
+            lambda action: self._set_comparison_grid_density(plot_widget, *action.data())
+        )
 
     def _set_comparison_grid_density(self, plot_widget, axis: str, density: str):
         """Set grid density for comparison plots."""
@@ -2377,42 +3046,40 @@ class GraphPage:
         tooltip_label.setVisible(False)
         plot_item.addItem(tooltip_label)
         plot_widget.tooltip_label = tooltip_label
+        plot_widget.tooltip_key = None
+        plot_widget.point_menu = None
+        plot_widget.last_mouse_pos = None
 
-        # Setup crosshairs
-        v_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('#888888', width=1, style=Qt.PenStyle.DashLine))
-        h_line = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen('#888888', width=1, style=Qt.PenStyle.DashLine))
-        v_line.setVisible(False)
-        h_line.setVisible(False)
-        plot_item.addItem(v_line, ignoreBounds=True)
-        plot_item.addItem(h_line, ignoreBounds=True)
-        plot_widget.crosshair_v = v_line
-        plot_widget.crosshair_h = h_line
+        # Crosshairs are created on the first hover (see _crosshairs)
+        plot_widget.crosshair_v = None
+        plot_widget.crosshair_h = None
 
         # Track hover state
         plot_widget.hover_item = None
         plot_widget.hover_idx = None
         plot_widget.original_sizes = {}
+        schedule_hover = self._setup_comparison_hover_search(plot_widget)
 
         def on_mouse_moved(evt):
             pos = evt[0] if isinstance(evt, tuple) else evt
+            if not self._mouse_moved_past_pixel(plot_widget, pos):
+                return
             if not plot_item.sceneBoundingRect().contains(pos):
-                v_line.setVisible(False)
-                h_line.setVisible(False)
-                self._clear_comparison_hover(plot_widget)
+                if plot_widget.crosshair_v is not None:
+                    plot_widget.crosshair_v.setVisible(False)
+                    plot_widget.crosshair_h.setVisible(False)
+                schedule_hover(None)
                 return
 
             mouse_point = plot_item.vb.mapSceneToView(pos)
+            v_line, h_line = self._crosshairs(plot_widget)
             v_line.setPos(mouse_point.x())
             h_line.setPos(mouse_point.y())
             v_line.setVisible(True)
             h_line.setVisible(True)
 
-            # Hover highlight
-            nearest_item, nearest_idx, distance = self._find_comparison_nearest_point(pos, plot_widget)
-            if nearest_item is not None and nearest_idx is not None:
-                self._apply_comparison_hover(nearest_item, nearest_idx, plot_widget)
-            else:
-                self._clear_comparison_hover(plot_widget)
+            # Hover highlight, once the cursor pauses
+            schedule_hover(pos)
 
         def on_mouse_clicked(evt):
             pos = evt.scenePos()
@@ -2438,37 +3105,34 @@ class GraphPage:
     def _show_relational_tooltip(self, item, idx, plot_widget):
         """Show tooltip for relational plot point."""
         tooltip_label = plot_widget.tooltip_label
-        paired_data = getattr(plot_widget, 'paired_data', [])
+        paired_data = plot_widget.paired_data
 
         # Get the actual data index
-        if hasattr(item, 'paired_indices'):
-            data_idx = item.paired_indices[idx] if idx < len(item.paired_indices) else idx
-        else:
-            data_idx = idx
+        data_idx = self._paired_index(item, idx)
 
         if data_idx >= len(paired_data):
             return
 
-        pair = paired_data[data_idx]
+        # The label still shows this point's text; skip setting it again
+        if plot_widget.tooltip_key != (item, data_idx):
+            pair = paired_data[data_idx]
 
-        # Build tooltip
-        lines = []
-        lines.append(f"Device: {pair.get('device_id', 'Unknown')}")
-        lines.append(f"X Value: {pair.get('x_value', 0):.4f}")
-        lines.append(f"Y Value: {pair.get('y_value', 0):.4f}")
+            # Build tooltip
+            lines = []
+            lines.append(f"Device: {pair.get('device_id', 'Unknown')}")
+            lines.append(f"X Value: {pair.get('x_value', 0):.4f}")
+            lines.append(f"Y Value: {pair.get('y_value', 0):.4f}")
 
-        if 'group' in pair:
-            lines.append(f"Group: {pair['group']}")
+            if 'group' in pair:
+                lines.append(f"Group: {pair['group']}")
 
-        # Get measurement info
-        y_m = pair.get('y_measurement')
-        if y_m and hasattr(y_m, 'sub_test') and y_m.sub_test:
-            if hasattr(y_m.sub_test, 'test_log') and y_m.sub_test.test_log:
-                tl = y_m.sub_test.test_log
-                if tl.created_at:
-                    lines.append(f"Date: {tl.created_at.strftime('%Y-%m-%d %H:%M')}")
+            # Measurement date, formatted when the pairs were built
+            date_text = pair.get('date_text')
+            if date_text:
+                lines.append(f"Date: {date_text}")
 
-        tooltip_label.setText('\n'.join(lines))
+            tooltip_label.setText('\n'.join(lines))
+            plot_widget.tooltip_key = (item, data_idx)
 
         x_data, y_data = item.getData()
         tooltip_label.setPos(x_data[idx], y_data[idx])
@@ -2476,37 +3140,25 @@ class GraphPage:
 
     def _show_relational_point_menu(self, evt, item, idx, plot_widget):
         """Show context menu for relational plot point."""
-        paired_data = getattr(plot_widget, 'paired_data', [])
+        paired_data = plot_widget.paired_data
 
-        if hasattr(item, 'paired_indices'):
-            data_idx = item.paired_indices[idx] if idx < len(item.paired_indices) else idx
-        else:
-            data_idx = idx
+        data_idx = self._paired_index(item, idx)
 
         if data_idx >= len(paired_data):
             return
 
         pair = paired_data[data_idx]
 
-        menu = QMenu()
-
-        # View Test Log
-        view_log_action = QAction("View Test Log", menu)
+        menu, view_log_action, copy_action = self._point_menu(plot_widget)
         y_m = pair.get('y_measurement')
-        if y_m:
-            view_log_action.triggered.connect(lambda: self._view_measurement_test_log(y_m))
-        else:
-            view_log_action.setEnabled(False)
-        menu.addAction(view_log_action)
+        view_log_action.setEnabled(bool(y_m))
 
-        menu.addSeparator()
+        action = menu.exec(evt.screenPos().toPoint())
 
-        # Copy Values
-        copy_action = QAction("Copy Values", menu)
-        copy_action.triggered.connect(lambda: self._copy_relational_values(pair))
-        menu.addAction(copy_action)
-
-        menu.exec(evt.screenPos().toPoint())
+        if action == view_log_action:
+            self._view_measurement_test_log(y_m)
+        elif action == copy_action:
+            self._copy_relational_values(pair)
 
     def _copy_relational_values(self, pair):
         """Copy relational point values to clipboard."""
@@ -2528,25 +3180,24 @@ class GraphPage:
         tooltip_label.setVisible(False)
         plot_item.addItem(tooltip_label)
         plot_widget.tooltip_label = tooltip_label
+        plot_widget.last_mouse_pos = None
 
-        # Setup crosshairs
-        v_line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('#888888', width=1, style=Qt.PenStyle.DashLine))
-        h_line = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen('#888888', width=1, style=Qt.PenStyle.DashLine))
-        v_line.setVisible(False)
-        h_line.setVisible(False)
-        plot_item.addItem(v_line, ignoreBounds=True)
-        plot_item.addItem(h_line, ignoreBounds=True)
-        plot_widget.crosshair_v = v_line
-        plot_widget.crosshair_h = h_line
+        # Crosshairs are created on the first hover (see _crosshairs)
+        plot_widget.crosshair_v = None
+        plot_widget.crosshair_h = None
 
         def on_mouse_moved(evt):
             pos = evt[0] if isinstance(evt, tuple) else evt
+            if not self._mouse_moved_past_pixel(plot_widget, pos):
+                return
             if not plot_item.sceneBoundingRect().contains(pos):
-                v_line.setVisible(False)
-                h_line.setVisible(False)
+                if plot_widget.crosshair_v is not None:
+                    plot_widget.crosshair_v.setVisible(False)
+                    plot_widget.crosshair_h.setVisible(False)
                 return
 
             mouse_point = plot_item.vb.mapSceneToView(pos)
+            v_line, h_line = self._crosshairs(plot_widget)
             v_line.setPos(mouse_point.x())
             h_line.setPos(mouse_point.y())
             v_line.setVisible(True)
@@ -2565,10 +3216,69 @@ class GraphPage:
         plot_widget.mouse_proxy = proxy
         plot_widget.scene().sigMouseClicked.connect(on_mouse_clicked)
 
+    @staticmethod
+    def _overlay_x(series: dict, y_data):
+        """X values of an overlay series dict; the point index when it has no 'x'."""
+        x_data = series.get('x')
+        return np.arange(len(y_data), dtype=PLOT_DTYPE) if x_data is None else x_data
+
+    @staticmethod
+    def _overlay_series(x_data, y_data, label, measurement, color) -> dict:
+        """
+        Tooltip record of one overlay series.
+
+        Besides the raw data it holds ``x_np``/``y_np``: the points as float
+        arrays sorted by X, for nearest-X lookups. Non-numeric X falls back to
+        the point index.
+        """
+        n = min(len(x_data), len(y_data))
+        try:
+            x_np = np.asarray(x_data[:n], dtype=np.float64)
+        except (TypeError, ValueError):
+            x_np = np.arange(n, dtype=np.float64)
+        y_np = np.asarray(y_data[:n], dtype=np.float64)
+
+        # Series are usually recorded in X order already; only reorder (and
+        # copy) the ones that are not
+        if n > 1 and not np.all(x_np[1:] >= x_np[:-1]):
+            order = np.argsort(x_np, kind='stable')
+            x_np, y_np = x_np[order], y_np[order]
+
+        return {
+            'x_data': x_data,
+            'y_data': y_data,
+            'x_np': x_np,
+            'y_np': y_np,
+            'label': label,
+            'measurement': measurement,
+            'color': color
+        }
+
+    @staticmethod
+    def _nearest_overlay_index(x_sorted: np.ndarray, x_pos: float):
+        """
+        Index of the sorted X value nearest ``x_pos``, or None if ``x_pos`` is
+        more than half a point spacing beyond either end of the series.
+        """
+        n = len(x_sorted)
+        if n == 0:
+            return None
+
+        i = int(np.searchsorted(x_sorted, x_pos))
+        if 0 < i < n:
+            return i - 1 if x_pos - x_sorted[i - 1] <= x_sorted[i] - x_pos else i
+
+        # Beyond an end: accept within half the end spacing (0.5 for one point)
+        if i == 0:
+            half = (x_sorted[1] - x_sorted[0]) / 2 if n > 1 else 0.5
+            return 0 if x_pos >= x_sorted[0] - half else None
+        half = (x_sorted[-1] - x_sorted[-2]) / 2 if n > 1 else 0.5
+        return n - 1 if x_pos < x_sorted[-1] + half else None
+
     def _show_overlay_tooltip(self, mouse_point, plot_widget):
         """Show tooltip for overlay plot at cursor position."""
         tooltip_label = plot_widget.tooltip_label
-        overlay_data = getattr(plot_widget, 'overlay_data', [])
+        overlay_data = plot_widget.overlay_data
 
         if not overlay_data:
             return
@@ -2579,15 +3289,9 @@ class GraphPage:
         lines = [f"Index: {int(x_pos)}"]
 
         for series in overlay_data:
-            x_data = series.get('x_data', [])
-            y_data = series.get('y_data', [])
-            label = series.get('label', 'Series')
-
-            # Find nearest X index
-            if x_data and y_data:
-                idx = int(round(x_pos))
-                if 0 <= idx < len(y_data):
-                    lines.append(f"{label}: {y_data[idx]:.4f}")
+            idx = self._nearest_overlay_index(series['x_np'], x_pos)
+            if idx is not None:
+                lines.append(f"{series['label']}: {series['y_np'][idx]:.4f}")
 
         if len(lines) > 1:
             tooltip_label.setText('\n'.join(lines))
@@ -2627,54 +3331,16 @@ class GraphPage:
         """
         mw = self.main_window
 
-        paired_data = self._pair_measurements(y_measurements, x_measurements)
-
-        if not paired_data:
-            logger.warning("No paired data for relational plots")
-            self.show_info("No Data", "Could not pair measurements. Make sure both measurements exist for the same devices.")
-            return
-
         # Get grouping option
         group_by_field = None
         if hasattr(mw, 'graphs_group_values_by_combobox'):
             group_by_text = mw.graphs_group_values_by_combobox.currentText()
             if group_by_text and group_by_text != "None":
-                group_mapping = {
-                    "PIA Serial Number": "pia_serial",
-                    "PIA Part Number": "pia_part",
-                    "PMT Serial Number": "pmt_serial",
-                    "PMT Batch Number": "pmt_batch",
-                    "PMT Generation": "pmt_generation",
-                    "Test Fixture": "test_fixture",
-                    "Test Date": "test_date"
-                }
-                group_by_field = group_mapping.get(group_by_text)
-
-        # Add grouping info to paired data
-        if group_by_field:
-            for pair in paired_data:
-                y_m = pair.get('y_measurement')
-                if y_m:
-                    group_value = self._get_group_value(y_m, group_by_field)
-                    pair['group'] = group_value if group_value else 'Unknown'
-                else:
-                    pair['group'] = 'Unknown'
+                group_by_field = GROUP_BY_MAPPING.get(group_by_text)
 
         # Get spec limits from measurements
-        y_lower, y_upper = None, None
-        x_lower, x_upper = None, None
-
-        for m in y_measurements:
-            if m.lower_limit is not None:
-                y_lower = m.lower_limit
-            if m.upper_limit is not None:
-                y_upper = m.upper_limit
-
-        for m in x_measurements:
-            if m.lower_limit is not None:
-                x_lower = m.lower_limit
-            if m.upper_limit is not None:
-                x_upper = m.upper_limit
+        y_lower, y_upper = self._find_spec_limits(y_measurements)
+        x_lower, x_upper = self._find_spec_limits(x_measurements)
 
         # Build config
         y_name = y_measurements[0].name if y_measurements else "Y"
@@ -2693,35 +3359,96 @@ class GraphPage:
             'group_by_field': group_by_field
         }
 
-        # Relational Scatter
         if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Relational Scatter Plot...")
-        QApplication.processEvents()
+            self.progress_dialog.setLabelText("Pairing measurements...")
+
+        # Pairing and grouping run on the thread pool, as for comparison plots
+        generation_key = self._generation_key
+        y_columns, x_columns = self.current_columns, self.current_x_columns
+        self.submit_task(
+            lambda: self._prepare_relational_data(y_measurements, x_measurements, y_columns, x_columns,
+                                                  group_by_field),
+            lambda columns: self._on_relational_prepared(generation_key, y_measurements, config, columns),
+            lambda message: self._on_prepare_failed(generation_key, message)
+        )
 
-        scatter_plot = self._create_relational_plot(paired_data, config, GraphType.SCATTER)
-        if scatter_plot:
-            self.cached_plots[DisplayType.SCATTER] = scatter_plot
+    def _prepare_relational_data(self, y_measurements: list, x_measurements: list,
+                                 y_columns: Optional[dict], x_columns: Optional[dict],
+                                 group_by_field: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Pair and group measurements for the relational plots.
 
-        # Relational Line
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText("Generating Relational Line Plot...")
-        QApplication.processEvents()
+        Runs on a pool thread: no widget access. Returns the
+        _relational_columns view of the pairs, or None when nothing paired.
+        """
+        paired_data = self._pair_measurements(y_measurements, x_measurements, y_columns, x_columns)
+
+        if not paired_data:
+            logger.warning("No paired data for relational plots")
+            return None
+
+        # Add grouping info to paired data
+        if group_by_field:
+            for pair in paired_data:
+                y_m = pair.get('y_measurement')
+                if y_m:
+                    group_value = self._get_group_value(y_m, group_by_field)
+                    pair['group'] = group_value if group_value is not None else 'Unknown'
+                else:
+                    pair['group'] = 'Unknown'
+
+        # Tooltip date of each pair, formatted once
+        for pair in paired_data:
+            tl = self._test_log_of(pair['y_measurement'])
+            created_at = tl.created_at if tl else None
+            pair['date_text'] = created_at.strftime('%Y-%m-%d %H:%M') if created_at else None
+
+        return self._relational_columns(paired_data, group_by_field)
+
+    def _on_relational_prepared(self, generation_key: Optional[tuple], y_measurements: list,
+                                config: dict, columns: Optional[Dict[str, Any]]):
+        """Register the relational plot factories for prepared data (GUI thread)."""
+        generation = self._generations.get(generation_key)
+        if generation is None:
+            logger.info("Discarding relational data for a generation that no longer exists")
+            return
+        is_current = self._generation_key == generation_key
 
-        line_plot = self._create_relational_plot(paired_data, config, GraphType.LINE)
-        if line_plot:
-            self.cached_plots[DisplayType.LINE] = line_plot
+        if columns is None:
+            if is_current:
+                if self.progress_dialog:
+                    self.progress_dialog.close()
+                self.show_info("No Data", "Could not pair measurements. Make sure both measurements exist for the same devices.")
+            return
 
-        logger.info("Generated relational plots: Scatter, Line")
+        try:
+            # Relational Scatter and Line, drawn from the same arrays
+            factories = generation['factories']
+            factories[DisplayType.SCATTER] = \
+                lambda: self._create_relational_plot(columns, config, GraphType.SCATTER)
+            factories[DisplayType.LINE] = \
+                lambda: self._create_relational_plot(columns, config, GraphType.LINE)
+            logger.info("Registered relational plots: Scatter, Line")
+
+            if is_current:
+                self._finish_generation(y_measurements)
+        except Exception as e:
+            logger.exception("Error registering relational plots")
+            if is_current:
+                self._fail_generation(e)
 
     def _generate_overlay_plot(self, measurements: list):
+        """Register the overlaid line plot for plot-type measurements."""
+        self._plot_factories[DisplayType.OVERLAY] = lambda: self._create_overlay_plot(measurements)
+
+    def _create_overlay_plot(self, measurements: list) -> pg.PlotWidget:
         """
-        Generate overlaid line plot for plot-type measurements.
+        Create overlaid line plot for plot-type measurements.
 
         Includes: legend, tooltips, spec lines, interactivity
         """
         if self.progress_dialog:
             self.progress_dialog.setLabelText("Generating Overlay Plot...")
-        QApplication.processEvents()
 
         mw = self.main_window
 
@@ -2729,6 +3456,11 @@ class GraphPage:
         plot_widget = pg.PlotWidget()
         plot_widget.setBackground('#1e1e1e')
         plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        if OVERLAY_USE_OPENGL:
+            try:
+                plot_widget.useOpenGL(True)
+            except Exception as e:
+                logger.warning(f"OpenGL viewport unavailable, using raster drawing: {e}")
 
         # Create legend FIRST
         legend = plot_widget.addLegend()
@@ -2736,8 +3468,8 @@ class GraphPage:
         legend.setOffset((10, 10))
 
         # Color palette
-        colors = ['#2196F3', '#4CAF50', '#FF9800', '#E91E63', '#9C27B0',
-                  '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#F44336']
+        colors = GROUP_COLORS
+        pens = GROUP_LINE_PENS
         color_idx = 0
 
         # Store plot data for tooltips
@@ -2768,72 +3500,57 @@ class GraphPage:
                 # Handle different plot_data formats
                 if isinstance(plot_data, dict):
                     # Format: {'x': [...], 'y': [...], 'label': '...'}
-                    x_data = plot_data.get('x', list(range(len(plot_data.get('y', [])))))
                     y_data = plot_data.get('y', [])
+                    x_data = self._overlay_x(plot_data, y_data)
                     label = plot_data.get('label', measurement.name if hasattr(measurement, 'name') else f"Series {color_idx}")
 
                     if y_data:
                         color = colors[color_idx % len(colors)]
-                        pen = pg.mkPen(color=color, width=2)
-                        line = plot_widget.plot(x_data, y_data, pen=pen, name=label)
+                        pen = pens[color_idx % len(pens)]
+                        self._add_line_curve(plot_widget, x_data, y_data, pen, label)
 
                         # Store for tooltips
-                        plot_widget.overlay_data.append({
-                            'x_data': x_data,
-                            'y_data': y_data,
-                            'label': label,
-                            'measurement': measurement,
-                            'color': color
-                        })
+                        plot_widget.overlay_data.append(
+                            self._overlay_series(x_data, y_data, label, measurement, color))
                         color_idx += 1
 
                 elif isinstance(plot_data, list):
                     # Format: list of y values or list of dicts
                     if plot_data and isinstance(plot_data[0], (int, float)):
                         # Simple list of y values
-                        x_data = list(range(len(plot_data)))
+                        x_data = np.arange(len(plot_data), dtype=PLOT_DTYPE)
                         y_data = plot_data
                         label = measurement.name if hasattr(measurement, 'name') else f"Series {color_idx}"
 
                         color = colors[color_idx % len(colors)]
-                        pen = pg.mkPen(color=color, width=2)
-                        line = plot_widget.plot(x_data, y_data, pen=pen, name=label)
-
-                        plot_widget.overlay_data.append({
-                            'x_data': x_data,
-                            'y_data': y_data,
-                            'label': label,
-                            'measurement': measurement,
-                            'color': color
-                        })
+                        pen = pens[color_idx % len(pens)]
+                        self._add_line_curve(plot_widget, x_data, y_data, pen, label)
+
+                        plot_widget.overlay_data.append(
+                            self._overlay_series(x_data, y_data, label, measurement, color))
                         color_idx += 1
                     else:
                         # List of series dicts
                         for series in plot_data:
                             if isinstance(series, dict):
-                                x_data = series.get('x', list(range(len(series.get('y', [])))))
                                 y_data = series.get('y', [])
+                                x_data = self._overlay_x(series, y_data)
                                 label = series.get('label', f"Series {color_idx}")
 
                                 if y_data:
                                     color = colors[color_idx % len(colors)]
-                                    pen = pg.mkPen(color=color, width=2)
-                                    line = plot_widget.plot(x_data, y_data, pen=pen, name=label)
-
-                                    plot_widget.overlay_data.append({
-                                        'x_data': x_data,
-                                        'y_data': y_data,
-                                        'label': label,
-                                        'measurement': measurement,
-                                        'color': color
-                                    })
+                                    pen = pens[color_idx % len(pens)]
+                                    self._add_line_curve(plot_widget, x_data, y_data, pen, label)
+
+                                    plot_widget.overlay_data.append(
+                                        self._overlay_series(x_data, y_data, label, measurement, color))
                                     color_idx += 1
 
         # Add spec lines (horizontal)
         if lower_limit is not None:
             lower_line = pg.InfiniteLine(
                 pos=lower_limit, angle=0,
-                pen=pg.mkPen('#FFA500', width=2, style=Qt.PenStyle.DashLine),
+                pen=SPEC_LIMIT_PENS['lower'][0],
                 label=f'Lower: {lower_limit:.3f}',
                 labelOpts={'position': 0.05, 'color': '#FFA500'}
             )
@@ -2844,7 +3561,7 @@ class GraphPage:
         if upper_limit is not None:
             upper_line = pg.InfiniteLine(
                 pos=upper_limit, angle=0,
-                pen=pg.mkPen('#FF4444', width=2, style=Qt.PenStyle.DashLine),
+                pen=SPEC_LIMIT_PENS['upper'][0],
                 label=f'Upper: {upper_limit:.3f}',
                 labelOpts={'position': 0.05, 'color': '#FF4444'}
             )
@@ -2863,39 +3580,79 @@ class GraphPage:
 
         plot_widget.graph_page = self
         plot_widget.plot_type = 'overlay'
-        self.cached_plots[DisplayType.OVERLAY] = plot_widget
 
         logger.info(f"Generated overlay plot with {color_idx} series")
+        return plot_widget
 
-    def _pair_measurements(self, y_measurements: list, x_measurements: list) -> List[Dict]:
-        """Pair Y and X measurements by device serial number."""
-        # Build lookup by device ID
-        x_by_device = {}
-        for m in x_measurements:
-            device_id = self._get_device_id(m)
-            if device_id:
-                # Use test_log_id for exact matching within same test
-                test_log_id = None
-                if hasattr(m, 'sub_test') and m.sub_test:
-                    if hasattr(m.sub_test, 'test_log') and m.sub_test.test_log:
-                        test_log_id = m.sub_test.test_log.id
+    def _add_line_curve(self, plot_widget: pg.PlotWidget, x_data, y_data, pen, name: str) -> pg.PlotCurveItem:
+        """
+        Add a line series as a bare PlotCurveItem.
+
+        The data is handed over as contiguous arrays so the painter path is
+        built in one pass, and the item is cached in device coordinates so
+        switching back to a cached plot does not re-stroke every curve.
+        """
+        curve = pg.PlotCurveItem(
+            x=np.ascontiguousarray(x_data, dtype=PLOT_DTYPE),
+            y=np.ascontiguousarray(y_data, dtype=PLOT_DTYPE),
+            pen=pen,
+            name=name,
+            connect='finite'
+        )
+        curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        plot_widget.addItem(curve)
+        return curve
+
+    def _pair_measurements(self, y_measurements: list, x_measurements: list,
+                           y_columns: Optional[Dict[str, np.ndarray]] = None,
+                           x_columns: Optional[Dict[str, np.ndarray]] = None) -> List[Dict]:
+        """Pair Y and X measurements by device serial number (and test log when known)."""
+        if (y_columns is not None and x_columns is not None
+                and len(y_columns['pia_serial']) == len(y_measurements)
+                and len(x_columns['pia_serial']) == len(x_measurements)):
+            def key_frame(columns, row_name):
+                return pd.DataFrame({
+                    'device_id': np.where(columns['pia_serial'].astype(bool), columns['pia_serial'], None),
+                    'test_log_id': columns['test_log_id'],
+                    row_name: np.arange(len(columns['pia_serial'])),
+                })
+
+            joined = self._join_rows(
+                key_frame(y_columns, 'y_row'), key_frame(x_columns, 'x_row'), ['device_id', 'test_log_id']
+            )
+            paired = []
+            for device_id, y_idx, x_idx in zip(joined['device_id'], joined['y_row'], joined['x_row']):
+                y_m = y_measurements[y_idx]
+                x_m = x_measurements[x_idx]
+                paired.append({
+                    'device_id': device_id,
+                    'y_measurement': y_m,
+                    'x_measurement': x_m,
+                    'y_value': y_m.measurement,
+                    'x_value': x_m.measurement
+                })
 
-                key = (device_id, test_log_id) if test_log_id else device_id
-                x_by_device[key] = m
+            logger.info(f"Paired {len(paired)} measurements from {len(y_measurements)} Y and {len(x_measurements)} X")
+            return paired
+
+        get_device_id, test_log_of = self._get_device_id, self._test_log_of
+
+        def pair_key(m):
+            """(device_id, key): key adds the test log id, for exact matching within the same test."""
+            device_id = get_device_id(m)
+            test_log_id = getattr(test_log_of(m), 'id', None)
+            return device_id, ((device_id, test_log_id) if test_log_id else device_id)
+
+        # Build lookup by device ID
+        x_by_device = {key: m for m in x_measurements for device_id, key in (pair_key(m),) if device_id}
+        get_x = x_by_device.get
 
         # Pair with Y measurements
         paired = []
         for y_m in y_measurements:
-            device_id = self._get_device_id(y_m)
+            device_id, key = pair_key(y_m)
             if device_id:
-                test_log_id = None
-                if hasattr(y_m, 'sub_test') and y_m.sub_test:
-                    if hasattr(y_m.sub_test, 'test_log') and y_m.sub_test.test_log:
-                        test_log_id = y_m.sub_test.test_log.id
-
-                key = (device_id, test_log_id) if test_log_id else device_id
-                x_m = x_by_device.get(key)
-
+                x_m = get_x(key)
                 if x_m:
                     paired.append({
                         'device_id': device_id,
@@ -2914,7 +3671,7 @@ class GraphPage:
             from src.gui.graph_generation.graph_generator import MeasurementGraphGenerator
 
             generator = MeasurementGraphGenerator(config)
-            generator.prepare_data()
+            self._prepare_generator_data(generator)
             plot_widget = generator.create_plot_widget()
             generator.plot_data(plot_widget)
             generator.apply_styling(plot_widget)
@@ -2926,23 +3683,95 @@ class GraphPage:
             logger.error(f"Error creating plot: {e}")
             return None
 
-    def _create_relational_plot(self, paired_data: list, config: dict, graph_type: GraphType) -> Optional[pg.PlotWidget]:
+    def _prepare_generator_data(self, generator):
+        """Run ``generator.prepare_data`` unless the same inputs were prepared recently."""
+        key = self.prepared_data_key(generator.config)
+        cached = self._prepared_data_cache.get(key)
+        if cached is not None:
+            # Plotting only reads prepared data, so generators can share it
+            self._prepared_data_cache.move_to_end(key)
+            generator.prepared_data, generator.original_data = cached
+            return
+
+        generator.prepare_data()
+        self._prepared_data_cache[key] = (generator.prepared_data, generator.original_data)
+        while len(self._prepared_data_cache) > PREPARED_DATA_CACHE_SIZE:
+            self._prepared_data_cache.popitem(last=False)
+
+    def _prefetch_prepared_data(self, configs: Iterable[GraphConfig]):
+        """Prepare generator data for ``configs`` on the thread pool, one task per missing key."""
+        from src.gui.graph_generation.graph_generator import MeasurementGraphGenerator
+
+        def prepare(config: GraphConfig):
+            generator = MeasurementGraphGenerator(config)
+            generator.prepare_data()
+            return generator.prepared_data, generator.original_data
+
+        def store(epoch: int, key: tuple, result: tuple):
+            # Drop data prepared before the caches were cleared (records edited)
+            if epoch != self._cache_epoch:
+                return
+            # The displayed plot may have prepared the same data meanwhile
+            if key not in self._prepared_data_cache:
+                self._prepared_data_cache[key] = result
+                while len(self._prepared_data_cache) > PREPARED_DATA_CACHE_SIZE:
+                    self._prepared_data_cache.popitem(last=False)
+
+        submitted = set()
+        for config in configs:
+            key = self.prepared_data_key(config)
+            if key in submitted or key in self._prepared_data_cache:
+                continue
+            submitted.add(key)
+            self.submit_task(
+                functools.partial(prepare, config),
+                functools.partial(store, self._cache_epoch, key),
+                lambda message: logger.warning(f"Could not prepare plot data in the background: {message}")
+            )
+
+    @staticmethod
+    def _relational_columns(paired_data: list, group_by_field: Optional[str]) -> Dict[str, Any]:
+        """
+        Struct-of-arrays view of relational pairs, shared by the scatter and line plots.
+
+        'pairs' holds the pairs with both values; 'x'/'y' are their values and
+        'value_range' the (min, max) over both. When grouping, 'group_names'
+        holds the sorted distinct groups and 'group_id' indexes it per pair.
+        """
+        valid_pairs = [p for p in paired_data if p['x_value'] is not None and p['y_value'] is not None]
+        n = len(valid_pairs)
+        x = np.fromiter((p['x_value'] for p in valid_pairs), dtype=np.float64, count=n)
+        y = np.fromiter((p['y_value'] for p in valid_pairs), dtype=np.float64, count=n)
+
+        columns = {
+            'pairs': valid_pairs,
+            'x': x.astype(PLOT_DTYPE),
+            'y': y.astype(PLOT_DTYPE),
+            'value_range': (float(min(x.min(), y.min())), float(max(x.max(), y.max()))) if n else None,
+        }
+        if group_by_field:
+            group = np.empty(n, dtype=object)
+            group[:] = [p.get('group', 'Unknown') for p in valid_pairs]
+            columns['group_names'], columns['group_id'] = np.unique(group, return_inverse=True)
+        return columns
+
+    def _create_relational_plot(self, columns: Dict[str, Any], config: dict,
+                                graph_type: GraphType) -> Optional[pg.PlotWidget]:
         """
         Create a relational plot (Y vs X measurement) with full features.
 
-        Includes: grouping, legend, tooltips, menu, spec lines
+        Includes: grouping, legend, tooltips, menu, spec lines.
+        ``columns`` is the _relational_columns view of the pairs.
         """
         try:
+            valid_pairs = columns['pairs']
+            if not valid_pairs:
+                return None
+
             plot_widget = pg.PlotWidget()
             plot_widget.setBackground('#1e1e1e')
             plot_widget.showGrid(x=True, y=True, alpha=0.3)
 
-            # Filter valid pairs
-            valid_pairs = [p for p in paired_data if p['x_value'] is not None and p['y_value'] is not None]
-
-            if not valid_pairs:
-                return None
-
             # Create legend FIRST
             legend = plot_widget.addLegend()
             legend.setBrush(pg.mkBrush(30, 30, 30, 235))
@@ -2952,92 +3781,63 @@ class GraphPage:
             plot_widget.paired_data = valid_pairs
             plot_widget.plot_type = 'relational_scatter' if graph_type == GraphType.SCATTER else 'relational_line'
 
-            # Color palette for groups
-            group_colors = [
-                '#2196F3', '#4CAF50', '#FF9800', '#E91E63', '#9C27B0',
-                '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#F44336'
-            ]
-
-            group_by_field = config.get('group_by_field')
+            x_values = columns['x']
+            y_values = columns['y']
 
-            if group_by_field:
-                # Get unique groups
-                groups = list(set(p.get('group', 'Unknown') for p in valid_pairs))
-                groups.sort()
-                group_to_color = {g: group_colors[i % len(group_colors)] for i, g in enumerate(groups)}
+            if 'group_names' in columns:
+                groups = columns['group_names'].tolist()
+                group_rows = self._group_rows(columns['group_id'], len(groups))
 
                 if graph_type == GraphType.SCATTER:
                     # Create scatter per group
-                    for group in groups:
-                        color = group_to_color[group]
-                        group_pairs = [p for p in valid_pairs if p.get('group') == group]
-                        x_vals = [p['x_value'] for p in group_pairs]
-                        y_vals = [p['y_value'] for p in group_pairs]
+                    for k, group in enumerate(groups):
+                        group_indices = group_rows[k]
 
                         scatter = pg.ScatterPlotItem(
-                            x=x_vals, y=y_vals,
-                            pen=pg.mkPen(color, width=1),
-                            brush=pg.mkBrush(color),
+                            x=x_values[group_indices], y=y_values[group_indices],
+                            data=group_indices,
+                            pen=GROUP_PENS[k % len(GROUP_PENS)],
+                            brush=GROUP_BRUSHES[k % len(GROUP_BRUSHES)],
                             size=10,
                             name=group
                         )
                         # Store indices for tooltips
-                        scatter.paired_indices = [i for i, p in enumerate(valid_pairs) if p.get('group') == group]
                         scatter.group = group
                         plot_widget.addItem(scatter)
                 else:
                     # Create lines per group
-                    for group in groups:
-                        color = group_to_color[group]
-                        group_pairs = [p for p in valid_pairs if p.get('group') == group]
-
+                    for k, group in enumerate(groups):
                         # Sort by X for proper line
-                        sorted_pairs = sorted(group_pairs, key=lambda p: p['x_value'])
-                        x_vals = [p['x_value'] for p in sorted_pairs]
-                        y_vals = [p['y_value'] for p in sorted_pairs]
+                        rows = group_rows[k]
+                        rows = rows[np.argsort(x_values[rows], kind='stable')]
 
-                        line = pg.PlotDataItem(
-                            x=x_vals, y=y_vals,
-                            pen=pg.mkPen(color, width=2),
-                            name=group
-                        )
-                        plot_widget.addItem(line)
+                        self._add_line_curve(plot_widget, x_values[rows], y_values[rows],
+                                             GROUP_LINE_PENS[k % len(GROUP_LINE_PENS)], group)
             else:
                 # No grouping - single color
-                x_values = [p['x_value'] for p in valid_pairs]
-                y_values = [p['y_value'] for p in valid_pairs]
-
                 if graph_type == GraphType.SCATTER:
                     scatter = pg.ScatterPlotItem(
                         x=x_values, y=y_values,
-                        pen=pg.mkPen('#2196F3', width=1),
-                        brush=pg.mkBrush('#2196F3'),
+                        pen=DATA_PEN,
+                        brush=DATA_BRUSH,
                         size=10,
                         name='Data'
                     )
-                    scatter.paired_indices = list(range(len(valid_pairs)))
                     plot_widget.addItem(scatter)
                 else:
                     # Sort by X for proper line
-                    sorted_pairs = sorted(zip(x_values, y_values), key=lambda p: p[0])
-                    x_sorted = [p[0] for p in sorted_pairs]
-                    y_sorted = [p[1] for p in sorted_pairs]
+                    order = np.argsort(x_values, kind='stable')
 
-                    line = pg.PlotDataItem(
-                        x=x_sorted, y=y_sorted,
-                        pen=pg.mkPen('#2196F3', width=2),
-                        name='Data'
-                    )
-                    plot_widget.addItem(line)
+                    self._add_line_curve(plot_widget, x_values[order], y_values[order], DATA_LINE_PEN, 'Data')
 
             # Add y=x reference line
-            all_vals = [p['x_value'] for p in valid_pairs] + [p['y_value'] for p in valid_pairs]
-            min_val = min(all_vals) * 0.95
-            max_val = max(all_vals) * 1.05
+            min_val, max_val = columns['value_range']
+            min_val *= 0.95
+            max_val *= 1.05
 
             ref_line = pg.PlotDataItem(
                 x=[min_val, max_val], y=[min_val, max_val],
-                pen=pg.mkPen('#888888', width=2, style=Qt.PenStyle.DashLine),
+                pen=REFERENCE_LINE_PEN,
                 name='y = x'
             )
             plot_widget.addItem(ref_line)
@@ -3050,7 +3850,7 @@ class GraphPage:
 
             if y_lower is not None:
                 line = pg.InfiniteLine(pos=y_lower, angle=0,
-                    pen=pg.mkPen('#FFA500', width=2, style=Qt.PenStyle.DashLine),
+                    pen=SPEC_LIMIT_PENS['lower'][0],
                     label=f'Y Lower: {y_lower:.3f}', labelOpts={'position': 0.05, 'color': '#FFA500'})
                 line.spec_line = True
                 line.spec_line_type = 'lower'
@@ -3058,7 +3858,7 @@ class GraphPage:
 
             if y_upper is not None:
                 line = pg.InfiniteLine(pos=y_upper, angle=0,
-                    pen=pg.mkPen('#FF4444', width=2, style=Qt.PenStyle.DashLine),
+                    pen=SPEC_LIMIT_PENS['upper'][0],
                     label=f'Y Upper: {y_upper:.3f}', labelOpts={'position': 0.05, 'color': '#FF4444'})
                 line.spec_line = True
                 line.spec_line_type = 'upper'
@@ -3066,13 +3866,13 @@ class GraphPage:
 
             if x_lower is not None:
                 line = pg.InfiniteLine(pos=x_lower, angle=90,
-                    pen=pg.mkPen('#FFA500', width=1, style=Qt.PenStyle.DotLine))
+                    pen=SPEC_LIMIT_PENS['lower'][1])
                 line.spec_line = True
                 plot_widget.addItem(line)
 
             if x_upper is not None:
                 line = pg.InfiniteLine(pos=x_upper, angle=90,
-                    pen=pg.mkPen('#FF4444', width=1, style=Qt.PenStyle.DotLine))
+                    pen=SPEC_LIMIT_PENS['upper'][1])
                 line.spec_line = True
                 plot_widget.addItem(line)
 
@@ -3112,16 +3912,7 @@ class GraphPage:
         if hasattr(mw, 'graphs_group_values_by_combobox'):
             group_by_text = mw.graphs_group_values_by_combobox.currentText()
             if group_by_text and group_by_text != "None":
-                group_mapping = {
-                    "PIA Serial Number": "pia_serial",
-                    "PIA Part Number": "pia_part",
-                    "PMT Serial Number": "pmt_serial",
-                    "PMT Batch Number": "pmt_batch",
-                    "PMT Generation": "pmt_generation",
-                    "Test Fixture": "test_fixture",
-                    "Test Date": "test_date"
-                }
-                group_by_field = group_mapping.get(group_by_text)
+                group_by_field = GROUP_BY_MAPPING.get(group_by_text)
                 if hasattr(mw, 'show_box_groupings_pushButton'):
                     enable_grouping_boxes = mw.show_box_groupings_pushButton.isChecked()
 
@@ -3151,8 +3942,119 @@ class GraphPage:
 
         if hasattr(mw, 'display_graph_type_comboBox') and mw.display_graph_type_comboBox.count() > 0:
             first_type = mw.display_graph_type_comboBox.currentText()
-            if first_type in self.cached_plots:
-                self.display_plot(self.cached_plots[first_type])
+            plot = self._get_or_build_plot(first_type)
+            if plot:
+                self.display_plot(plot)
+
+    def _get_or_build_plot(self, display_type: str) -> Optional[pg.PlotWidget]:
+        """Return the cached plot for a display type, building it from its factory if needed."""
+        if self._generation_key is None:
+            return None
+
+        plot = self.cached_plots.get(self._generation_key + (display_type,))
+        if plot is not None:
+            self.cached_plots.move_to_end(self._generation_key + (display_type,))
+            return plot
+
+        factory = self._plot_factories.get(display_type)
+        if factory is None:
+            return None
+
+        # An earlier generation may have drawn this exact plot already
+        label = self._generations[self._generation_key]['label'] + (display_type,)
+        old_key = self._plot_labels.get(label)
+        if old_key is not None and old_key in self.cached_plots:
+            logger.info(f"Reusing unchanged {display_type} plot")
+            plot = self._forget_plot(old_key)
+        else:
+            logger.info(f"Building {display_type} plot")
+            plot = factory()
+
+        if plot:
+            self._store_plot(display_type, plot)
+        return plot
+
+    def _store_plot(self, display_type: str, plot_widget: pg.PlotWidget):
+        """Cache a plot of the current generation, evicting the least recently shown ones."""
+        key = self._generation_key + (display_type,)
+        self.cached_plots[key] = plot_widget
+        self.cached_plots.move_to_end(key)
+        self._plot_labels[self._generations[self._generation_key]['label'] + (display_type,)] = key
+
+        # Evicted plots are rebuilt from their generation's factory if shown again
+        for old_key in list(self.cached_plots):
+            if len(self.cached_plots) <= PLOT_CACHE_SIZE:
+                break
+            if old_key != key and self.cached_plots[old_key] is not self.current_plot:
+                self._forget_plot(old_key).deleteLater()
+
+    def _forget_plot(self, key: tuple) -> pg.PlotWidget:
+        """Remove a plot and its label from the cache, returning the widget."""
+        plot = self.cached_plots.pop(key)
+        for label in [label for label, plot_key in self._plot_labels.items() if plot_key == key]:
+            del self._plot_labels[label]
+        return plot
+
+    def _begin_generation(self, key: Optional[tuple], y_measurements: list, x_measurements: Optional[list]):
+        """Register a new generation under ``key`` and make it current."""
+        key = key or (self.current_mode,)
+
+        # Regenerating identical settings replaces the old plots
+        self._drop_generation(key)
+
+        self._generations[key] = {
+            'measurements': y_measurements,
+            'x_measurements': x_measurements,
+            'columns': self.current_columns,
+            'x_columns': self.current_x_columns,
+            'factories': {},
+            'label': self.compute_plot_label(y_measurements, x_measurements),
+        }
+        self._activate_generation(key)
+
+        while len(self._generations) > PLOT_CACHE_SIZE:
+            self._drop_generation(next(iter(self._generations)))
+
+    def _activate_generation(self, key: tuple):
+        """Make a cached generation current: its measurements and plot factories."""
+        generation = self._generations[key]
+        self._generations.move_to_end(key)
+        self._generation_key = key
+        self._plot_factories = generation['factories']
+        self.current_measurements = generation['measurements']
+        self.current_x_measurements = generation['x_measurements']
+        self.current_columns = generation['columns']
+        self.current_x_columns = generation['x_columns']
+
+    def _drop_generation(self, key: tuple):
+        """Forget a generation and delete its cached plots."""
+        self._generations.pop(key, None)
+        for plot_key in [k for k in self.cached_plots if k[:-1] == key]:
+            plot = self._forget_plot(plot_key)
+            if plot is not self.current_plot:
+                plot.deleteLater()
+        if self._generation_key == key:
+            self._generation_key = None
+            self._plot_factories = {}
+
+    def restore_generation(self, key: tuple) -> bool:
+        """
+        Show the plots of an earlier generation with the same key.
+
+        Returns False (nothing changed) if there is no such generation or it
+        produced no plots.
+        """
+        generation = self._generations.get(key)
+        if generation is None or not generation['factories']:
+            return False
+
+        logger.info("Reusing cached plots for unchanged graph settings")
+        self._activate_generation(key)
+        self._display_default_plot()
+        if self.current_measurements:
+            self.populate_spec_line_selectors(self.current_measurements)
+        self.update_page_subtitle()
+        return True
 
     def display_plot(self, plot_widget: pg.PlotWidget):
         """Display a plot widget in the placeholder."""
@@ -3177,11 +4079,17 @@ class GraphPage:
         logger.info("Plot displayed")
 
     def clear_cached_plots(self):
-        """Clear all cached plots."""
+        """Clear all cached plots and the generations they were built from."""
         for key, plot in self.cached_plots.items():
             if plot and plot != self.current_plot:
                 plot.deleteLater()
-        self.cached_plots = {}
+        self.cached_plots = OrderedDict()
+        self._plot_labels = {}
+        self._generations = OrderedDict()
+        self._generation_key = None
+        self._plot_factories = {}
+        self._prepared_data_cache = OrderedDict()
+        self._cache_epoch += 1
 
     # ==================== Post-Generation Controls ====================
 
@@ -3277,7 +4185,7 @@ class GraphPage:
 
         self.current_plot.crosshairs_enabled = checked
 
-        if hasattr(self.current_plot, 'crosshair_v'):
+        if getattr(self.current_plot, 'crosshair_v', None) is not None:
             if not checked:
                 self.current_plot.crosshair_v.setVisible(False)
                 self.current_plot.crosshair_h.setVisible(False)
@@ -3402,6 +4310,8 @@ class GraphPage:
     def cleanup(self):
         """Clean up resources."""
         self.cleanup_query_thread()
+        self._thread_pool.clear()
+        self._thread_pool.waitForDone()
         self.clear_cached_plots()
         if self.current_plot:
             self.current_plot.deleteLater()
@@ -27,6 +27,7 @@ sys.path.insert(0, str(project_root))
 # Check for required dependencies
 SQLALCHEMY_AVAILABLE = False
 OPENPYXL_AVAILABLE = False
+PYQT_AVAILABLE = False
 
 try:
     import sqlalchemy
@@ -42,6 +43,14 @@ except ImportError:
     print("WARNING: openpyxl not installed. Excel export tests will be skipped.")
     print("         Install with: pip install openpyxl")
 
+try:
+    import PyQt6
+    import pyqtgraph
+    PYQT_AVAILABLE = True
+except ImportError:
+    print("WARNING: PyQt6/pyqtgraph not installed. Graph page tests will be skipped.")
+    print("         Install with: pip install PyQt6 pyqtgraph")
+
 # Only import database modules if SQLAlchemy is available
 if SQLALCHEMY_AVAILABLE:
     from src.database import DatabaseManager
@@ -801,6 +810,90 @@ class TestExcelExportLogic(unittest.TestCase):
         print("✓ Excel with zebra striping passed")
 
 
+@unittest.skipUnless(SQLALCHEMY_AVAILABLE and PYQT_AVAILABLE, "SQLAlchemy or PyQt6 not installed")
+class TestGraphPagePairing(unittest.TestCase):
+    """Test Graph Page device pairing on query columns and ORM rows, without GUI."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application the graph page module needs."""
+        from PyQt6.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+    
+    def setUp(self):
+        from src.gui.pages.graph_page import GraphPage
+        self.page = GraphPage.__new__(GraphPage)
+        self.page._accessor_cache = {}
+        self.base_date = datetime(2024, 1, 1)
+    
+    def _measurement(self, value, day, pia_serial=None, pmt_serial=None):
+        """Detached Spec-like row whose test log has the given PIA and/or PMT device."""
+        from types import SimpleNamespace
+        test_log = SimpleNamespace(
+            id=day,
+            pia_board=SimpleNamespace(serial_number=pia_serial) if pia_serial else None,
+            pmt_device=SimpleNamespace(pmt_serial_number=pmt_serial) if pmt_serial else None,
+        )
+        return SimpleNamespace(
+            id=day, name="Gain", measurement=value,
+            created_at=self.base_date + timedelta(days=day),
+            sub_test=SimpleNamespace(test_log=test_log),
+        )
+    
+    @staticmethod
+    def _columns(measurements):
+        """Query columns as DatabaseQueryWorker emits them."""
+        from src.database.database_worker import DatabaseQueryWorker, empty_measurement_columns
+        columns = empty_measurement_columns(len(measurements))
+        for row, m in enumerate(measurements):
+            DatabaseQueryWorker._fill_columns(columns, row, m, m.sub_test.test_log)
+        return columns
+    
+    def _mixed_devices(self):
+        return [
+            self._measurement(1.0, 1, pia_serial="PIA-1", pmt_serial="PMT-9"),
+            self._measurement(5.0, 2, pmt_serial="PMT-1"),
+            self._measurement(2.0, 3, pia_serial="PIA-1", pmt_serial="PMT-9"),
+            self._measurement(6.0, 4, pmt_serial="PMT-1"),
+            self._measurement(7.0, 5, pia_serial="PIA-2"),
+        ]
+    
+    def test_01_first_last_pairs_pmt_only_devices(self):
+        """Test first/last pairing keys devices by PIA serial, else PMT serial."""
+        measurements = self._mixed_devices()
+        expected = [("PIA-1", 2.0, 1.0), ("PMT-1", 6.0, 5.0)]
+        
+        for columns in (self._columns(measurements), None):
+            paired = self.page._pair_first_last_tests(measurements, columns)
+            self.assertEqual([(p.device_id, p.our_value, p.mfr_value) for p in paired], expected)
+        print("✓ First/last pairing of PMT-only devices passed")
+    
+    def test_02_test_selection_by_pia_serial(self):
+        """Test first/last test selection keys devices by PIA serial only."""
+        measurements = self._mixed_devices()
+        columns = self._columns(measurements)
+        
+        for cols in (columns, None):
+            selected, _ = self.page.apply_test_selection(measurements, {'test_selection': 'last'}, cols)
+            self.assertEqual([m.measurement for m in selected], [2.0, 7.0])
+        print("✓ Test selection by PIA serial passed")
+    
+    def test_03_manufacturer_pairing_by_pmt_serial(self):
+        """Test manufacturer data pairs with PMT-only devices."""
+        measurements = self._mixed_devices()
+        manufacturer_data = [
+            {'device_serial': "PMT-1", 'measurement': 4.5, 'manufacturer_name': "Acme"},
+            {'device_serial': "PIA-2", 'measurement': 7.5, 'manufacturer_name': "Acme"},
+            {'device_serial': "PMT-9", 'measurement': 9.9, 'manufacturer_name': "Acme"},
+        ]
+        expected = [("PMT-1", 5.0, 4.5), ("PMT-1", 6.0, 4.5), ("PIA-2", 7.0, 7.5)]
+        
+        for columns in (self._columns(measurements), None):
+            paired = self.page._pair_with_manufacturer_data(measurements, manufacturer_data, columns)
+            self.assertEqual([(p.device_id, p.our_value, p.mfr_value) for p in paired], expected)
+        print("✓ Manufacturer pairing by PMT serial passed")
+
+
 def run_all_tests():
     """Run all tests and print summary."""
     print("\n" + "=" * 60)
@@ -818,6 +911,7 @@ def run_all_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestReportsPageLogic))
     suite.addTests(loader.loadTestsFromTestCase(TestSearchPageLogic))
     suite.addTests(loader.loadTestsFromTestCase(TestExcelExportLogic))
+    suite.addTests(loader.loadTestsFromTestCase(TestGraphPagePairing))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)